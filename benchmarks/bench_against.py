@@ -0,0 +1,51 @@
+"""
+Compares validating a payload against 12 versions of a schema one by one
+with validating it against all of them in a single walk.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_against.py
+"""
+import timeit
+
+from d42 import schema, validate
+from d42.validation import validate_against
+
+NUMBER = 5
+
+LineSchema = schema.dict({"sku": schema.str, "qty": schema.int.min(1)})
+CustomerSchema = schema.dict({"name": schema.str, "email": schema.str})
+
+# Every version adds a field to orders, the rest is shared
+VERSIONS = [
+    schema.dict({
+        "name": schema.str,
+        "orders": schema.list(schema.dict({
+            "id": schema.int.min(0),
+            "customer": CustomerSchema,
+            "lines": schema.list(LineSchema),
+            **{f"field{i}": schema.int for i in range(version)},
+        })),
+    })
+    for version in range(12)
+]
+
+PAYLOAD = {
+    "name": "store",
+    "orders": [{"id": i, "customer": {"name": f"c{i}", "email": f"c{i}@example.com"},
+                "lines": [{"sku": f"sku{j}", "qty": j + 1} for j in range(5)],
+                **{f"field{k}": k for k in range(6)}}
+               for i in range(1_000)],
+}
+
+
+def bench(name: str, fn) -> float:
+    elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{name:<24} {elapsed * 1000:10.3f} ms")
+    return elapsed
+
+
+if __name__ == "__main__":
+    assert [r.get_errors() for r in validate_against(VERSIONS, PAYLOAD)] == \
+        [validate(version, PAYLOAD).get_errors() for version in VERSIONS]
+    separate = bench("validate x12", lambda: [validate(v, PAYLOAD) for v in VERSIONS])
+    joint = bench("validate_against", lambda: validate_against(VERSIONS, PAYLOAD))
+    print(f"{'speedup':<24} {separate / joint:10.1f}x")
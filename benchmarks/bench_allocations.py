@@ -0,0 +1,56 @@
+"""
+Counts what validation allocates on valid and invalid payloads.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_allocations.py
+"""
+import timeit
+import tracemalloc
+
+from d42 import schema
+from d42.validation import ValidationResult, Validator
+
+NUMBER = 5
+
+ItemSchema = schema.dict({
+    "id": schema.int.min(0),
+    "name": schema.str.len(1, 64),
+    "tags": schema.list(schema.str),
+    "meta": schema.dict({"score": schema.float, "flags": schema.list(schema.bool)}),
+})
+ItemsSchema = schema.list(ItemSchema)
+
+VALID = [{"id": i, "name": f"item{i}", "tags": ["a", "b"],
+          "meta": {"score": 1.5, "flags": [True, False]}} for i in range(10_000)]
+INVALID = [{"id": -1, "name": "", "tags": [1, 2],
+            "meta": {"score": "x", "flags": [None]}} for _ in range(10_000)]
+
+
+def bench(name: str, value) -> None:
+    created = 0
+
+    def make_result() -> ValidationResult:
+        nonlocal created
+        created += 1
+        return ValidationResult()
+
+    validator = Validator(validation_result_factory=make_result)
+    ItemsSchema.__accept__(validator, value=value)  # warm up caches
+
+    created = 0
+    tracemalloc.start()
+    result = ItemsSchema.__accept__(validator, value=value)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    errors = len(result.get_errors())
+    results_created = created
+    del result
+
+    elapsed = timeit.timeit(lambda: ItemsSchema.__accept__(validator, value=value),
+                            number=NUMBER) / NUMBER
+    print(f"{name:<8} results created: {results_created:>7}   errors: {errors:>6}   "
+          f"peak traced: {peak / 1024:8.1f} KiB   time: {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    bench("valid", VALID)
+    bench("invalid", INVALID)
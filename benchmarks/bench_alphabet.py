@@ -0,0 +1,39 @@
+"""
+Compares the per-letter alphabet check with the compiled one on 1 MB strings.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_alphabet.py
+"""
+import base64
+import os
+import timeit
+
+from d42 import schema
+from d42.validation import validate
+
+SIZE = 1024 * 1024
+NUMBER = 10
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
+Base64Schema = schema.str.alphabet(ALPHABET)
+
+
+def loop_check(alphabet: str, value: str) -> bool:
+    # What the validator used to do
+    letters = set(alphabet)
+    for letter in value:
+        if letter not in letters:
+            return False
+    return True
+
+
+def bench(name: str, value: str) -> None:
+    before = timeit.timeit(lambda: loop_check(ALPHABET, value), number=NUMBER) / NUMBER
+    after = timeit.timeit(lambda: validate(Base64Schema, value), number=NUMBER) / NUMBER
+    print(f"{name:<24} loop: {before * 1000:8.2f} ms   validate: {after * 1000:8.2f} ms   "
+          f"x{before / after:.1f}")
+
+
+if __name__ == "__main__":
+    blob = base64.b64encode(os.urandom(SIZE * 3 // 4)).decode()
+    bench("valid (1 MB)", blob)
+    bench("invalid at the end", blob[:-1] + "!")
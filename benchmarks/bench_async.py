@@ -0,0 +1,55 @@
+"""
+Measures how long the event loop is blocked while a big payload is validated.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_async.py
+"""
+import asyncio
+import time
+
+from d42 import avalidate, schema, validate
+
+ItemSchema = schema.dict({
+    "id": schema.int.min(0),
+    "name": schema.str.len(1, 64),
+    "tags": schema.list(schema.str),
+})
+ItemsSchema = schema.list(ItemSchema)
+
+ITEMS = [{"id": index, "name": f"item{index}", "tags": ["a", "b", "c"]} for index in range(50_000)]
+
+
+async def measure(validation) -> None:
+    stalls = []
+    done = False
+
+    async def heartbeat() -> None:
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            stalls.append(now - last)
+            last = now
+
+    task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await validation()
+    elapsed = time.perf_counter() - started
+    done = True
+    await task
+    print(f"  total: {elapsed * 1000:8.2f} ms   max loop stall: {max(stalls) * 1000:8.2f} ms")
+
+
+async def main() -> None:
+    async def sync() -> None:
+        validate(ItemsSchema, ITEMS)
+
+    print("validate (inline)")
+    await measure(sync)
+    for yield_every in (100, 1000, 10_000):
+        print(f"avalidate, yield_every={yield_every}")
+        await measure(lambda: avalidate(ItemsSchema, ITEMS, yield_every=yield_every))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,41 @@
+"""
+Measures validation of repeated values with a ValidationCache, and of a
+DAG-shaped value with a ValidationMemo.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_cache.py
+"""
+import timeit
+
+from d42 import schema, validate
+from d42.validation import ValidationCache, ValidationMemo
+
+NUMBER = 20
+
+ItemSchema = schema.dict({
+    "id": schema.int.min(0),
+    "name": schema.str.len(1, 64),
+    "tags": schema.list(schema.str),
+})
+ConfigSchema = schema.dict({"items": schema.list(ItemSchema)})
+
+CONFIG = {"items": [{"id": i, "name": f"item{i}", "tags": ["a", "b"]} for i in range(1000)]}
+
+# 1000 references to 10 shared items
+SHARED = [{"id": i, "name": f"item{i}", "tags": ["a", "b"]} for i in range(10)]
+DAG = {"items": [SHARED[i % 10] for i in range(1000)]}
+
+
+def bench(name: str, fn) -> None:
+    elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{name:<36} {elapsed * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    cache = ValidationCache()
+    bench("validate, same config", lambda: validate(ConfigSchema, CONFIG))
+    bench("ValidationCache, same config", lambda: cache.validate(ConfigSchema, CONFIG))
+    print(cache.stats())
+
+    bench("validate, DAG", lambda: validate(ConfigSchema, DAG))
+    bench("validate + ValidationMemo, DAG",
+          lambda: validate(ConfigSchema, DAG, validation_memo=ValidationMemo()))
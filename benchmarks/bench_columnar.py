@@ -0,0 +1,36 @@
+"""
+Compares validating a big list of records row by row with validating it
+column by column.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_columnar.py
+"""
+import timeit
+
+from d42 import schema, validate
+from d42.validation import validate_columnar
+
+NUMBER = 3
+
+TableSchema = schema.list(schema.dict({
+    "id": schema.int.min(0),
+    "price": schema.float.min(0.0),
+    "sku": schema.str.len(1, 16),
+    "active": schema.bool,
+}))
+
+ROWS = [{"id": i, "price": i / 10, "sku": f"sku{i}", "active": True} for i in range(200_000)]
+ROWS[1234]["price"] = -1.0
+
+
+def bench(name: str, fn) -> float:
+    elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{name:<24} {elapsed * 1000:10.3f} ms")
+    return elapsed
+
+
+if __name__ == "__main__":
+    assert validate_columnar(TableSchema, ROWS).get_errors() == \
+        validate(TableSchema, ROWS).get_errors()
+    rows = bench("validate", lambda: validate(TableSchema, ROWS))
+    columns = bench("validate_columnar", lambda: validate_columnar(TableSchema, ROWS))
+    print(f"{'speedup':<24} {rows / columns:10.1f}x")
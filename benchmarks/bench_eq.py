@@ -0,0 +1,62 @@
+"""
+Compares `schema == value` against a full validation that is thrown away.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_eq.py
+"""
+import timeit
+
+from d42 import schema
+from d42.validation import validate
+
+ROWS = 5_000
+NUMBER = 10
+
+UserSchema = schema.dict({
+    "id": schema.int.min(1),
+    "name": schema.str.len(1, 64),
+    "email": schema.str.contains("@"),
+    "score": schema.float.min(0.0),
+    "tags": schema.list(schema.str).len(0, 8),
+    "address": schema.dict({
+        "city": schema.str,
+        "zip": schema.str.len(5),
+        ...: ...,
+    }),
+})
+UsersSchema = schema.list(UserSchema)
+
+
+def make_users(count: int):
+    return [{
+        "id": index + 1,
+        "name": f"user{index}",
+        "email": f"user{index}@example.com",
+        "score": float(index),
+        "tags": ["a", "b", "c"],
+        "address": {"city": "Amsterdam", "zip": "10001", "street": "Main"},
+    } for index in range(count)]
+
+
+def validate_eq(sch, value) -> bool:
+    # What `eq` used to do
+    return not validate(sch, value).has_errors()
+
+
+def bench(name: str, value) -> None:
+    before = timeit.timeit(lambda: validate_eq(UsersSchema, value), number=NUMBER) / NUMBER
+    after = timeit.timeit(lambda: UsersSchema == value, number=NUMBER) / NUMBER
+    print(f"{name:<24} validate: {before * 1000:8.2f} ms   eq: {after * 1000:8.2f} ms   "
+          f"x{before / after:.1f}")
+
+
+if __name__ == "__main__":
+    users = make_users(ROWS)
+    bench(f"valid ({ROWS} rows)", users)
+
+    invalid = make_users(ROWS)
+    invalid[ROWS // 2]["id"] = 0
+    bench("invalid in the middle", invalid)
+
+    invalid = make_users(ROWS)
+    invalid[0]["id"] = 0
+    bench("invalid at the start", invalid)
@@ -0,0 +1,44 @@
+"""
+Compares a full validation of a big document with an incremental one after
+a small patch.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_incremental.py
+"""
+import timeit
+
+from d42 import schema, validate
+from d42.validation import validate_patch
+
+NUMBER = 5
+
+OrderSchema = schema.dict({
+    "id": schema.int.min(0),
+    "customer": schema.dict({"name": schema.str, "email": schema.str}),
+    "lines": schema.list(schema.dict({"sku": schema.str, "qty": schema.int.min(1)})),
+})
+StoreSchema = schema.dict({"name": schema.str, "orders": schema.list(OrderSchema)})
+
+DOCUMENT = {
+    "name": "store",
+    "orders": [{"id": i, "customer": {"name": f"c{i}", "email": f"c{i}@example.com"},
+                "lines": [{"sku": f"sku{j}", "qty": j + 1} for j in range(5)]}
+               for i in range(10_000)],
+}
+PATCH = [{"op": "replace", "path": "/orders/5000/lines/2/qty", "value": 0}]
+
+
+def bench(name: str, fn) -> float:
+    elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{name:<24} {elapsed * 1000:10.3f} ms")
+    return elapsed
+
+
+if __name__ == "__main__":
+    previous = validate(StoreSchema, DOCUMENT)
+    DOCUMENT["orders"][5000]["lines"][2]["qty"] = 0
+    full = bench("validate", lambda: validate(StoreSchema, DOCUMENT))
+    incremental = bench("validate_patch", lambda: validate_patch(StoreSchema, DOCUMENT, PATCH,
+                                                                 previous))
+    assert validate_patch(StoreSchema, DOCUMENT, PATCH, previous).get_errors() == \
+        validate(StoreSchema, DOCUMENT).get_errors()
+    print(f"{'speedup':<24} {full / incremental:10.1f}x")
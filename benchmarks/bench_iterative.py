@@ -0,0 +1,47 @@
+"""
+Compares the recursive validator with the iterative one on a deep document
+(a comment thread) and a wide one.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_iterative.py
+"""
+import sys
+import timeit
+
+from d42 import schema, validate
+from d42.validation import validate_iterative
+
+NUMBER = 5
+
+# As deep as the recursive validator can go, a level is a dict and a list
+# of about 3 frames each
+DEPTH = sys.getrecursionlimit() // 8
+
+DeepSchema = schema.dict({"text": schema.str, "replies": schema.list(schema.dict)})
+DEEP = {"text": "leaf", "replies": []}
+for _ in range(DEPTH):
+    DeepSchema = schema.dict({"text": schema.str, "replies": schema.list(DeepSchema)})
+    DEEP = {"text": "comment", "replies": [DEEP]}
+
+WideSchema = schema.list(schema.dict({
+    "id": schema.int.min(0),
+    "name": schema.str,
+    "tags": schema.list(schema.str),
+    "owner": schema.dict({"id": schema.int, "email": schema.str}) | schema.none,
+}))
+WIDE = [{"id": i, "name": f"n{i}", "tags": ["a", "b"], "owner": {"id": i, "email": "e"}}
+        for i in range(20_000)]
+
+
+def bench(name: str, fn) -> float:
+    elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{name:<28} {elapsed * 1000:10.3f} ms")
+    return elapsed
+
+
+if __name__ == "__main__":
+    for label, sch, value in [("deep", DeepSchema, DEEP), ("wide", WideSchema, WIDE)]:
+        assert validate_iterative(sch, value).get_errors() == validate(sch, value).get_errors()
+        recursive = bench(f"validate ({label})", lambda: validate(sch, value))
+        iterative = bench(f"validate_iterative ({label})",
+                          lambda: validate_iterative(sch, value))
+        print(f"{'speedup':<28} {recursive / iterative:10.2f}x")
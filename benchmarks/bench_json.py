@@ -0,0 +1,49 @@
+"""
+Compares json.loads + validate with validate_json and load_json_or_fail
+(lazy or not).
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_json.py
+"""
+import json
+import timeit
+
+from d42 import schema
+from d42.validation import load_json_or_fail, validate, validate_json
+
+NUMBER = 20
+
+EventSchema = schema.dict({
+    "id": schema.int.min(1),
+    "type": schema.str,
+    "tags": schema.list(schema.str),
+    ...: ...,
+})
+EventsSchema = schema.list(EventSchema)
+
+
+def make_events(count: int, extra: int):
+    return json.dumps([{
+        "id": index + 1,
+        "type": "created",
+        "tags": ["a", "b"],
+        "payload": {"items": [{"sku": f"sku{i}", "qty": i, "price": i * 1.5} for i in range(extra)]},
+    } for index in range(count)])
+
+
+def bench(name: str, text: str) -> None:
+    loads = timeit.timeit(lambda: validate(EventsSchema, json.loads(text)), number=NUMBER) / NUMBER
+    checked = timeit.timeit(lambda: validate_json(EventsSchema, text), number=NUMBER) / NUMBER
+    lazy = timeit.timeit(lambda: validate_json(EventsSchema, text, lazy=True),
+                         number=NUMBER) / NUMBER
+    loaded = timeit.timeit(lambda: load_json_or_fail(EventsSchema, text), number=NUMBER) / NUMBER
+    lazy_loaded = timeit.timeit(lambda: load_json_or_fail(EventsSchema, text, lazy=True),
+                                number=NUMBER) / NUMBER
+    print(f"{name:<28} loads+validate: {loads * 1000:8.2f} ms   "
+          f"validate_json: {checked * 1000:8.2f} ms   lazy: {lazy * 1000:8.2f} ms   "
+          f"load_json_or_fail: {loaded * 1000:8.2f} ms   lazy: {lazy_loaded * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    bench("1000 events, no extra", make_events(1000, 0))
+    bench("1000 events, 20 extra items", make_events(1000, 20))
+    bench("100 events, 500 extra items", make_events(100, 500))
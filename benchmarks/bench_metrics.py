@@ -0,0 +1,41 @@
+"""
+Measures what reporting validations to a metrics sink costs per call.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_metrics.py
+"""
+import timeit
+
+from d42 import schema, validate
+from d42.validation import InMemoryMetrics, Validator
+
+NUMBER = 20_000
+
+UserSchema = schema.dict({
+    "id": schema.int.min(0),
+    "name": schema.str.len(1, 64),
+    "email": schema.str,
+})
+
+VALID = {"id": 1, "name": "Bob", "email": "bob@example.com"}
+INVALID = {"id": -1, "name": "", "email": None}
+
+
+def bench(name: str, fn) -> float:
+    elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=5)) / NUMBER
+    print(f"{name:<32} {elapsed * 1e6:8.2f} us/call")
+    return elapsed
+
+
+if __name__ == "__main__":
+    for label, value in (("valid", VALID), ("invalid", INVALID)):
+        metrics = InMemoryMetrics()
+        off = bench(f"validate, {label}", lambda: validate(UserSchema, value))
+        on = bench(f"validate(metrics=...), {label}",
+                   lambda: validate(UserSchema, value, metrics=metrics))
+        print(f"{'overhead':<32} {(on - off) * 1e6:8.2f} us/call")
+
+        plain, metered = Validator(), Validator(metrics=InMemoryMetrics())
+        off = bench(f"Validator(), {label}", lambda: UserSchema.__accept__(plain, value=value))
+        on = bench(f"Validator(metrics=...), {label}",
+                   lambda: UserSchema.__accept__(metered, value=value))
+        print(f"{'overhead':<32} {(on - off) * 1e6:8.2f} us/call")
@@ -0,0 +1,59 @@
+"""
+Compares a category tree declared with `schema.ref` with the same tree
+hand-unrolled 10 levels deep: declaring, validating and compiling it.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_ref.py
+"""
+import timeit
+
+from d42 import schema, validate
+from d42.validation import compile
+
+NUMBER = 20
+LEVELS = 10
+
+
+def declare_recursive():
+    return schema.alias("Category", schema.dict({
+        "id": schema.int.min(0),
+        "name": schema.str,
+        "children": schema.list(schema.ref("Category")),
+    }))
+
+
+def declare_unrolled():
+    sch = schema.dict({"id": schema.int.min(0), "name": schema.str, "children": schema.list([])})
+    for _ in range(LEVELS):
+        sch = schema.dict({"id": schema.int.min(0), "name": schema.str,
+                           "children": schema.list(sch)})
+    return sch
+
+
+def make_tree(depth: int, width: int = 3):
+    if depth == 0:
+        return {"id": 0, "name": "leaf", "children": []}
+    return {"id": depth, "name": "node", "children": [make_tree(depth - 1, width)] * width}
+
+
+TREE = make_tree(7)
+
+
+def bench(name: str, fn) -> float:
+    elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{name:<28} {elapsed * 1000:10.3f} ms")
+    return elapsed
+
+
+if __name__ == "__main__":
+    recursive, unrolled = declare_recursive(), declare_unrolled()
+    assert validate(recursive, TREE).get_errors() == validate(unrolled, TREE).get_errors() == []
+
+    bench("declare (ref)", declare_recursive)
+    bench("declare (unrolled)", declare_unrolled)
+    bench("validate (ref)", lambda: validate(recursive, TREE))
+    bench("validate (unrolled)", lambda: validate(unrolled, TREE))
+    bench("compile (ref)", lambda: compile(recursive))
+    bench("compile (unrolled)", lambda: compile(unrolled))
+    compiled_recursive, compiled_unrolled = compile(recursive), compile(unrolled)
+    bench("compiled (ref)", lambda: compiled_recursive(TREE))
+    bench("compiled (unrolled)", lambda: compiled_unrolled(TREE))
@@ -0,0 +1,39 @@
+"""
+Measures regex validation and generation with many distinct patterns in use,
+and prints hit/miss statistics of the schema pattern caches.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_regex.py
+"""
+import re
+import timeit
+
+from d42 import fake, schema
+from d42.generation import parse_pattern
+from d42.utils import compile_pattern
+from d42.validation import validate
+
+PATTERNS = 600  # more than `re` keeps in its own cache
+NUMBER = 5
+
+Schemas = [schema.str.regex(rf"^id{index}-[a-z]{{3}}\d{{2}}$") for index in range(PATTERNS)]
+Values = [f"id{index}-abc12" for index in range(PATTERNS)]
+
+
+def run_validate() -> None:
+    for sch, value in zip(Schemas, Values):
+        validate(sch, value)
+
+
+def run_fake() -> None:
+    for sch in Schemas:
+        fake(sch)
+
+
+if __name__ == "__main__":
+    re.purge()
+    validated = timeit.timeit(run_validate, number=NUMBER) / NUMBER
+    faked = timeit.timeit(run_fake, number=NUMBER) / NUMBER
+    print(f"validate {PATTERNS} patterns: {validated * 1000:8.2f} ms")
+    print(f"fake {PATTERNS} patterns:     {faked * 1000:8.2f} ms")
+    print(f"compile_pattern: {compile_pattern.cache_info()}")
+    print(f"parse_pattern:   {parse_pattern.cache_info()}")
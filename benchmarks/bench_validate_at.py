@@ -0,0 +1,39 @@
+"""
+Compares a full validation of a big document with validating one of its
+subtrees by path.
+
+Usage: PYTHONPATH=. python3 benchmarks/bench_validate_at.py
+"""
+import timeit
+
+from d42 import schema, validate
+from d42.validation import validate_at
+
+NUMBER = 5
+
+OrderSchema = schema.dict({
+    "id": schema.int.min(0),
+    "customer": schema.dict({"name": schema.str, "email": schema.str}),
+    "lines": schema.list(schema.dict({"sku": schema.str, "qty": schema.int.min(1)})),
+})
+StoreSchema = schema.dict({"name": schema.str, "orders": schema.list(OrderSchema)})
+
+DOCUMENT = {
+    "name": "store",
+    "orders": [{"id": i, "customer": {"name": f"c{i}", "email": f"c{i}@example.com"},
+                "lines": [{"sku": f"sku{j}", "qty": j + 1} for j in range(5)]}
+               for i in range(10_000)],
+}
+POINTER = "/orders/5000/lines"
+
+
+def bench(name: str, fn) -> float:
+    elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+    print(f"{name:<24} {elapsed * 1000:10.3f} ms")
+    return elapsed
+
+
+if __name__ == "__main__":
+    full = bench("validate", lambda: validate(StoreSchema, DOCUMENT))
+    subtree = bench("validate_at", lambda: validate_at(StoreSchema, DOCUMENT, POINTER))
+    print(f"{'speedup':<24} {full / subtree:10.1f}x")
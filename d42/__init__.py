@@ -1,9 +1,16 @@
 from d42.declaration import optional, schema
 from d42.generation import fake
+from d42.profiling import profile
 from d42.representation import represent
 from d42.substitution import substitute
-from d42.validation import ValidationException, validate, validate_or_fail
+from d42.validation import (
+    ValidationException,
+    avalidate,
+    validate,
+    validate_many,
+    validate_or_fail,
+)
 
 __all__ = ("schema", "optional", "fake", "validate", "validate_or_fail", "substitute",
-           "ValidationException", "represent",)
+           "ValidationException", "represent", "validate_many", "avalidate", "profile",)
 __version__ = "2.2.0"
@@ -0,0 +1,38 @@
+import re
+from functools import lru_cache
+from typing import Callable, Match, Pattern, cast
+
+__all__ = ("compile_pattern", "compile_alphabet", "PATTERN_CACHE_SIZE",)
+
+PATTERN_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str) -> Pattern[str]:
+    """
+    Compile `pattern` once and reuse the compiled object afterwards.
+
+    Unlike the internal cache of `re`, this one is only filled with schema
+    patterns, so apps that use lots of other regexes don't evict them.
+    Hit/miss statistics are available via `compile_pattern.cache_info()`.
+
+    :raises re.error: If `pattern` is not a valid regular expression.
+    """
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_alphabet(alphabet: str) -> Callable[[str], bool]:
+    """
+    Build a function that tells whether a string only has letters from `alphabet`.
+
+    The string is scanned by a compiled character class at C speed instead of
+    looking up every letter in a set.
+    """
+    letters = "".join(re.escape(letter) for letter in sorted(set(alphabet)))
+    # `match` always succeeds and never backtracks, unlike `fullmatch`
+    match = re.compile(f"[{letters}]*").match if letters else re.compile("").match
+
+    def is_in_alphabet(value: str) -> bool:
+        return cast(Match[str], match(value)).end() == len(value)
+    return is_in_alphabet
@@ -1,12 +1,22 @@
-from typing import Any, Iterator, Mapping, TypeVar
+import copyreg
+from typing import Any, Iterator, Mapping, Tuple, TypeVar
 
-from niltype import Nil, Nilable
+from niltype import Nil, Nilable, NilType
 
 __all__ = ("Props", "PropsType",)
 
 PropsType = TypeVar("PropsType", bound="Props")
 
 
+def _reduce_nil(nil: NilType) -> Tuple[Any, ...]:
+    # Enum pickles members by value, and a copy of the Nil value is not Nil
+    return getattr, (NilType, nil.name)
+
+
+# Props may hold Nil values (e.g. `props.update(type=Nil)`), keep them picklable
+copyreg.pickle(NilType, _reduce_nil)
+
+
 class Props:
     def __init__(self, registry: Nilable[Mapping[str, Any]] = Nil) -> None:
         self._registry = registry if (registry is not Nil) else {}
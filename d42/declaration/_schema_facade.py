@@ -12,10 +12,14 @@ from .types import (
     IntSchema,
     ListSchema,
     NoneSchema,
+    RefProps,
+    RefSchema,
+    RefTarget,
     StrSchema,
     TypeAliasProps,
     TypeAliasSchema,
     UUID4Schema,
+    bind_refs,
 )
 
 __all__ = ("SchemaFacade",)
@@ -24,7 +28,13 @@ __all__ = ("SchemaFacade",)
 class SchemaFacade:
     def alias(self, /, name: str, type_: GenericSchema) -> TypeAliasSchema:
         props = TypeAliasProps()
-        return TypeAliasSchema(props.update(name=name, type=type_))
+        alias = TypeAliasSchema(props.update(name=name, type=type_))
+        bind_refs(alias)
+        return alias
+
+    def ref(self, /, name: str) -> RefSchema:
+        props = RefProps()
+        return RefSchema(props.update(name=name, target=RefTarget(name)))
 
     @property
     def none(self) -> NoneSchema:
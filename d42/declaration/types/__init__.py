@@ -8,6 +8,7 @@ from ._float_schema import FloatProps, FloatSchema
 from ._int_schema import IntProps, IntSchema
 from ._list_schema import ListProps, ListSchema
 from ._none_schema import NoneProps, NoneSchema
+from ._ref_schema import RefProps, RefSchema, RefTarget, bind_refs
 from ._schema import GenericSchema, Schema
 from ._str_schema import StrProps, StrSchema
 from ._type_alias_schema import (
@@ -23,4 +24,5 @@ __all__ = ("AnyProps", "AnySchema", "BoolProps", "BoolSchema", "BytesProps", "By
            "ListProps", "ListSchema", "NoneProps", "NoneSchema", "StrProps", "StrSchema",
            "UUID4Props", "UUID4Schema", "DateProps", "DateSchema", "DateTimeProps",
            "DateTimeSchema", "TypeAliasSchema", "TypeAliasProps", "GenericTypeAliasSchema",
-           "TypeAliasPropsType", "GenericSchema", "Schema", "optional", )
+           "TypeAliasPropsType", "RefSchema", "RefProps", "RefTarget", "bind_refs",
+           "GenericSchema", "Schema", "optional", )
@@ -0,0 +1,126 @@
+from typing import Any, Optional, Set, Tuple, cast
+
+from niltype import Nil, Nilable
+
+from ..errors import DeclarationError
+from ._any_schema import AnySchema
+from ._dict_schema import DictSchema
+from ._list_schema import ListSchema
+from ._schema import GenericSchema, Schema
+from ._type_alias_schema import GenericTypeAliasSchema, TypeAliasProps
+
+__all__ = ("RefSchema", "RefProps", "RefTarget", "bind_refs",)
+
+
+class RefTarget:
+    """
+    The schema a `schema.ref(name)` stands for, set once the alias of that
+    name around it is declared.
+
+    Targets are equal when their names are, so comparing (or representing)
+    recursive schemas never follows a reference back.
+    """
+
+    __slots__ = ("name", "schema",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.schema: Optional[GenericSchema] = None
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, RefTarget) and (self.name == other.name)
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name!r}>"
+
+
+class RefProps(TypeAliasProps):
+    @property
+    def type(self) -> GenericSchema:
+        target = self.target
+        if (target is Nil) or (target.schema is None):
+            raise DeclarationError(f"`schema.ref({self.name!r})` is not declared, "
+                                   f"refs must be inside `schema.alias({self.name!r}, ...)`")
+        return target.schema
+
+    @property
+    def target(self) -> Nilable[RefTarget]:
+        return self.get("target")
+
+    @property
+    def is_resolved(self) -> bool:
+        target = self.target
+        return (target is not Nil) and (target.schema is not None)
+
+
+class RefSchema(GenericTypeAliasSchema[RefProps]):
+    """
+    A reference to the alias of the same name it's declared in, so the alias
+    can contain itself (trees, threads, linked lists):
+
+        Category = schema.alias("Category", schema.dict({
+            "name": schema.str,
+            "children": schema.list(schema.ref("Category")),
+        }))
+
+    It's an alias whose type is looked up when it's visited, so visitors see
+    `Category` through it, lazily.
+    """
+
+
+def bind_refs(alias: GenericTypeAliasSchema[Any]) -> None:
+    """
+    Point the unresolved refs named as `alias` inside its type to `alias`.
+
+    Refs are searched through dicts, lists, unions and aliases of other
+    names, not through custom types. A ref that isn't inside a dict or a
+    list of the alias would stand for the alias itself with nothing in
+    between, and a ref already bound to another alias can't point to both,
+    so both are errors.
+    """
+    name = alias.props.name
+    visited: Set[Tuple[int, bool]] = set()
+
+    def bind(schema: GenericSchema, guarded: bool) -> None:
+        if (id(schema), guarded) in visited:
+            return
+        visited.add((id(schema), guarded))
+
+        if isinstance(schema, RefSchema):
+            # Resolved refs are where cycles are, they are never entered
+            if schema.props.name != name:
+                return
+            target = cast(RefTarget, schema.props.target)
+            if target.schema is not None:
+                if target.schema is not alias:
+                    raise DeclarationError(f"`schema.ref({name!r})` is already bound to "
+                                           f"another `schema.alias({name!r}, ...)`, "
+                                           "refs can't be shared by aliases")
+            elif not guarded:
+                raise DeclarationError(f"`schema.ref({name!r})` refers to "
+                                       f"`schema.alias({name!r}, ...)` itself, "
+                                       "it must be inside a dict or a list")
+            else:
+                target.schema = alias
+        elif isinstance(schema, GenericTypeAliasSchema):
+            # Refs inside an alias of the same name are its own
+            if schema.props.name != name:
+                bind(schema.props.type, guarded)
+        elif isinstance(schema, AnySchema) and (schema.props.types is not Nil):
+            for sch_type in schema.props.types:
+                bind(sch_type, guarded)
+        elif isinstance(schema, DictSchema) and (schema.props.keys is not Nil):
+            for val, _ in schema.props.keys.values():
+                bind(val, True)
+        elif isinstance(schema, ListSchema):
+            if schema.props.type is not Nil:
+                bind(schema.props.type, True)
+            if schema.props.elements is not Nil:
+                for elem in schema.props.elements:
+                    if isinstance(elem, Schema):
+                        bind(elem, True)
+
+    bind(alias.props.type, False)
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Any, Generic, cast
+from typing import Any, Dict, Generic, cast
 
 from niltype import Nil, Nilable
 
@@ -23,6 +23,10 @@ class Schema(ABC, Generic[PropsType]):
     def props(self) -> PropsType:
         return self._props
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Per-instance caches (see `d42.utils.schema_cache`) are rebuilt on demand
+        return {key: val for key, val in self.__dict__.items() if key != "__d42_cache__"}
+
     def __accept__(self, visitor: SchemaVisitor[ReturnType], **kwargs: Any) -> ReturnType:
         if visit_method := getattr(visitor, "visit", None):
             return cast(ReturnType, visit_method(self, **kwargs))
@@ -4,6 +4,7 @@ from typing import Any
 
 from niltype import Nil, Nilable
 
+from .._compile_pattern import compile_pattern
 from .._is_ellipsis import TypeOrEllipsis, is_ellipsis
 from .._props import Props
 from .._schema_visitor import SchemaVisitor
@@ -183,13 +184,13 @@ class StrSchema(Schema[StrProps]):
             raise make_already_declared_error(self)
 
         try:
-            re.compile(pattern)
+            compiled = compile_pattern(pattern)
         except re.error as e:
             message = f"Invalid pattern ({e})"
             raise DeclarationError(message) from None
 
         if self.props.value is not Nil:
-            if re.search(pattern, self.props.value) is None:
+            if compiled.search(self.props.value) is None:
                 message = f"`{self!r}` does not match {pattern!r}"
                 raise DeclarationError(message)
 
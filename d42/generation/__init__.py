@@ -4,9 +4,9 @@ from d42.declaration import GenericSchema, Schema
 
 from ._generator import Generator
 from ._random import Random
-from ._regex_generator import RegexGenerator
+from ._regex_generator import RegexGenerator, parse_pattern
 
-__all__ = ("fake", "generate", "Generator", "Random", "RegexGenerator",)
+__all__ = ("fake", "generate", "Generator", "Random", "RegexGenerator", "parse_pattern",)
 
 _random = Random()
 _generator = Generator(_random, RegexGenerator(_random))
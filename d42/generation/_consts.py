@@ -12,5 +12,7 @@ LIST_LEN_MIN = 0
 LIST_LEN_MAX = 16
 BYTES_LEN_MIN = 0
 BYTES_LEN_MAX = 32
+# Refs followed before recursive schemas are generated as small as they can be
+REF_DEPTH_MAX = 3
 
 MAX_UNIQUE_GENERATION_ATTEMPTS = sys.getrecursionlimit()
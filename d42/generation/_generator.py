@@ -1,5 +1,5 @@
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List, Optional
 from uuid import UUID, uuid4
 
 from niltype import Nil
@@ -17,11 +17,12 @@ from d42.declaration.types import (
     IntSchema,
     ListSchema,
     NoneSchema,
+    RefSchema,
     StrSchema,
     TypeAliasPropsType,
     UUID4Schema,
 )
-from d42.utils import is_ellipsis
+from d42.utils import UniqueSet, is_ellipsis, schema_cache
 
 from ._consts import (
     BYTES_LEN_MAX,
@@ -33,6 +34,7 @@ from ._consts import (
     LIST_LEN_MAX,
     LIST_LEN_MIN,
     MAX_UNIQUE_GENERATION_ATTEMPTS,
+    REF_DEPTH_MAX,
     STR_ALPHABET,
     STR_LEN_MAX,
     STR_LEN_MIN,
@@ -43,10 +45,64 @@ from ._regex_generator import RegexGenerator
 __all__ = ("Generator",)
 
 
+def _ref_height(schema: GenericSchema, visiting: FrozenSet[int]) -> Optional[int]:
+    """
+    Return how many refs deep the smallest value of `schema` goes (lists as
+    short as they can be, no optional keys), or None if it never ends.
+
+    Aliases being visited are not entered again: the smallest value doesn't
+    contain itself.
+    """
+    if isinstance(schema, RefSchema):
+        height = _ref_height(schema.props.type, visiting)
+        return None if (height is None) else height + 1
+
+    if isinstance(schema, GenericTypeAliasSchema):
+        if id(schema) in visiting:
+            return None
+        return _ref_height(schema.props.type, visiting | {id(schema)})
+
+    parts: List[GenericSchema] = []
+    if isinstance(schema, DictSchema) and (schema.props.keys is not Nil):
+        parts = [val for key, (val, is_optional) in schema.props.keys.items()
+                 if not is_ellipsis(key) and not is_optional]
+    elif isinstance(schema, ListSchema):
+        if schema.props.elements is not Nil:
+            parts = [elem for elem in schema.props.elements if not is_ellipsis(elem)]
+        elif (schema.props.type is not Nil) and (_min_len(schema) > 0):
+            parts = [schema.props.type]
+    elif isinstance(schema, AnySchema) and (schema.props.types is not Nil):
+        heights = [h for h in (_ref_height(x, visiting) for x in schema.props.types)
+                   if h is not None]
+        return min(heights) if heights else None
+
+    height = 0
+    for part in parts:
+        part_height = _ref_height(part, visiting)
+        if part_height is None:
+            return None
+        height = max(height, part_height)
+    return height
+
+
+def _get_ref_height(schema: GenericSchema) -> Optional[int]:
+    return schema_cache(schema, "ref_height", lambda: _ref_height(schema, frozenset()))
+
+
+def _min_len(schema: ListSchema) -> int:
+    if schema.props.len is not Nil:
+        return schema.props.len
+    if schema.props.min_len is not Nil:
+        return schema.props.min_len
+    return 0
+
+
 class Generator(SchemaVisitor[Any]):
-    def __init__(self, random: Random, regex_generator: RegexGenerator) -> None:
+    def __init__(self, random: Random, regex_generator: RegexGenerator, *,
+                 max_ref_depth: int = REF_DEPTH_MAX) -> None:
         self._random = random
         self._regex_generator = regex_generator
+        self._max_ref_depth = max_ref_depth
 
     @property
     def random(self) -> Random:
@@ -126,7 +182,9 @@ class Generator(SchemaVisitor[Any]):
 
         return self._random.random_str(length, alphabet)
 
-    def visit_list(self, schema: ListSchema, **kwargs: Any) -> List[Any]:
+    def visit_list(self, schema: ListSchema, *, ref_depth: int = 0, **kwargs: Any) -> List[Any]:
+        if ref_depth:
+            kwargs["ref_depth"] = ref_depth
         if schema.props.elements is not Nil:
             elements = [elem for elem in schema.props.elements if not is_ellipsis(elem)]
             if schema.props.unique:
@@ -135,6 +193,8 @@ class Generator(SchemaVisitor[Any]):
 
         if schema.props.len is not Nil:
             length = schema.props.len
+        elif ref_depth > self._max_ref_depth:
+            length = _min_len(schema)
         else:
             min_length = LIST_LEN_MIN
             max_length = LIST_LEN_MAX
@@ -147,6 +207,11 @@ class Generator(SchemaVisitor[Any]):
                 max_length = schema.props.max_len
                 min_length = min(min_length, max_length)
 
+            if ref_depth:
+                # Lists inside refs get shorter at every ref, so recursive
+                # values stay small
+                max_length = max(min_length, max_length >> (2 * ref_depth))
+
             length = self._random.random_int(min_length, max_length)
 
         is_length_specified = (
@@ -168,10 +233,11 @@ class Generator(SchemaVisitor[Any]):
         max_attempts = MAX_UNIQUE_GENERATION_ATTEMPTS
 
         generated: List[Any] = []
+        seen = UniqueSet()
         for elem in elements:
             for _ in range(max_attempts):
                 item = elem.__accept__(self, **kwargs)
-                if self._is_elem_unique(item, generated):
+                if seen.add(item):
                     generated.append(item)
                     break
             else:
@@ -180,12 +246,6 @@ class Generator(SchemaVisitor[Any]):
                 )
         return generated
 
-    def _is_elem_unique(self, elem: Any, elements: List[Any]) -> bool:
-        for existing_elem in elements:
-            if elem == existing_elem:
-                return False
-        return True
-
     def visit_dict(self, schema: DictSchema, **kwargs: Any) -> Dict[Any, Any]:
         generated: Dict[Any, Any] = {}
         if schema.props.keys is Nil:
@@ -200,10 +260,20 @@ class Generator(SchemaVisitor[Any]):
 
         return generated
 
-    def visit_any(self, schema: AnySchema, **kwargs: Any) -> Any:
+    def visit_any(self, schema: AnySchema, *, ref_depth: int = 0, **kwargs: Any) -> Any:
         if schema.props.types is Nil:
             return None
-        chosen = self._random.random_choice(schema.props.types)
+        types = schema.props.types
+        if ref_depth > self._max_ref_depth:
+            # Past the budget, only the types that end the soonest are chosen
+            heights = [_get_ref_height(x) for x in types]
+            lowest = min((h for h in heights if h is not None), default=None)
+            if lowest is None:
+                raise RuntimeError(f"Failed to generate {schema!r}, it never ends")
+            types = tuple(x for x, h in zip(types, heights) if h == lowest)
+        if ref_depth:
+            kwargs["ref_depth"] = ref_depth
+        chosen = self._random.random_choice(types)
         return chosen.__accept__(self, **kwargs)
 
     def visit_bytes(self, schema: BytesSchema, **kwargs: Any) -> bytes:
@@ -215,6 +285,10 @@ class Generator(SchemaVisitor[Any]):
 
     def visit_type_alias(self, schema: GenericTypeAliasSchema[TypeAliasPropsType],
                          **kwargs: Any) -> Any:
+        if isinstance(schema, RefSchema):
+            kwargs["ref_depth"] = kwargs.get("ref_depth", 0) + 1
+            if (kwargs["ref_depth"] > self._max_ref_depth) and (_get_ref_height(schema) is None):
+                raise RuntimeError(f"Failed to generate {schema!r}, it never ends")
         return schema.props.type.__accept__(self, **kwargs)
 
     def visit_datetime(self, schema: DateTimeSchema, **kwargs: Any) -> datetime:
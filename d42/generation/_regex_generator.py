@@ -40,11 +40,24 @@ else:
         SUBPATTERN,
     )
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from ._random import Random
 
-__all__ = ("RegexGenerator",)
+__all__ = ("RegexGenerator", "parse_pattern",)
+
+
+@lru_cache(maxsize=1024)
+def parse_pattern(pattern: str) -> Any:
+    """
+    Parse `pattern` into the opcode tree walked by `RegexGenerator`.
+
+    The tree is only read during generation, so one parsed copy is shared by
+    all generators. Hit/miss statistics are available via
+    `parse_pattern.cache_info()`.
+    """
+    return sre.parse(pattern)
 
 
 class RegexGenerator:
@@ -156,5 +169,5 @@ class RegexGenerator:
             raise ValueError(f"Unknown opcode {opcode}")
 
     def generate(self, pattern: str) -> str:
-        parsed = sre.parse(pattern)  # type: Any
+        parsed = parse_pattern(pattern)
         return self._generate_pattern(parsed)
@@ -0,0 +1,61 @@
+from typing import Any, Callable, Dict, Tuple, Union
+
+from niltype import Nil
+
+from d42.declaration import GenericSchema, SchemaVisitor
+from d42.generation import Generator, Random, RegexGenerator, generate
+from d42.substitution import Substitutor, substitute
+from d42.validation import Validator, validate
+
+from ._profiler import NodeStats, Profiler
+
+__all__ = ("profile", "Profiler", "NodeStats",)
+
+
+def _make_validator(kwargs: Dict[str, Any]) -> SchemaVisitor[Any]:
+    return Validator(max_errors=kwargs.pop("max_errors", None),
+                     fail_fast=kwargs.pop("fail_fast", False))
+
+
+def _make_generator(kwargs: Dict[str, Any]) -> SchemaVisitor[Any]:
+    random = Random()
+    return Generator(random, RegexGenerator(random))
+
+
+def _make_substitutor(kwargs: Dict[str, Any]) -> SchemaVisitor[Any]:
+    return Substitutor()
+
+
+# Entry points are profiled with visitors set up the way they set up theirs
+_VISITOR_FACTORIES: Dict[Callable[..., Any], Callable[[Dict[str, Any]], SchemaVisitor[Any]]] = {
+    validate: _make_validator,
+    generate: _make_generator,
+    substitute: _make_substitutor,
+}
+
+
+def profile(target: Union[SchemaVisitor[Any], Callable[..., Any]], schema: GenericSchema,
+            value: Any = Nil, **kwargs: Any) -> Tuple[Any, Profiler]:
+    """
+    Run `target` over `schema` and record where the time goes, per node.
+
+    `target` is a visitor (`Validator`, `Generator`, `Substitutor` or any
+    other) or one of `validate`, `generate` (`fake`) and `substitute`.
+    Returns what the visit returns and the profiler:
+
+        result, profiler = profile(validate, schema, value)
+        print(profiler.report(top=10))
+    """
+    if isinstance(target, SchemaVisitor):
+        visitor = target
+    elif target in _VISITOR_FACTORIES:
+        visitor = _VISITOR_FACTORIES[target](kwargs)
+    else:
+        raise TypeError(f"Expected 'target' to be a visitor or one of validate, generate, "
+                        f"substitute, got {target!r} instead")
+
+    profiler = Profiler()
+    if value is not Nil:
+        kwargs["value"] = value
+    result = schema.__accept__(profiler.wrap(visitor), **kwargs)
+    return result, profiler
@@ -0,0 +1,188 @@
+import copy
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from niltype import Nil
+
+from d42.declaration import GenericSchema, SchemaVisitor
+from d42.declaration.types import AnySchema, DictSchema, GenericTypeAliasSchema, ListSchema
+from d42.representation import represent
+
+__all__ = ("Profiler", "NodeStats",)
+
+VisitorType = TypeVar("VisitorType", bound=SchemaVisitor[Any])
+
+
+class NodeStats:
+    """
+    What a `Profiler` has recorded for one schema node.
+
+    A node is a schema reached through a particular chain of parents, so the
+    same schema used in two places gets two entries.
+    """
+
+    __slots__ = ("schema", "parent", "children", "calls", "total_time", "children_time",
+                 "allocated_blocks",)
+
+    def __init__(self, schema: Optional[GenericSchema],
+                 parent: Optional["NodeStats"] = None) -> None:
+        self.schema = schema
+        self.parent = parent
+        self.children: Dict[int, NodeStats] = {}
+        self.calls = 0
+        self.total_time = 0.0
+        self.children_time = 0.0
+        self.allocated_blocks = 0
+
+    @property
+    def self_time(self) -> float:
+        return self.total_time - self.children_time
+
+    @property
+    def path(self) -> str:
+        if (self.parent is None) or (self.parent.schema is None):
+            return "_"
+        return self.parent.path + _get_step(self.parent.schema, self.schema)
+
+    def child(self, schema: GenericSchema) -> "NodeStats":
+        node = self.children.get(id(schema))
+        if node is None:
+            node = self.children[id(schema)] = NodeStats(schema, self)
+        return node
+
+    def __repr__(self) -> str:
+        return (f"<{self.__class__.__name__} {self.path} calls={self.calls} "
+                f"total_time={self.total_time:.6f} self_time={self.self_time:.6f}>")
+
+
+def _get_step(parent: GenericSchema, schema: Optional[GenericSchema]) -> str:
+    # Tells how `schema` is reached from `parent`, e.g. `["id"]` or `[*]`
+    props = parent.props
+    if isinstance(parent, DictSchema) and (props.keys is not Nil):
+        keys = [repr(key) for key, (val, _) in props.keys.items() if val is schema]
+        if keys:
+            return "[" + "|".join(keys) + "]"
+    elif isinstance(parent, ListSchema):
+        if props.type is schema:
+            return "[*]"
+        if props.elements is not Nil:
+            indexes = [str(index) for index, elem in enumerate(props.elements) if elem is schema]
+            if indexes:
+                return "[" + "|".join(indexes) + "]"
+    elif isinstance(parent, AnySchema) and (props.types is not Nil):
+        indexes = [str(index) for index, typ in enumerate(props.types) if typ is schema]
+        if indexes:
+            return "|" + "|".join(indexes)
+    elif isinstance(parent, GenericTypeAliasSchema):
+        return f"@{props.name}"
+    # Children of custom types can't be told apart, name them by their type
+    return f".<{type(schema).__name__}>"
+
+
+class Profiler:
+    """
+    Records where the visitors it wraps spend their time, per schema node.
+
+    `wrap()` returns a copy of a visitor whose `visit*` methods are timed.
+    Visitors keep calling their methods on `self`, so every node of the
+    traversal is recorded: children of containers, type aliases and custom
+    types alike. The visitors a visitor holds (for instance the validator of
+    a `Substitutor`) are wrapped too and share the records.
+
+    For every node the profiler counts calls, cumulative and self time and,
+    with `track_allocations=True`, memory blocks that the node and its
+    children leave allocated (results, errors, generated values). Counting
+    blocks costs a call per node, which shows in the times it records.
+
+    Methods are taken from the class of a visitor, so wrappers set on the
+    instance (e.g. the metering of a `Validator` with metrics) are not part
+    of the profiled copy.
+    """
+
+    def __init__(self, *, timer: Callable[[], float] = time.perf_counter,
+                 track_allocations: bool = False) -> None:
+        self._timer = timer
+        self._track_allocations = track_allocations
+        self._root = NodeStats(None)
+        self._stack: List[NodeStats] = [self._root]
+
+    def wrap(self, visitor: VisitorType) -> VisitorType:
+        return self._wrap(visitor, {})
+
+    def _wrap(self, visitor: VisitorType, wrapped: Dict[int, Any]) -> VisitorType:
+        if id(visitor) in wrapped:
+            return wrapped[id(visitor)]  # type: ignore[no-any-return]
+        clone = copy.copy(visitor)
+        wrapped[id(visitor)] = clone
+
+        for name, attr in list(getattr(clone, "__dict__", {}).items()):
+            if isinstance(attr, SchemaVisitor):
+                setattr(clone, name, self._wrap(attr, wrapped))
+        for name in dir(type(clone)):
+            if (name == "visit") or name.startswith("visit_"):
+                # Instance attributes may be bound to the original visitor
+                visit = getattr(type(clone), name).__get__(clone)
+                setattr(clone, name, self._instrument(visit))
+        return clone
+
+    def _instrument(self, visit: Callable[..., Any]) -> Callable[..., Any]:
+        timer = self._timer
+        stack = self._stack
+        track_allocations = self._track_allocations
+
+        def profiled(schema: GenericSchema, **kwargs: Any) -> Any:
+            parent = stack[-1]
+            if parent.schema is schema:
+                # The node visits itself again (another visitor, a retry with
+                # other arguments), it's still the same node
+                return visit(schema, **kwargs)
+
+            node = parent.child(schema)
+            stack.append(node)
+            blocks = sys.getallocatedblocks() if track_allocations else 0
+            started = timer()
+            try:
+                return visit(schema, **kwargs)
+            finally:
+                elapsed = timer() - started
+                if track_allocations:
+                    node.allocated_blocks += sys.getallocatedblocks() - blocks
+                stack.pop()
+                node.calls += 1
+                node.total_time += elapsed
+                parent.children_time += elapsed
+
+        return profiled
+
+    def get_stats(self) -> List[NodeStats]:
+        """
+        Return recorded nodes, the ones with the most self time first.
+        """
+        nodes: List[NodeStats] = []
+        pending = list(self._root.children.values())
+        while pending:
+            node = pending.pop()
+            nodes.append(node)
+            pending.extend(node.children.values())
+        return sorted(nodes, key=lambda n: n.self_time, reverse=True)
+
+    def report(self, top: int = 10, *, width: int = 40) -> str:
+        """
+        Format the `top` hottest nodes as a table.
+        """
+        blocks = f" {'blocks':>8}" if self._track_allocations else ""
+        lines = [f"{'calls':>8} {'total ms':>10} {'self ms':>10}{blocks}  node"]
+        for node in self.get_stats()[:top]:
+            snippet = " ".join(represent(node.schema).split())  # type: ignore[arg-type]
+            if len(snippet) > width:
+                snippet = snippet[:width - 3] + "..."
+            if self._track_allocations:
+                blocks = f" {node.allocated_blocks:>8}"
+            lines.append(f"{node.calls:>8} {node.total_time * 1000:>10.3f} "
+                         f"{node.self_time * 1000:>10.3f}{blocks}  {node.path}  {snippet}")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        self._root.children.clear()
+        self._root.children_time = 0.0
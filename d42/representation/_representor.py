@@ -16,6 +16,7 @@ from d42.declaration.types import (
     IntSchema,
     ListSchema,
     NoneSchema,
+    RefSchema,
     StrSchema,
     TypeAliasPropsType,
     UUID4Schema,
@@ -181,10 +182,14 @@ class Representor(SchemaVisitor[str]):
 
     def visit_type_alias(self, schema: GenericTypeAliasSchema[TypeAliasPropsType],
                          *, indent: int = 0, **kwargs: Any) -> str:
+        name = schema.props.name
+        if isinstance(schema, RefSchema):
+            # The alias it refers to is being represented
+            return f"{self._name}.ref({name!r})"
         type_name = schema.__class__.__name__
         type_repr = schema.props.type.__accept__(self, indent=indent, **kwargs)
-        if schema.props.name is not Nil:
-            type_name = schema.props.name
+        if name is not Nil:
+            type_name = name
         return f"{type_name}<{type_repr}>"
 
     def visit_uuid4(self, schema: UUID4Schema, *, indent: int = 0, **kwargs: Any) -> str:
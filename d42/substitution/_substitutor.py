@@ -16,11 +16,12 @@ from d42.declaration.types import (
     IntSchema,
     ListSchema,
     NoneSchema,
+    RefSchema,
     StrSchema,
     TypeAliasPropsType,
     UUID4Schema,
 )
-from d42.utils import from_native, is_ellipsis
+from d42.utils import from_native, get_union_index, is_ellipsis, match_body
 from d42.validation import Formatter, Validator
 
 from ._validator import SubstitutorValidator
@@ -43,6 +44,9 @@ class Substitutor(SchemaVisitor[GenericSchema]):
     def formatter(self) -> Formatter:
         return self._formatter
 
+    def _is_valid(self, schema: GenericSchema, value: Any) -> bool:
+        return not schema.__accept__(self._validator, value=value).has_errors()
+
     def _from_native(self, value: Any) -> GenericSchema:
         try:
             return from_native(value)
@@ -137,11 +141,16 @@ class Substitutor(SchemaVisitor[GenericSchema]):
 
         # body
         if (len(elements) > 2) and is_ellipsis(elements[0]) and is_ellipsis(elements[-1]):
-            for index, val in enumerate(value):
+            body = elements[1:-1]
+            # Only try to substitute where the body is known to match
+            start = match_body(value, len(body), lambda i, elem: self._is_valid(body[i], elem))
+            while start >= 0:
                 try:
-                    substituted = self._substitute_elements(value, elements[1:-1], index, **kwargs)
+                    substituted = self._substitute_elements(value, body, start, **kwargs)
                 except SubstitutionError:
-                    pass
+                    start = match_body(value, len(body),
+                                       lambda i, elem: self._is_valid(body[i], elem),
+                                       start=start + 1)
                 else:
                     return schema.__class__(schema.props.update(elements=substituted))
 
@@ -197,7 +206,9 @@ class Substitutor(SchemaVisitor[GenericSchema]):
         if schema.props.types is Nil:
             types.append(self._from_native(value))
         else:
-            for sch_type in schema.props.types:
+            # Branches that don't accept the type of the value can't be substituted
+            for index in get_union_index(schema).candidates(value):
+                sch_type = schema.props.types[index]
                 try:
                     substituted = sch_type.__accept__(self, value=value, **kwargs)
                 except SubstitutionError:
@@ -216,6 +227,9 @@ class Substitutor(SchemaVisitor[GenericSchema]):
                          value: Any = Nil,
                          **kwargs: Any) -> GenericTypeAliasSchema[TypeAliasPropsType]:
         substituted = schema.props.type.__accept__(self, value=value, **kwargs)
+        if isinstance(schema, RefSchema):
+            # The alias it refers to, substituted with the value
+            return cast(GenericTypeAliasSchema[TypeAliasPropsType], substituted)
         return schema.__class__(schema.props.update(type=substituted))
 
     def visit_uuid4(self, schema: UUID4Schema, *, value: Any = Nil, **kwargs: Any) -> UUID4Schema:
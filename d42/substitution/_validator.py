@@ -1,12 +1,10 @@
-from copy import deepcopy
 from typing import Any
 
 from niltype import Nil, Nilable
-from th import PathHolder
 
 from d42.declaration.types import DictSchema, ListSchema
 from d42.utils import is_ellipsis
-from d42.validation import ValidationResult, Validator
+from d42.validation import PathLike, ValidationResult, Validator
 from d42.validation.errors import (
     ExtraKeyValidationError,
     LengthValidationError,
@@ -19,11 +17,10 @@ __all__ = ("SubstitutorValidator",)
 
 class SubstitutorValidator(Validator):
     def visit_list(self, schema: ListSchema, *,
-                   value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                   value: Any = Nil, path: Nilable[PathLike] = Nil,
                    **kwargs: Any) -> ValidationResult:
         result = self._validation_result_factory()
-        if path is Nil:
-            path = self._path_holder_factory()
+        path = self._as_path(path)
 
         if error := self._validate_type(path, value, list):
             return result.add_error(error)
@@ -48,7 +45,7 @@ class SubstitutorValidator(Validator):
             for index, elem in enumerate(value):
                 if is_ellipsis(elem) and (index == 0 or index == len(value) - 1):
                     continue
-                nested_path = deepcopy(path)[index]
+                nested_path = path[index]
                 res = type_schema.__accept__(self, value=elem, path=nested_path, **kwargs)
                 result.add_errors(res.get_errors())
             return result
@@ -56,11 +53,10 @@ class SubstitutorValidator(Validator):
             return super().visit_list(schema, value=value, path=path, **kwargs)
 
     def visit_dict(self, schema: DictSchema, *,
-                   value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                   value: Any = Nil, path: Nilable[PathLike] = Nil,
                    **kwargs: Any) -> ValidationResult:
         result = self._validation_result_factory()
-        if path is Nil:
-            path = self._path_holder_factory()
+        path = self._as_path(path)
 
         if error := self._validate_type(path, value, dict):
             return result.add_error(error)
@@ -74,7 +70,7 @@ class SubstitutorValidator(Validator):
             if key in value:
                 if is_ellipsis(value[key]):
                     continue
-                nested_path = deepcopy(path)[key]
+                nested_path = path[key]
                 res = val.__accept__(self, value=value[key], path=nested_path, **kwargs)
                 result.add_errors(res.get_errors())
 
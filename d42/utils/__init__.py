@@ -1,7 +1,15 @@
+from ..declaration._compile_pattern import compile_alphabet, compile_pattern
 from ..declaration._is_ellipsis import EllipsisType, TypeOrEllipsis, is_ellipsis
 from ._from_native import from_native
 from ._make_required import make_required
+from ._match_body import closest_body, match_body
 from ._rollout import rollout
+from ._union_index import UnionIndex, get_union_index, schema_cache
+from ._unique import UniqueSet, canonicalize, is_unique
+from ._unwrap_alias import unwrap_alias
 
 __all__ = ("from_native", "make_required", "rollout",
-           "is_ellipsis", "EllipsisType", "TypeOrEllipsis",)
+           "is_ellipsis", "EllipsisType", "TypeOrEllipsis",
+           "canonicalize", "is_unique", "UniqueSet", "compile_pattern",
+           "compile_alphabet", "match_body", "closest_body",
+           "UnionIndex", "get_union_index", "schema_cache", "unwrap_alias",)
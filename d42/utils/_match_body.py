@@ -0,0 +1,41 @@
+from typing import Any, Callable, List
+
+__all__ = ("match_body", "closest_body",)
+
+
+def match_body(value: List[Any], body_len: int, is_valid: Callable[[int, Any], bool], *,
+               start: int = 0) -> int:
+    """
+    Find where the body of a `[..., *body, ...]` list pattern matches `value`.
+
+    `is_valid(body_index, elem)` tells whether `elem` matches the body element
+    at `body_index`. Start indexes are tried from `start` on, a candidate is
+    abandoned at its first failed (or missing) element and the search stops
+    at the first one where the whole body matches.
+
+    :return: The start of the match, or -1 if the body matches nowhere.
+    """
+    value_len = len(value)
+    for candidate in range(start, value_len):
+        for body_index in range(body_len):
+            index = candidate + body_index
+            if (index >= value_len) or not is_valid(body_index, value[index]):
+                break
+        else:
+            return candidate
+    return -1
+
+
+def closest_body(value: List[Any], count_errors: Callable[[int], int]) -> int:
+    """
+    Pick the start the errors of a body that matches nowhere are explained at.
+
+    `count_errors(start)` tells how many errors the body has at `start`. The
+    start with the fewest errors wins, the earliest on ties.
+    """
+    best_start, best_count = 0, -1
+    for candidate in range(len(value)):
+        count = count_errors(candidate)
+        if (best_count < 0) or (count < best_count):
+            best_start, best_count = candidate, count
+    return best_start
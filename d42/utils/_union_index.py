@@ -0,0 +1,187 @@
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type, TypeVar, cast
+from uuid import UUID
+
+from niltype import Nil, Nilable
+
+from d42.declaration.types import (
+    AnySchema,
+    BoolSchema,
+    BytesSchema,
+    DateSchema,
+    DateTimeSchema,
+    DictSchema,
+    FloatSchema,
+    GenericSchema,
+    IntSchema,
+    ListSchema,
+    NoneSchema,
+    StrSchema,
+    UUID4Schema,
+)
+
+from ._unwrap_alias import unwrap_alias
+
+__all__ = ("UnionIndex", "get_union_index", "schema_cache",)
+
+_CACHE_ATTR = "__d42_cache__"
+
+_T = TypeVar("_T")
+
+
+def schema_cache(schema: GenericSchema, key: str, factory: Callable[[], _T]) -> _T:
+    """
+    Return a value derived from `schema`, building it with `factory` only once.
+
+    Schemas are immutable (every declaration returns a new instance), so the
+    value is stored on the instance itself and lives as long as the schema.
+    """
+    cache: Optional[Dict[str, Any]] = schema.__dict__.get(_CACHE_ATTR)
+    if cache is None:
+        cache = {}
+        setattr(schema, _CACHE_ATTR, cache)
+    try:
+        return cast(_T, cache[key])
+    except KeyError:
+        value = cache[key] = factory()
+        return value
+
+
+# Built-in schemas reject any value that is not an instance of these types
+# before checking anything else
+_RUNTIME_TYPES: Dict[Type[GenericSchema], Type[Any]] = {
+    NoneSchema: type(None),
+    BoolSchema: bool,
+    IntSchema: int,
+    FloatSchema: float,
+    StrSchema: str,
+    BytesSchema: bytes,
+    ListSchema: list,
+    DictSchema: dict,
+    DateTimeSchema: datetime,
+    DateSchema: date,
+    UUID4Schema: UUID,
+}
+
+
+def _get_runtime_type(schema: GenericSchema) -> Optional[Type[Any]]:
+    return _RUNTIME_TYPES.get(type(unwrap_alias(schema)))
+
+
+def _get_literals(schema: GenericSchema) -> Dict[Any, Any]:
+    # Required keys of a dict schema that only accept a single str/int value
+    schema = unwrap_alias(schema)
+    if not isinstance(schema, DictSchema) or (schema.props.keys is Nil):
+        return {}
+    literals = {}
+    for key, (val, is_optional) in schema.props.keys.items():
+        val = unwrap_alias(val)
+        if is_optional or (type(val) not in (StrSchema, IntSchema)):
+            continue
+        if val.props.value is not Nil:
+            literals[key] = val.props.value
+    return literals
+
+
+def _find_discriminator(types: Tuple[GenericSchema, ...],
+                        dict_branches: Tuple[int, ...]) -> Nilable[Any]:
+    if len(dict_branches) < 2:
+        return Nil
+    all_literals = [_get_literals(types[index]) for index in dict_branches]
+    first, *other = all_literals
+    for key in first:
+        if all(key in literals for literals in other):
+            return key
+    return Nil
+
+
+class UnionIndex:
+    """
+    Maps a value to the `AnySchema` branches that may accept it.
+
+    Branches are first picked by the runtime type of the value. Branches whose
+    runtime type is unknown (custom types, nested unions) are always
+    candidates. If every dict branch requires the same key with a literal
+    str/int value (a discriminator, e.g. `"type": schema.str("created")`),
+    dict values holding a str/int under that key only get the branches whose
+    literal equals it. Candidates are kept in declaration order.
+    """
+
+    MAX_TYPES = 64
+
+    def __init__(self, types: Tuple[GenericSchema, ...]) -> None:
+        self._types = types
+        self._runtime_types = tuple(_get_runtime_type(sch_type) for sch_type in types)
+        self._candidates: Dict[Type[Any], Tuple[int, ...]] = {}
+
+        self._dict_branches = tuple(index for index, runtime_type
+                                    in enumerate(self._runtime_types) if runtime_type is dict)
+        self._discriminator = _find_discriminator(types, self._dict_branches)
+        self._branches_by_literal: Dict[Any, Set[int]] = {}
+        self._discriminated: Dict[Tuple[Type[Any], Any], Tuple[int, ...]] = {}
+        if self._discriminator is not Nil:
+            for index in self._dict_branches:
+                literal = _get_literals(types[index])[self._discriminator]
+                self._branches_by_literal.setdefault(literal, set()).add(index)
+
+    @property
+    def types(self) -> Tuple[GenericSchema, ...]:
+        return self._types
+
+    @property
+    def discriminator(self) -> Nilable[Any]:
+        return self._discriminator
+
+    def _find_candidates(self, value: Any) -> Tuple[int, ...]:
+        return tuple(index for index, runtime_type in enumerate(self._runtime_types)
+                     if (runtime_type is None) or isinstance(value, runtime_type))
+
+    def _get_type_candidates(self, value: Any) -> Tuple[int, ...]:
+        value_type = type(value)
+        if value.__class__ is not value_type:
+            # Proxies may pretend to be instances of another class
+            return self._find_candidates(value)
+        try:
+            return self._candidates[value_type]
+        except KeyError:
+            candidates = self._find_candidates(value)
+            if len(self._candidates) < self.MAX_TYPES:
+                self._candidates[value_type] = candidates
+            return candidates
+
+    def _filter_dict_branches(self, candidates: Tuple[int, ...],
+                              branches: Set[int]) -> Tuple[int, ...]:
+        return tuple(index for index in candidates
+                     if (self._runtime_types[index] is not dict) or (index in branches))
+
+    def candidates(self, value: Any) -> Tuple[int, ...]:
+        """
+        Return indexes of the branches that may accept `value`.
+        """
+        candidates = self._get_type_candidates(value)
+        if (self._discriminator is Nil) or not isinstance(value, dict):
+            return candidates
+
+        literal = value.get(self._discriminator, Nil)
+        if type(literal) not in (str, int):
+            # Missing keys, `...` and other values are judged by the validator
+            # (substitution accepts them), every dict branch is a candidate
+            return candidates
+        branches = self._branches_by_literal.get(literal)
+        if branches is None:
+            # Literals come from the value, so unknown ones share a key and
+            # the cache stays bounded
+            branches, literal = set(), Nil
+
+        key = (type(value), literal)
+        discriminated = self._discriminated.get(key)
+        if discriminated is None:
+            discriminated = self._filter_dict_branches(candidates, branches)
+            if (value.__class__ is key[0]) and (key[0] in self._candidates):
+                self._discriminated[key] = discriminated
+        return discriminated
+
+
+def get_union_index(schema: AnySchema) -> UnionIndex:
+    types = () if (schema.props.types is Nil) else schema.props.types
+    return schema_cache(schema, "union_index", lambda: UnionIndex(types))
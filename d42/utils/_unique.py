@@ -0,0 +1,91 @@
+from math import isnan
+from typing import Any, Hashable, Iterable, List, Set, cast
+
+__all__ = ("canonicalize", "is_unique", "UniqueSet",)
+
+
+class _Tag:
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __repr__(self) -> str:
+        return f"<{self._name}>"
+
+
+_LIST = _Tag("list")
+_TUPLE = _Tag("tuple")
+_DICT = _Tag("dict")
+_SET = _Tag("set")
+
+
+def canonicalize(value: Any) -> Hashable:
+    """
+    Convert `value` to a hashable form that compares like the value itself.
+
+    Lists, tuples, dicts and sets are frozen recursively and tagged with their
+    kind, so that `[1]` and `(1,)` stay different while `{"a": [1]}` can be
+    hashed. NaN never equals anything, including itself.
+
+    :raises TypeError: If `value` contains an unhashable object of unknown type.
+    """
+    if isinstance(value, list):
+        return (_LIST, tuple(canonicalize(x) for x in value))
+    if isinstance(value, dict):
+        return (_DICT, frozenset((k, canonicalize(v)) for k, v in value.items()))
+    if isinstance(value, tuple):
+        return (_TUPLE, tuple(canonicalize(x) for x in value))
+    if isinstance(value, (set, frozenset)):
+        return (_SET, frozenset(value))
+    if isinstance(value, float) and isnan(value):
+        return _Tag("nan")
+    hash(value)
+    return cast(Hashable, value)
+
+
+class UniqueSet:
+    """
+    Set of arbitrary values that tells whether a value is equal to any added one.
+
+    Values are compared through their canonical form, so the check is O(1) on
+    average. Values that can't be hashed are compared with `==` against every
+    other value.
+    """
+
+    def __init__(self) -> None:
+        self._canonical: Set[Hashable] = set()
+        self._values: List[Any] = []
+        self._unhashable: List[Any] = []
+
+    def add(self, value: Any) -> bool:
+        """
+        Add `value` unless an equal value is already present.
+
+        :return: True if the value was added, False if it's a duplicate.
+        """
+        try:
+            key = canonicalize(value)
+        except TypeError:
+            for existing in self._values:
+                if value == existing:
+                    return False
+            self._unhashable.append(value)
+        else:
+            if key in self._canonical:
+                return False
+            for existing in self._unhashable:
+                if value == existing:
+                    return False
+            self._canonical.add(key)
+        self._values.append(value)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+def is_unique(values: Iterable[Any]) -> bool:
+    seen = UniqueSet()
+    for value in values:
+        if not seen.add(value):
+            return False
+    return True
@@ -0,0 +1,12 @@
+from d42.declaration.types import GenericSchema, GenericTypeAliasSchema
+
+__all__ = ("unwrap_alias",)
+
+
+def unwrap_alias(schema: GenericSchema) -> GenericSchema:
+    """
+    Return the schema `schema` stands for, through aliases and resolved refs.
+    """
+    while isinstance(schema, GenericTypeAliasSchema):
+        schema = schema.props.type
+    return schema
@@ -1,42 +1,184 @@
-from typing import Any, List
+import json
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Union
 
 from d42.declaration import GenericSchema, Schema
 
 from ._abstract_formatter import AbstractFormatter
+from ._against import matching_schemas, validate_against
+from ._async import avalidate
+from ._batch import validate_many
+from ._cache import CacheStats, ValidationCache, ValidationMemo, schema_fingerprint
+from ._checker import Checker
+from ._columnar import validate_columnar
+from ._compiler import CompiledValidator, Compiler
+from ._error_budget import ErrorBudget
 from ._formatter import Formatter
+from ._incremental import patch_paths, validate_incremental, validate_patch
+from ._iterative import validate_iterative
+from ._json_checker import JsonChecker, JsonMismatch
+from ._metrics import (
+    Histogram,
+    InMemoryMetrics,
+    MetricsSink,
+    SchemaMetrics,
+    get_metrics_sink,
+    path_template,
+    set_metrics_sink,
+)
+from ._path import Path, PathLike
+from ._snapshot import ValueSnapshot, set_value_snapshots
+from ._streaming import iter_validate
+from ._validate_at import resolve_schema, validate_at
 from ._validation_result import ValidationResult
 from ._validator import Validator
 
-__all__ = ("validate", "validate_or_fail", "eq", "format_result",
-           "Validator", "ValidationResult", "ValidationException",
-           "Formatter", "AbstractFormatter",)
+__all__ = ("validate", "validate_or_fail", "is_valid", "eq", "format_result", "compile",
+           "Validator", "ValidationResult", "ValidationException", "Checker",
+           "Formatter", "AbstractFormatter", "Compiler", "CompiledValidator",
+           "Path", "PathLike", "validate_many", "iter_validate",
+           "validate_json", "load_json_or_fail", "JsonChecker", "avalidate",
+           "ErrorBudget", "ValueSnapshot", "set_value_snapshots",
+           "MetricsSink", "InMemoryMetrics", "SchemaMetrics", "Histogram", "path_template",
+           "set_metrics_sink", "get_metrics_sink", "ValidationCache", "ValidationMemo",
+           "CacheStats", "schema_fingerprint", "validate_incremental", "validate_patch",
+           "patch_paths", "validate_at", "resolve_schema",
+           "validate_against", "matching_schemas", "validate_columnar",
+           "validate_iterative",)
 
 
 _validator = Validator()
+_checker = Checker(_validator)
 _formatter = Formatter()
-
-
-def validate(schema: GenericSchema, value: Any, **kwargs: Any) -> ValidationResult:
-    return schema.__accept__(_validator, value=value, **kwargs)
+_json_checker = JsonChecker(_checker)
+_json_loader = JsonChecker(_checker, materialize=True)
+
+
+def validate(schema: GenericSchema, value: Any, *,
+             max_errors: Optional[int] = None, fail_fast: bool = False,
+             metrics: Optional[MetricsSink] = None,
+             **kwargs: Any) -> ValidationResult:
+    """
+    Validate `value` against `schema`.
+
+    With `max_errors` (or `fail_fast`, the same as `max_errors=1`) the
+    traversal stops once that many errors are found. If anything was left
+    to check, the result is marked as truncated, since there may be more.
+
+    The validation is reported to `metrics`, or to the sink set with
+    `set_metrics_sink` if there's one.
+    """
+    if fail_fast:
+        max_errors = 1
+    if metrics is None:
+        metrics = get_metrics_sink()
+    if metrics is None:
+        return _validate(schema, value, max_errors, kwargs)
+    started = perf_counter()
+    result = _validate(schema, value, max_errors, kwargs)
+    metrics.observe(schema, perf_counter() - started, result)
+    return result
+
+
+def _validate(schema: GenericSchema, value: Any, max_errors: Optional[int],
+              kwargs: Dict[str, Any]) -> ValidationResult:
+    if max_errors is None:
+        return schema.__accept__(_validator, value=value, **kwargs)
+    budget = ErrorBudget(max_errors)
+    result = schema.__accept__(_validator, value=value, error_budget=budget, **kwargs)
+    return budget.finish(result)
 
 
 class ValidationException(AssertionError):
     pass
 
 
-def validate_or_fail(schema: GenericSchema, value: Any, **kwargs: Any) -> bool:
-    result = validate(schema, value, **kwargs)
+def validate_or_fail(schema: GenericSchema, value: Any, *,
+                     max_errors: Optional[int] = None, fail_fast: bool = False,
+                     **kwargs: Any) -> bool:
+    result = validate(schema, value, max_errors=max_errors, fail_fast=fail_fast, **kwargs)
     errors = [e.format(_formatter) for e in result.get_errors()]
     if len(errors) == 0:
         return True
+    if result.is_truncated():
+        noun = "error" if len(errors) == 1 else "errors"
+        errors.append(f"... (stopped after {len(errors)} {noun})")
     message = "\n - " + "\n - ".join(errors)
     raise ValidationException(message)
 
 
+def is_valid(schema: GenericSchema, value: Any, **kwargs: Any) -> bool:
+    return schema.__accept__(_checker, value=value, **kwargs)
+
+
 def eq(schema: GenericSchema, value: Any) -> bool:
     if isinstance(value, Schema):
         return isinstance(value, schema.__class__) and (schema.props == value.props)
-    return not validate(schema, value=value).has_errors()
+    return is_valid(schema, value)
+
+
+def _decode_text(text: Union[str, bytes]) -> str:
+    if isinstance(text, bytes):
+        return text.decode(json.detect_encoding(text), "surrogatepass")
+    return text
+
+
+def validate_json(schema: GenericSchema, text: Union[str, bytes], *,
+                  lazy: bool = False) -> ValidationResult:
+    """
+    Validate JSON `text`, the result is the one of
+    `validate(schema, json.loads(text))`.
+
+    The text is decoded by the C decoder of `json` and checked with the
+    boolean fast path, only an invalid value is validated to explain it.
+
+    With `lazy=True`, `JsonChecker` walks the text instead: values under
+    `...` keys are syntax-checked but never built, so documents whose bulk
+    isn't declared take far less memory. Walking the text in Python is
+    slower than the C decoder (2-4 times), use it when memory is what
+    matters.
+    """
+    text = _decode_text(text)
+    if lazy:
+        try:
+            _json_checker.check(schema, text)
+        except JsonMismatch:
+            # Decode as usual to report exactly what the validator reports
+            return validate(schema, json.loads(text))
+        return _validator.make_validation_result()
+
+    value = json.loads(text)
+    if is_valid(schema, value):
+        return _validator.make_validation_result()
+    return validate(schema, value)
+
+
+def load_json_or_fail(schema: GenericSchema, text: Union[str, bytes], *,
+                      lazy: bool = False) -> Any:
+    """
+    Decode JSON `text` and return the value, or raise `ValidationException`
+    if it doesn't match `schema`.
+
+    With `lazy=True`, the text is checked and decoded in a single pass by
+    `JsonChecker` instead of being decoded and then walked again. That pass
+    runs in Python, so it's slower (1-4 times in benchmarks/bench_json.py)
+    than the C decoder followed by the check.
+    """
+    text = _decode_text(text)
+    if lazy:
+        try:
+            return _json_loader.check(schema, text)
+        except JsonMismatch:
+            # Decode as usual to report exactly what the validator reports
+            pass
+    value = json.loads(text)
+    if not is_valid(schema, value):
+        validate_or_fail(schema, value)
+    return value
+
+
+def compile(schema: GenericSchema) -> CompiledValidator:
+    return Compiler(_validator).compile(schema)
 
 
 def format_result(result: ValidationResult, formatter: Formatter = _formatter) -> List[str]:
@@ -0,0 +1,166 @@
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, cast
+
+from niltype import Nil
+
+from d42.declaration import GenericSchema
+from d42.declaration.types import DictSchema, ListSchema
+from d42.utils import is_ellipsis, unwrap_alias
+
+from ._cache import schema_fingerprint
+from ._checker import Checker
+from ._path import Path
+from ._validation_result import ValidationResult
+from ._validator import Validator, _default_validator, _is_plain_validator
+from .errors import ExtraKeyValidationError, MissingKeyValidationError, ValidationError
+
+__all__ = ("validate_against", "matching_schemas",)
+
+# Errors of each schema, in the order of the schemas
+Errors = List[List[ValidationError]]
+
+
+def _distinct(schemas: Sequence[GenericSchema]) -> Tuple[List[GenericSchema], List[int]]:
+    # Schemas declared the same way validate the same way, so only one of
+    # them is walked
+    distinct: List[GenericSchema] = []
+    seen: Dict[Hashable, int] = {}
+    positions: List[int] = []
+    for schema in schemas:
+        schema = unwrap_alias(schema)
+        key = schema_fingerprint(schema)
+        if key not in seen:
+            seen[key] = len(distinct)
+            distinct.append(schema)
+        positions.append(seen[key])
+    return distinct, positions
+
+
+class _JointWalker:
+    """
+    Walks a value once for several schemas: containers are entered once, and
+    the subschemas their schemas declare for the same child are walked side
+    by side. Errors of every schema are the ones `Validator` reports.
+    """
+
+    def __init__(self, validator: Validator) -> None:
+        self._validator = validator
+        self._checker = Checker(validator)
+
+    def walk(self, schemas: Sequence[GenericSchema], value: Any, path: Path) -> Errors:
+        distinct, positions = _distinct(schemas)
+        errors = self._walk_distinct(distinct, value, path)
+        return [errors[position] for position in positions]
+
+    def _walk_distinct(self, schemas: List[GenericSchema], value: Any, path: Path) -> Errors:
+        errors: Errors = [[] for _ in schemas]
+        dicts: List[int] = []
+        lists: List[int] = []
+        for index, schema in enumerate(schemas):
+            if isinstance(schema, DictSchema):
+                dicts.append(index)
+            elif isinstance(schema, ListSchema) and (schema.props.elements is Nil):
+                lists.append(index)
+            else:
+                # Unions, tuples, scalars and custom types on their own,
+                # valid values take the boolean fast path
+                if not schema.__accept__(self._checker, value=value):
+                    res = schema.__accept__(self._validator, value=value, path=path)
+                    errors[index] = res.get_errors()
+        if len(dicts) > 0:
+            self._walk_dicts(schemas, dicts, value, path, errors)
+        if len(lists) > 0:
+            self._walk_lists(schemas, lists, value, path, errors)
+        return errors
+
+    def _walk_dicts(self, schemas: List[GenericSchema], indexes: List[int], value: Any,
+                    path: Path, errors: Errors) -> None:
+        # Mirrors `Validator.visit_dict`
+        if error := self._validator._validate_type(path, value, dict):
+            for index in indexes:
+                errors[index] = [error]
+            return
+
+        # Subschemas of every key present in the value, over all the schemas
+        children: Dict[Any, List[GenericSchema]] = {}
+        for index in indexes:
+            keys = cast(DictSchema, schemas[index]).props.keys
+            if keys is Nil:
+                continue
+            for key, (val, _) in keys.items():
+                if not is_ellipsis(key) and (key in value):
+                    children.setdefault(key, []).append(val)
+        child_errors = {key: iter(self.walk(vals, value[key], path[key]))
+                        for key, vals in children.items()}
+
+        for index in indexes:
+            keys = cast(DictSchema, schemas[index]).props.keys
+            if keys is Nil:
+                continue
+            own = errors[index]
+            for key, (_, is_optional) in keys.items():
+                if is_ellipsis(key):
+                    continue
+                if key in value:
+                    own.extend(next(child_errors[key]))
+                elif not is_optional:
+                    own.append(MissingKeyValidationError(path, value, key))
+            if ... not in keys:
+                for key in value:
+                    if key not in keys:
+                        own.append(ExtraKeyValidationError(path, value, key))
+
+    def _walk_lists(self, schemas: List[GenericSchema], indexes: List[int], value: Any,
+                    path: Path, errors: Errors) -> None:
+        # Mirrors `Validator.visit_list` for `schema.list` and `schema.list(T)`
+        typed: List[int] = []
+        for index in indexes:
+            schema = cast(ListSchema, schemas[index])
+            if error := self._validator._validate_list_props(schema, path, value):
+                errors[index] = [error]
+            elif schema.props.type is not Nil:
+                typed.append(index)
+        if len(typed) == 0:
+            return
+
+        distinct, positions = _distinct([cast(GenericSchema, schemas[index].props.type)
+                                         for index in typed])
+        for elem_index, elem in enumerate(value):
+            elem_errors = self._walk_distinct(distinct, elem, path[elem_index])
+            for index, position in zip(typed, positions):
+                errors[index].extend(elem_errors[position])
+
+
+def _walk(schemas: Sequence[GenericSchema], value: Any,
+          validator: Optional[Validator]) -> Errors:
+    validator = validator or _default_validator
+    if not _is_plain_validator(validator):
+        return [schema.__accept__(validator, value=value).get_errors() for schema in schemas]
+    return _JointWalker(validator).walk(schemas, value, validator._as_path(Nil))
+
+
+def validate_against(schemas: Iterable[GenericSchema], value: Any, *,
+                     validator: Optional[Validator] = None) -> List[ValidationResult]:
+    """
+    Validate `value` against each of `schemas` in a single walk over it.
+
+    Subschemas that are declared the same way in several schemas (e.g. the
+    parts that didn't change between versions of an API) are validated once.
+    Returns the result of each schema, in their order; each is the one of
+    `validate(schema, value)`.
+    """
+    schemas = list(schemas)
+    validator = validator or _default_validator
+    return [validator.make_validation_result().add_errors(list(errors))
+            for errors in _walk(schemas, value, validator)]
+
+
+def matching_schemas(schemas: Iterable[GenericSchema], value: Any, *,
+                     validator: Optional[Validator] = None) -> List[GenericSchema]:
+    """
+    Return the schemas `value` is valid against, in their order.
+
+    See `validate_against`.
+    """
+    schemas = list(schemas)
+    return [schema for schema, errors in zip(schemas, _walk(schemas, value, validator))
+            if len(errors) == 0]
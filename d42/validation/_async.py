@@ -0,0 +1,117 @@
+import asyncio
+import warnings
+from time import perf_counter
+from typing import Any, AsyncIterable, Generator, Optional, cast
+
+from niltype import Nil
+
+from d42.declaration import GenericSchema
+from d42.declaration.types import ListSchema
+
+from ._error_budget import ErrorBudget
+from ._stepper import Stepper, walk
+from ._validation_result import ValidationResult
+from ._validator import Validator
+
+__all__ = ("avalidate",)
+
+
+class _Scheduler:
+    def __init__(self, yield_every: int) -> None:
+        self._yield_every = yield_every
+        self._visited = 0
+
+    async def run(self, walker: Generator[None, None, ValidationResult]) -> ValidationResult:
+        while True:
+            try:
+                next(walker)
+            except StopIteration as stop:
+                return stop.value  # type: ignore[no-any-return]
+            self._visited += 1
+            if self._visited >= self._yield_every:
+                self._visited = 0
+                await asyncio.sleep(0)
+
+
+def _is_streamable(schema: GenericSchema) -> bool:
+    if not isinstance(schema, ListSchema):
+        return False
+    props = schema.props
+    return (props.type is not Nil) and (props.elements is Nil) and not props.unique and \
+        (props.len is Nil) and (props.min_len is Nil) and (props.max_len is Nil)
+
+
+async def _validate_stream(stepper: Stepper, scheduler: _Scheduler, schema: ListSchema,
+                           elements: AsyncIterable[Any], **kwargs: Any) -> ValidationResult:
+    # `schema.list(T)` only reports the errors of each element, so elements
+    # are validated as they come and never kept
+    validator = stepper.validator
+    result = validator.make_validation_result()
+    path = validator._as_path(Nil)
+    budget: Optional[ErrorBudget] = None
+    if validator.max_errors is not None:
+        # Elements share a budget, as those of a list do
+        budget = kwargs["error_budget"] = ErrorBudget(validator.max_errors)
+    index = 0
+    async for elem in elements:
+        if budget and budget.should_stop():
+            break
+        spent = budget.spent if budget else 0
+        walker = walk(stepper, cast(GenericSchema, schema.props.type), elem, path[index], **kwargs)
+        res = await scheduler.run(walker)
+        result.add_errors(res.get_errors())
+        if budget:
+            budget.charge(spent, len(res.get_errors()))
+        index += 1
+    return budget.finish(result) if budget else result
+
+
+async def avalidate(schema: GenericSchema, value: Any, *,
+                    yield_every: int = 1000,
+                    validator: Optional[Validator] = None,
+                    **kwargs: Any) -> ValidationResult:
+    """
+    Validate `value` without blocking the event loop for long.
+
+    The value is walked with an explicit stack, and control goes back to the
+    event loop after every `yield_every` visited nodes. The result is the same
+    as the one of `validate`, `max_errors` of the validator included.
+
+    Subclasses of `Validator` may change what is valid, so with one the value
+    can't be walked in steps: it's validated at once, blocking the event
+    loop, and a `RuntimeWarning` says so.
+
+    An async iterable is validated as the list of its elements. Against
+    `schema.list(T)` its elements are checked one by one as they arrive and
+    are not kept; otherwise they are gathered into a list first.
+
+    :raises ValueError: If `yield_every` is not positive.
+    """
+    if yield_every < 1:
+        raise ValueError(f"yield_every must be positive, got {yield_every!r}")
+    stepper = Stepper(validator)
+    if not stepper.is_stepped:
+        warnings.warn(f"{type(stepper.validator).__name__} is a subclass of Validator, so the "
+                      f"value is validated at once, blocking the event loop",
+                      RuntimeWarning, stacklevel=2)
+    scheduler = _Scheduler(yield_every)
+
+    metrics = stepper.validator.metrics
+    if metrics is None:
+        return await _avalidate(stepper, scheduler, schema, value, **kwargs)
+    # The stepper visits nodes one by one, so the whole call is observed here
+    started = perf_counter()
+    result = await _avalidate(stepper, scheduler, schema, value, metered=True, **kwargs)
+    metrics.observe(schema, perf_counter() - started, result)
+    return result
+
+
+async def _avalidate(stepper: Stepper, scheduler: _Scheduler, schema: GenericSchema,
+                     value: Any, **kwargs: Any) -> ValidationResult:
+    if isinstance(value, AsyncIterable):
+        if _is_streamable(schema) and stepper.is_stepped:
+            return await _validate_stream(stepper, scheduler, schema,  # type: ignore[arg-type]
+                                          value, **kwargs)
+        value = [elem async for elem in value]
+
+    return await scheduler.run(walk(stepper, schema, value, **kwargs))
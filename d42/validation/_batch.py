@@ -0,0 +1,116 @@
+import os
+import pickle
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple
+
+from d42.declaration import GenericSchema
+
+from ._checker import Checker
+from ._formatter import Formatter
+from ._validator import Validator
+
+__all__ = ("validate_many",)
+
+# Errors of the invalid records of a chunk, by their index in the chunk
+ChunkErrors = List[Tuple[int, List[str]]]
+
+_worker_schema: Optional[GenericSchema] = None
+_worker_checker: Optional[Checker] = None
+_worker_formatter: Optional[Formatter] = None
+
+
+def _validate_chunk(schema: GenericSchema, chunk: List[Any],
+                    checker: Checker, formatter: Formatter) -> ChunkErrors:
+    errors: ChunkErrors = []
+    for index, value in enumerate(chunk):
+        # Valid records only take the boolean fast path
+        if schema.__accept__(checker, value=value):
+            continue
+        result = schema.__accept__(checker.validator, value=value)
+        errors.append((index, [e.format(formatter) for e in result.get_errors()]))
+    return errors
+
+
+def _init_worker(dumped_schema: bytes, formatter: Formatter) -> None:
+    global _worker_schema, _worker_checker, _worker_formatter
+    _worker_schema = pickle.loads(dumped_schema)
+    _worker_checker = Checker(Validator())
+    _worker_formatter = formatter
+
+
+def _validate_worker_chunk(chunk: List[Any]) -> ChunkErrors:
+    assert _worker_schema is not None
+    assert (_worker_checker is not None) and (_worker_formatter is not None)
+    return _validate_chunk(_worker_schema, chunk, _worker_checker, _worker_formatter)
+
+
+def _iter_chunks(values: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator = iter(values)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _expand(size: int, errors: ChunkErrors) -> Iterator[List[str]]:
+    errors_at = dict(errors)
+    for index in range(size):
+        yield errors_at.get(index, [])
+
+
+def _validate_inline(schema: GenericSchema, chunks: Iterator[List[Any]],
+                     formatter: Formatter) -> Iterator[List[str]]:
+    checker = Checker(Validator())
+    for chunk in chunks:
+        yield from _expand(len(chunk), _validate_chunk(schema, chunk, checker, formatter))
+
+
+def _validate_parallel(dumped_schema: bytes, chunks: Iterator[List[Any]],
+                       formatter: Formatter, workers: int) -> Iterator[List[str]]:
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(dumped_schema, formatter)) as executor:
+        pending: Deque[Tuple[int, Future[ChunkErrors]]] = deque()
+        for chunk in chunks:
+            pending.append((len(chunk), executor.submit(_validate_worker_chunk, chunk)))
+            # Keep every worker busy without reading all values in advance
+            if len(pending) >= workers * 2:
+                size, future = pending.popleft()
+                yield from _expand(size, future.result())
+        while pending:
+            size, future = pending.popleft()
+            yield from _expand(size, future.result())
+
+
+def validate_many(schema: GenericSchema, values: Iterable[Any], *,
+                  workers: Optional[int] = None,
+                  chunk_size: int = 1000,
+                  formatter: Optional[Formatter] = None) -> Iterator[List[str]]:
+    """
+    Validate every value against `schema`, spreading the work over processes.
+
+    The schema is pickled once and loaded by each worker process when it
+    starts. Values are sent in chunks of `chunk_size`, and only a bounded
+    number of chunks is in flight, so `values` may be a lazy iterable of any
+    length.
+
+    :param workers: Number of worker processes, `os.cpu_count()` by default.
+                    With 1 worker everything runs in the current process.
+    :return: An iterator over the formatted errors of each value, in the order
+             of `values`. Valid values get an empty list.
+    :raises ValueError: If `chunk_size` is not positive.
+    :raises TypeError: If `schema` can't be pickled.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size!r}")
+    formatter = formatter or Formatter()
+    workers = workers if (workers is not None) else (os.cpu_count() or 1)
+    chunks = _iter_chunks(values, chunk_size)
+
+    if workers <= 1:
+        return _validate_inline(schema, chunks, formatter)
+
+    try:
+        dumped_schema = pickle.dumps(schema)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise TypeError(f"Can't send {schema!r} to worker processes ({e})") from None
+    return _validate_parallel(dumped_schema, chunks, formatter, workers)
@@ -0,0 +1,162 @@
+import pickle
+from collections import OrderedDict
+from hashlib import blake2b
+from itertools import count
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from d42.declaration import GenericSchema
+from d42.utils import schema_cache
+
+from ._validation_result import ValidationResult
+from ._validator import Validator
+from .errors import ValidationError
+
+__all__ = ("ValidationCache", "ValidationMemo", "CacheStats", "schema_fingerprint",)
+
+_unpicklable = count()
+
+
+def schema_fingerprint(schema: GenericSchema) -> Hashable:
+    """
+    Return a key that is equal for schemas declared the same way.
+
+    Schemas are compared by their pickled state. A schema that can't be
+    pickled (e.g. a custom type holding a lambda) is only equal to itself.
+    """
+    def fingerprint() -> Hashable:
+        try:
+            state = pickle.dumps(schema, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return ("unpicklable", next(_unpicklable))
+        return blake2b(state, digest_size=16).digest()
+    return schema_cache(schema, "fingerprint", fingerprint)
+
+
+class ValidationMemo:
+    """
+    Remembers containers that turned out valid during a validation.
+
+    Passed as the `validation_memo` keyword argument, it makes a validator
+    check a dict or a list reached many times (a DAG-shaped value) only once
+    per schema. Invalid ones are validated every time, so errors get the
+    right paths. The memo keeps what it remembers alive, so it may be reused
+    across validations of values that don't change.
+    """
+
+    __slots__ = ("_valid", "hits", "misses",)
+
+    def __init__(self) -> None:
+        self._valid: Dict[Tuple[int, int], Tuple[GenericSchema, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def is_valid(self, schema: GenericSchema, value: Any) -> bool:
+        if (id(schema), id(value)) in self._valid:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def add_valid(self, schema: GenericSchema, value: Any) -> None:
+        self._valid[(id(schema), id(value))] = (schema, value)
+
+    def __len__(self) -> int:
+        return len(self._valid)
+
+
+class CacheStats:
+    __slots__ = ("hits", "misses", "evictions", "size", "maxsize", "memo_hits",)
+
+    def __init__(self, hits: int, misses: int, evictions: int, size: int, maxsize: int,
+                 memo_hits: int) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.size = size
+        self.maxsize = maxsize
+        self.memo_hits = memo_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(hits={self.hits}, misses={self.misses}, "
+                f"evictions={self.evictions}, size={self.size}, maxsize={self.maxsize}, "
+                f"memo_hits={self.memo_hits}, hit_ratio={self.hit_ratio:.3f})")
+
+
+class ValidationCache:
+    """
+    Keeps the errors of recent validations and returns them for the same
+    schema and value instead of validating again.
+
+    Schemas are matched by `schema_fingerprint`. Values are matched by
+    identity, or by `key(value)` when `key` is given (e.g. a hash of the raw
+    response a value was decoded from). Either way cached values must not be
+    mutated: the cache doesn't notice. The least recently used entries are
+    dropped once there are more than `maxsize` of them.
+
+    Validations that miss the cache use a `ValidationMemo`, so shared
+    sub-objects of a value are validated once per schema.
+    """
+
+    def __init__(self, maxsize: int = 1024, *,
+                 key: Optional[Callable[[Any], Hashable]] = None,
+                 validator: Optional[Validator] = None) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize!r}")
+        self._maxsize = maxsize
+        self._key = key
+        self._validator = validator or Validator()
+        # (schema fingerprint, value key) -> (value if keyed by identity, errors)
+        self._entries: "OrderedDict[Tuple[Hashable, Hashable], Tuple[Any, List[ValidationError]]]"
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._memo_hits = 0
+
+    @property
+    def validator(self) -> Validator:
+        return self._validator
+
+    def validate(self, schema: GenericSchema, value: Any) -> ValidationResult:
+        by_identity = self._key is None
+        value_key = id(value) if by_identity else self._key(value)  # type: ignore[misc]
+        cache_key = (schema_fingerprint(schema), value_key)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            # Entries keep their values alive, so an id can't be reused while
+            # it's cached, the check is for peace of mind
+            if (entry is not None) and (not by_identity or (entry[0] is value)):
+                self._entries.move_to_end(cache_key)
+                self._hits += 1
+                return self._validator.make_validation_result().add_errors(list(entry[1]))
+            self._misses += 1
+
+        memo = ValidationMemo()
+        result = schema.__accept__(self._validator, value=value, validation_memo=memo)
+
+        with self._lock:
+            self._memo_hits += memo.hits
+            self._entries[cache_key] = (value if by_identity else None, list(result.get_errors()))
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions,
+                              len(self._entries), self._maxsize, self._memo_hits)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._memo_hits = 0
@@ -0,0 +1,222 @@
+from datetime import date, datetime
+from math import isclose
+from typing import Any, List, Optional
+from uuid import UUID
+
+from niltype import Nil
+
+from d42.declaration import GenericSchema, SchemaVisitor
+from d42.declaration.types import (
+    AnySchema,
+    BoolSchema,
+    BytesSchema,
+    DateSchema,
+    DateTimeSchema,
+    DictSchema,
+    FloatSchema,
+    GenericTypeAliasSchema,
+    IntSchema,
+    ListSchema,
+    NoneSchema,
+    StrSchema,
+    TypeAliasPropsType,
+    UUID4Schema,
+)
+from d42.utils import compile_alphabet, compile_pattern, get_union_index, is_ellipsis, is_unique
+
+from ._validator import Validator
+
+__all__ = ("Checker",)
+
+
+class Checker(SchemaVisitor[bool]):
+    """
+    Answers whether a value is valid without collecting errors.
+
+    Unlike `Validator`, the checker stops at the first failed constraint and
+    does not build paths, results or error objects along the way. Its verdict
+    always agrees with `not validator_result.has_errors()`.
+    """
+
+    def __init__(self, validator: Optional[Validator] = None) -> None:
+        self._validator = validator or Validator()
+
+    @property
+    def validator(self) -> Validator:
+        return self._validator
+
+    def _check_elements(self, value: List[Any], elements: List[GenericSchema],
+                        start: int = 0, **kwargs: Any) -> bool:
+        if start + len(elements) > len(value):
+            return False
+        for index, element_schema in enumerate(elements, start):
+            if not element_schema.__accept__(self, value=value[index], **kwargs):
+                return False
+        return True
+
+    def visit(self, schema: GenericSchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        # Custom types only know how to report errors, so ask the validator
+        result = schema.__accept__(self._validator, value=value, **kwargs)
+        return not result.has_errors()
+
+    def visit_none(self, schema: NoneSchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        return value is None
+
+    def visit_bool(self, schema: BoolSchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        if not isinstance(value, bool):
+            return False
+        return (schema.props.value is Nil) or (value == schema.props.value)
+
+    def visit_int(self, schema: IntSchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        if not isinstance(value, int):
+            return False
+        props = schema.props
+        if (props.value is not Nil) and (value != props.value):
+            return False
+        if (props.min is not Nil) and (value < props.min):
+            return False
+        if (props.max is not Nil) and (value > props.max):
+            return False
+        return True
+
+    def visit_float(self, schema: FloatSchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        if not isinstance(value, float):
+            return False
+        props = schema.props
+        if props.value is not Nil:
+            if props.precision is Nil:
+                if not isclose(value, props.value):
+                    return False
+            else:
+                scale_factor = 10 ** props.precision
+                scaled_actual = round(value * scale_factor)
+                scaled_expected = round(props.value * scale_factor)
+                if not isclose(scaled_expected, scaled_actual, rel_tol=0, abs_tol=0):
+                    return False
+        if (props.min is not Nil) and (value < props.min):
+            return False
+        if (props.max is not Nil) and (value > props.max):
+            return False
+        return True
+
+    def visit_str(self, schema: StrSchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        if not isinstance(value, str):
+            return False
+        props = schema.props
+        if (props.value is not Nil) and (value != props.value):
+            return False
+        if (props.pattern is not Nil) and (compile_pattern(props.pattern).search(value) is None):
+            return False
+        if (props.len is not Nil) and (len(value) != props.len):
+            return False
+        if (props.min_len is not Nil) and (len(value) < props.min_len):
+            return False
+        if (props.max_len is not Nil) and (len(value) > props.max_len):
+            return False
+        if (props.substr is not Nil) and (props.substr not in value):
+            return False
+        if props.alphabet is not Nil:
+            if not compile_alphabet(props.alphabet)(value):
+                return False
+        return True
+
+    def visit_list(self, schema: ListSchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        if not isinstance(value, list):
+            return False
+        props = schema.props
+        if (props.len is not Nil) and (len(value) != props.len):
+            return False
+        if (props.min_len is not Nil) and (len(value) < props.min_len):
+            return False
+        if (props.max_len is not Nil) and (len(value) > props.max_len):
+            return False
+        if props.unique and not is_unique(value):
+            return False
+
+        if props.type is not Nil:
+            type_schema = props.type
+            for elem in value:
+                if not type_schema.__accept__(self, value=elem, **kwargs):
+                    return False
+            return True
+
+        if props.elements is Nil:
+            return True
+        elements = props.elements
+
+        # body
+        if (len(elements) > 2) and is_ellipsis(elements[0]) and is_ellipsis(elements[-1]):
+            body = elements[1:-1]
+            for index in range(len(value)):
+                if self._check_elements(value, body, index, **kwargs):
+                    return True
+            return False
+
+        # head
+        if (len(elements) >= 2) and is_ellipsis(elements[-1]):
+            return self._check_elements(value, elements[:-1], **kwargs)
+
+        # tail
+        if (len(elements) >= 1) and is_ellipsis(elements[0]):
+            tail = elements[1:]
+            start = max(0, len(value) - len(tail))
+            return self._check_elements(value, tail, start, **kwargs)
+
+        if len(value) > len(elements):
+            return False
+        return self._check_elements(value, elements, **kwargs)
+
+    def visit_dict(self, schema: DictSchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        if not isinstance(value, dict):
+            return False
+        keys = schema.props.keys
+        if keys is Nil:
+            return True
+
+        for key, (val, is_optional) in keys.items():
+            if is_ellipsis(key):
+                continue
+            if key in value:
+                if not val.__accept__(self, value=value[key], **kwargs):
+                    return False
+            elif not is_optional:
+                return False
+
+        if ... not in keys:
+            for key in value:
+                if key not in keys:
+                    return False
+        return True
+
+    def visit_any(self, schema: AnySchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        if schema.props.types is Nil:
+            return True
+        types = schema.props.types
+        for index in get_union_index(schema).candidates(value):
+            if types[index].__accept__(self, value=value, **kwargs):
+                return True
+        return False
+
+    def visit_bytes(self, schema: BytesSchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        if not isinstance(value, bytes):
+            return False
+        return (schema.props.value is Nil) or (value == schema.props.value)
+
+    def visit_type_alias(self, schema: GenericTypeAliasSchema[TypeAliasPropsType], *,
+                         value: Any = Nil, **kwargs: Any) -> bool:
+        return schema.props.type.__accept__(self, value=value, **kwargs)
+
+    def visit_datetime(self, schema: DateTimeSchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        if not isinstance(value, datetime):
+            return False
+        return (schema.props.value is Nil) or (value == schema.props.value)
+
+    def visit_uuid4(self, schema: UUID4Schema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        if not isinstance(value, UUID) or (value.version != 4):
+            return False
+        return (schema.props.value is Nil) or (value == schema.props.value)
+
+    def visit_date(self, schema: DateSchema, *, value: Any = Nil, **kwargs: Any) -> bool:
+        if not isinstance(value, date):
+            return False
+        return (schema.props.value is Nil) or (value == schema.props.value)
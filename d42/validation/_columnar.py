@@ -0,0 +1,258 @@
+from importlib import import_module
+from itertools import compress, count, repeat
+from operator import contains, gt, itemgetter, lt, ne, not_
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, cast
+
+from niltype import Nil
+
+from d42.declaration import GenericSchema
+from d42.declaration.types import (
+    BoolSchema,
+    DictSchema,
+    FloatSchema,
+    IntSchema,
+    ListSchema,
+    NoneSchema,
+    StrSchema,
+)
+from d42.utils import compile_alphabet, compile_pattern, is_ellipsis, unwrap_alias
+
+from ._checker import Checker
+from ._path import Path
+from ._validation_result import ValidationResult
+from ._validator import Validator, _default_validator, _is_plain_validator
+from .errors import ExtraKeyValidationError, MissingKeyValidationError, ValidationError
+
+__all__ = ("validate_columnar",)
+
+try:
+    # Optional, numeric columns are compared with it when it's installed
+    _numpy: Any = import_module("numpy")
+except ImportError:
+    _numpy = None
+
+# Schemas whose columns are checked in bulk, and the types of their values
+_COLUMN_TYPES: Dict[Type[GenericSchema], Type[Any]] = {
+    NoneSchema: type(None),
+    BoolSchema: bool,
+    IntSchema: int,
+    FloatSchema: float,
+    StrSchema: str,
+}
+
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+# Ints a float64 holds exactly
+_FLOAT_EXACT_INT = 2 ** 53
+
+# Errors of a row: (rank of the key in the row, errors), ranks keep the
+# order `Validator.visit_dict` reports them in
+RowErrors = Dict[int, List[Tuple[int, List[ValidationError]]]]
+
+
+def _failing(values: Iterable[Any], op: Callable[[Any, Any], Any], operand: Any) -> Set[int]:
+    # Positions of `values` where `op(value, operand)` is true
+    return set(compress(count(), map(op, values, repeat(operand))))
+
+
+def _false_at(flags: Iterable[Any]) -> Set[int]:
+    return set(compress(count(), map(not_, flags)))
+
+
+def _is_exact(operand: Any, kind: str) -> bool:
+    # Whether NumPy compares `operand` with an array of `kind` without
+    # rounding either of them
+    if type(operand) is float:
+        return kind == "f"
+    if type(operand) is int:
+        if kind == "i":
+            return _INT64_MIN <= operand <= _INT64_MAX
+        return -_FLOAT_EXACT_INT <= operand <= _FLOAT_EXACT_INT
+    return False
+
+
+def _numeric_candidates(values: List[Any], props: Any) -> Set[int]:
+    # The same comparisons as `Validator.visit_int` and `visit_float`, over a
+    # whole column at once
+    operands = [x for x in (props.value, props.min, props.max) if x is not Nil]
+    if (_numpy is not None) and values:
+        array = _numpy.asarray(values)
+        kind = array.dtype.kind
+        # Ints beyond int64 make unsigned or object arrays, ints among floats
+        # are rounded to floats: those columns are compared one by one
+        if ((kind == "i") or ((kind == "f") and (set(map(type, values)) == {float}))) and \
+                all(_is_exact(operand, kind) for operand in operands):
+            mask = _numpy.zeros(len(values), dtype=bool)
+            if props.value is not Nil:
+                mask |= array != props.value
+            if props.min is not Nil:
+                mask |= array < props.min
+            if props.max is not Nil:
+                mask |= array > props.max
+            return set(_numpy.flatnonzero(mask).tolist())
+    candidates: Set[int] = set()
+    if props.value is not Nil:
+        candidates |= _failing(values, ne, props.value)
+    if props.min is not Nil:
+        candidates |= _failing(values, lt, props.min)
+    if props.max is not Nil:
+        candidates |= _failing(values, gt, props.max)
+    return candidates
+
+
+def _str_candidates(values: List[Any], props: Any) -> Set[int]:
+    # The same checks as `Validator.visit_str`, over a whole column at once
+    candidates: Set[int] = set()
+    if props.value is not Nil:
+        candidates |= _failing(values, ne, props.value)
+    if props.pattern is not Nil:
+        candidates |= _false_at(map(compile_pattern(props.pattern).search, values))
+    if (props.len is not Nil) or (props.min_len is not Nil) or (props.max_len is not Nil):
+        lengths = list(map(len, values))
+        if props.len is not Nil:
+            candidates |= _failing(lengths, ne, props.len)
+        if props.min_len is not Nil:
+            candidates |= _failing(lengths, lt, props.min_len)
+        if props.max_len is not Nil:
+            candidates |= _failing(lengths, gt, props.max_len)
+    if props.substr is not Nil:
+        candidates |= _false_at(map(contains, values, repeat(props.substr)))
+    if props.alphabet is not Nil:
+        candidates |= _false_at(map(compile_alphabet(props.alphabet), values))
+    return candidates
+
+
+def _column_candidates(schema: GenericSchema, values: List[Any]) -> Optional[List[int]]:
+    """
+    Return positions in the column that may be invalid, in order (the others
+    are valid), or None if the column can't be checked in bulk.
+    """
+    expected_type = _COLUMN_TYPES.get(type(schema))
+    if expected_type is None:
+        return None
+    props = schema.props
+    if isinstance(schema, FloatSchema) and (props.value is not Nil):
+        # Compared with a tolerance or a precision
+        return None
+
+    value_types = set(map(type, values))
+    bad_types = {t for t in value_types if not issubclass(t, expected_type)}
+    if bad_types:
+        mistyped = set(compress(count(), map(bad_types.__contains__, map(type, values))))
+        positions = [pos for pos in range(len(values)) if pos not in mistyped]
+        values = [values[pos] for pos in positions]
+    else:
+        mistyped = set()
+        positions = []
+
+    if isinstance(schema, (IntSchema, FloatSchema)):
+        candidates = _numeric_candidates(values, props)
+    elif isinstance(schema, StrSchema):
+        candidates = _str_candidates(values, props)
+    elif isinstance(schema, BoolSchema) and (props.value is not Nil):
+        candidates = _failing(values, ne, props.value)
+    else:
+        candidates = set()
+
+    if bad_types:
+        candidates = {positions[pos] for pos in candidates} | mistyped
+    return sorted(candidates)
+
+
+class _ColumnarWalker:
+    def __init__(self, validator: Validator) -> None:
+        self._validator = validator
+        self._checker = Checker(validator)
+
+    def validate_rows(self, schema: DictSchema, rows: List[Any], path: Path) -> RowErrors:
+        keys = cast(Dict[Any, Tuple[GenericSchema, bool]], schema.props.keys)
+        declared = [key for key in keys if not is_ellipsis(key)]
+        ranks = {key: rank for rank, key in enumerate(declared)}
+        required = {key for key in declared if not keys[key][1]}
+        is_closed = ... not in keys
+        declared_keys = set(declared)
+        row_errors: RowErrors = {}
+
+        # Rows that aren't dicts and key presence, with set operations
+        indexes: List[int] = []
+        dict_rows: List[Any] = []
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                error = self._validator._validate_type(path[index], row, dict)
+                row_errors[index] = [(0, [cast(ValidationError, error)])]
+                continue
+            indexes.append(index)
+            dict_rows.append(row)
+            row_keys = row.keys()
+            if missing := required - row_keys:
+                errors = row_errors.setdefault(index, [])
+                for key in missing:
+                    error = MissingKeyValidationError(path[index], row, key)
+                    errors.append((ranks[key], [error]))
+            if is_closed and (extra := row_keys - declared_keys):
+                # In the order of the row
+                extra_errors: List[ValidationError] = [
+                    ExtraKeyValidationError(path[index], row, key) for key in row if key in extra
+                ]
+                row_errors.setdefault(index, []).append((len(declared), extra_errors))
+
+        # Every key's column, transposed once
+        for key in declared:
+            try:
+                column = list(map(itemgetter(key), dict_rows))
+                column_indexes = indexes
+            except KeyError:
+                present = [pos for pos, row in enumerate(dict_rows) if key in row]
+                column = [dict_rows[pos][key] for pos in present]
+                column_indexes = [indexes[pos] for pos in present]
+            self._validate_column(keys[key][0], key, ranks[key], column, column_indexes, path,
+                                  row_errors)
+        return row_errors
+
+    def _validate_column(self, schema: GenericSchema, key: Any, rank: int, column: List[Any],
+                         indexes: List[int], path: Path, row_errors: RowErrors) -> None:
+        schema = unwrap_alias(schema)
+        candidates = _column_candidates(schema, column)
+        if candidates is None:
+            # Valid cells take the boolean fast path
+            candidates = [pos for pos, cell in enumerate(column)
+                          if not schema.__accept__(self._checker, value=cell)]
+        for pos in candidates:
+            index = indexes[pos]
+            res = schema.__accept__(self._validator, value=column[pos], path=path[index][key])
+            if res.has_errors():
+                row_errors.setdefault(index, []).append((rank, res.get_errors()))
+
+
+def validate_columnar(schema: GenericSchema, value: Any, *,
+                      validator: Optional[Validator] = None) -> ValidationResult:
+    """
+    Validate a list of records against `schema.list(schema.dict({...}))`
+    column by column.
+
+    Rows are transposed into a column per key once. Key presence is checked
+    with set operations, and columns of `none`, `bool`, `int`, `float` and
+    `str` values are checked in bulk, with NumPy for numbers when it's
+    installed. Only the cells that fail are validated one by one, so errors
+    get exact paths. The result is the one of `validate(schema, value)`.
+
+    Other schemas are validated as usual.
+    """
+    validator = validator or _default_validator
+    list_schema = unwrap_alias(schema)
+    row_schema: Optional[GenericSchema] = None
+    if isinstance(list_schema, ListSchema) and (list_schema.props.type is not Nil):
+        row_schema = unwrap_alias(list_schema.props.type)
+    if (not _is_plain_validator(validator)
+            or not isinstance(row_schema, DictSchema) or (row_schema.props.keys is Nil)):
+        return schema.__accept__(validator, value=value)
+
+    result = validator.make_validation_result()
+    path = validator._as_path(Nil)
+    if error := validator._validate_list_props(cast(ListSchema, list_schema), path, value):
+        return result.add_error(error)
+
+    row_errors = _ColumnarWalker(validator).validate_rows(row_schema, value, path)
+    for index in sorted(row_errors):
+        for _, errors in sorted(row_errors[index], key=itemgetter(0)):
+            result.add_errors(errors)
+    return result
@@ -0,0 +1,494 @@
+from datetime import date, datetime
+from math import isclose
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from uuid import UUID
+
+from niltype import Nil, Nilable
+
+from d42.declaration import GenericSchema, SchemaVisitor
+from d42.declaration.types import (
+    AnySchema,
+    BoolSchema,
+    BytesSchema,
+    DateSchema,
+    DateTimeSchema,
+    DictSchema,
+    FloatSchema,
+    GenericTypeAliasSchema,
+    IntSchema,
+    ListSchema,
+    NoneSchema,
+    RefSchema,
+    StrSchema,
+    TypeAliasPropsType,
+    UUID4Schema,
+)
+from d42.utils import (
+    closest_body,
+    compile_alphabet,
+    compile_pattern,
+    get_union_index,
+    is_ellipsis,
+    is_unique,
+    match_body,
+)
+
+from ._path import Path, PathLike
+from ._validation_result import ValidationResult
+from ._validator import Validator, _is_plain_validator
+from .errors import (
+    AlphabetValidationError,
+    ExtraElementValidationError,
+    ExtraKeyValidationError,
+    InvalidUUIDVersionValidationError,
+    LengthValidationError,
+    MaxLengthValidationError,
+    MaxValueValidationError,
+    MinLengthValidationError,
+    MinValueValidationError,
+    MissingElementValidationError,
+    MissingKeyValidationError,
+    RegexValidationError,
+    SchemaMismatchValidationError,
+    SubstrValidationError,
+    TypeValidationError,
+    UniqueValidationError,
+    ValidationError,
+    ValueValidationError,
+)
+
+__all__ = ("Compiler", "CompiledValidator", "CheckFn",)
+
+# A compiled check appends errors for `value` at `path` to the given list
+CheckFn = Callable[[Any, Path, List[ValidationError]], None]
+
+# A constraint returns an error if `value` at `path` violates it
+ConstraintFn = Callable[[Any, Path], Optional[ValidationError]]
+
+
+class CompiledValidator:
+    def __init__(self, schema: GenericSchema, check: CheckFn, validator: Validator) -> None:
+        self._schema = schema
+        self._check = check
+        self._validator = validator
+        self._metrics = validator.metrics
+
+    @property
+    def schema(self) -> GenericSchema:
+        return self._schema
+
+    def __call__(self, value: Any, *, path: Nilable[PathLike] = Nil) -> ValidationResult:
+        if self._metrics is None:
+            return self._validate(value, path)
+        started = perf_counter()
+        result = self._validate(value, path)
+        self._metrics.observe(self._schema, perf_counter() - started, result)
+        return result
+
+    def _validate(self, value: Any, path: Nilable[PathLike]) -> ValidationResult:
+        errors: List[ValidationError] = []
+        self._check(value, self._validator._as_path(path), errors)
+        return self._validator.make_validation_result().add_errors(errors)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._schema!r})"
+
+
+def _make_leaf_check(expected_type: Type[Any],
+                     terminal: List[ConstraintFn],
+                     accumulating: List[ConstraintFn]) -> CheckFn:
+    # Only declared constraints end up in the lists, so an unconstrained
+    # schema compiles down to a bare isinstance check
+    if not terminal and not accumulating:
+        def check_type(value: Any, path: Path, errors: List[ValidationError]) -> None:
+            if not isinstance(value, expected_type):
+                errors.append(TypeValidationError(path, value, expected_type))
+        return check_type
+
+    terminal_ = tuple(terminal)
+    accumulating_ = tuple(accumulating)
+
+    def check(value: Any, path: Path, errors: List[ValidationError]) -> None:
+        if not isinstance(value, expected_type):
+            errors.append(TypeValidationError(path, value, expected_type))
+            return
+        for constraint in terminal_:
+            if (error := constraint(value, path)) is not None:
+                errors.append(error)
+                return
+        for constraint in accumulating_:
+            if (error := constraint(value, path)) is not None:
+                errors.append(error)
+    return check
+
+
+def _make_value_constraint(expected: Any) -> ConstraintFn:
+    def constraint(value: Any, path: Path) -> Optional[ValidationError]:
+        if value != expected:
+            return ValueValidationError(path, value, expected)
+        return None
+    return constraint
+
+
+def _make_min_constraint(min_value: Any) -> ConstraintFn:
+    def constraint(value: Any, path: Path) -> Optional[ValidationError]:
+        if value < min_value:
+            return MinValueValidationError(path, value, min_value)
+        return None
+    return constraint
+
+
+def _make_max_constraint(max_value: Any) -> ConstraintFn:
+    def constraint(value: Any, path: Path) -> Optional[ValidationError]:
+        if value > max_value:
+            return MaxValueValidationError(path, value, max_value)
+        return None
+    return constraint
+
+
+def _make_len_constraints(length: Nilable[int],
+                          min_length: Nilable[int],
+                          max_length: Nilable[int]) -> List[ConstraintFn]:
+    constraints: List[ConstraintFn] = []
+
+    if length is not Nil:
+        def len_constraint(value: Any, path: Path) -> Optional[ValidationError]:
+            if len(value) != length:
+                return LengthValidationError(path, value, length)
+            return None
+        constraints.append(len_constraint)
+
+    if min_length is not Nil:
+        def min_len_constraint(value: Any, path: Path) -> Optional[ValidationError]:
+            if len(value) < min_length:
+                return MinLengthValidationError(path, value, min_length)
+            return None
+        constraints.append(min_len_constraint)
+
+    if max_length is not Nil:
+        def max_len_constraint(value: Any, path: Path) -> Optional[ValidationError]:
+            if len(value) > max_length:
+                return MaxLengthValidationError(path, value, max_length)
+            return None
+        constraints.append(max_len_constraint)
+
+    return constraints
+
+
+class Compiler(SchemaVisitor[CheckFn]):
+    def __init__(self, validator: Optional[Validator] = None) -> None:
+        validator = validator or Validator()
+        if not _is_plain_validator(validator):
+            raise ValueError(f"Expected a Validator without max_errors, got "
+                             f"{type(validator).__name__}(max_errors={validator.max_errors!r})")
+        self._validator = validator
+        # Checks of the aliases refs point to, compiled once: (alias, [check])
+        self._refs: Dict[int, Tuple[GenericSchema, List[CheckFn]]] = {}
+
+    @property
+    def validator(self) -> Validator:
+        return self._validator
+
+    def compile(self, schema: GenericSchema) -> CompiledValidator:
+        check = schema.__accept__(self)
+        return CompiledValidator(schema, check, self._validator)
+
+    def visit(self, schema: GenericSchema, **kwargs: Any) -> CheckFn:
+        # Custom types are validated by the regular validator
+        validator = self._validator
+        # The compiled validator observes the whole call, not its parts
+        extra = {"metered": True} if (validator.metrics is not None) else {}
+
+        def check(value: Any, path: Path, errors: List[ValidationError]) -> None:
+            result = schema.__accept__(validator, value=value, path=path, **extra)
+            errors.extend(result.get_errors())
+        return check
+
+    def visit_none(self, schema: NoneSchema, **kwargs: Any) -> CheckFn:
+        return _make_leaf_check(type(None), [], [])
+
+    def visit_bool(self, schema: BoolSchema, **kwargs: Any) -> CheckFn:
+        terminal: List[ConstraintFn] = []
+        if schema.props.value is not Nil:
+            terminal.append(_make_value_constraint(schema.props.value))
+        return _make_leaf_check(bool, terminal, [])
+
+    def visit_int(self, schema: IntSchema, **kwargs: Any) -> CheckFn:
+        terminal: List[ConstraintFn] = []
+        accumulating: List[ConstraintFn] = []
+        if schema.props.value is not Nil:
+            terminal.append(_make_value_constraint(schema.props.value))
+        if schema.props.min is not Nil:
+            accumulating.append(_make_min_constraint(schema.props.min))
+        if schema.props.max is not Nil:
+            accumulating.append(_make_max_constraint(schema.props.max))
+        return _make_leaf_check(int, terminal, accumulating)
+
+    def visit_float(self, schema: FloatSchema, **kwargs: Any) -> CheckFn:
+        terminal: List[ConstraintFn] = []
+        accumulating: List[ConstraintFn] = []
+
+        if schema.props.value is not Nil:
+            expected = schema.props.value
+            if schema.props.precision is Nil:
+                def value_constraint(value: Any, path: Path) -> Optional[ValidationError]:
+                    if not isclose(value, expected):
+                        return ValueValidationError(path, value, expected)
+                    return None
+            else:
+                scale_factor = 10 ** schema.props.precision
+                scaled_expected = round(expected * scale_factor)
+
+                def value_constraint(value: Any, path: Path) -> Optional[ValidationError]:
+                    scaled_actual = round(value * scale_factor)
+                    if not isclose(scaled_expected, scaled_actual, rel_tol=0, abs_tol=0):
+                        return ValueValidationError(path, value, expected)
+                    return None
+            terminal.append(value_constraint)
+
+        if schema.props.min is not Nil:
+            accumulating.append(_make_min_constraint(schema.props.min))
+        if schema.props.max is not Nil:
+            accumulating.append(_make_max_constraint(schema.props.max))
+        return _make_leaf_check(float, terminal, accumulating)
+
+    def visit_str(self, schema: StrSchema, **kwargs: Any) -> CheckFn:
+        terminal: List[ConstraintFn] = []
+        accumulating: List[ConstraintFn] = []
+
+        if schema.props.value is not Nil:
+            terminal.append(_make_value_constraint(schema.props.value))
+
+        if schema.props.pattern is not Nil:
+            pattern = schema.props.pattern
+            search = compile_pattern(pattern).search
+
+            def regex_constraint(value: Any, path: Path) -> Optional[ValidationError]:
+                if search(value) is None:
+                    return RegexValidationError(path, value, pattern)
+                return None
+            terminal.append(regex_constraint)
+
+        accumulating += _make_len_constraints(schema.props.len,
+                                              schema.props.min_len, schema.props.max_len)
+
+        if schema.props.substr is not Nil:
+            substr = schema.props.substr
+
+            def substr_constraint(value: Any, path: Path) -> Optional[ValidationError]:
+                if substr not in value:
+                    return SubstrValidationError(path, value, substr)
+                return None
+            accumulating.append(substr_constraint)
+
+        if schema.props.alphabet is not Nil:
+            alphabet = schema.props.alphabet
+            is_in_alphabet = compile_alphabet(alphabet)
+
+            # The alphabet check is the last one, so it's safe to accumulate it
+            def alphabet_constraint(value: Any, path: Path) -> Optional[ValidationError]:
+                if not is_in_alphabet(value):
+                    return AlphabetValidationError(path, value, alphabet)
+                return None
+            accumulating.append(alphabet_constraint)
+
+        return _make_leaf_check(str, terminal, accumulating)
+
+    def _compile_elements(self, elements: List[GenericSchema]
+                          ) -> Callable[[Any, Path, int], List[ValidationError]]:
+        checks = [element.__accept__(self) for element in elements]
+
+        def check_elements(value: Any, path: Path, start: int) -> List[ValidationError]:
+            errors: List[ValidationError] = []
+            for index, check in enumerate(checks):
+                real_index = start + index
+                if real_index >= len(value):
+                    errors.append(MissingElementValidationError(path, value, real_index))
+                    break
+                check(value[real_index], path[real_index], errors)
+            return errors
+        return check_elements
+
+    def visit_list(self, schema: ListSchema, **kwargs: Any) -> CheckFn:
+        constraints = _make_len_constraints(schema.props.len,
+                                            schema.props.min_len, schema.props.max_len)
+        if schema.props.unique:
+            def unique_constraint(value: Any, path: Path) -> Optional[ValidationError]:
+                if not is_unique(value):
+                    return UniqueValidationError(path, value)
+                return None
+            constraints.append(unique_constraint)
+
+        if schema.props.type is not Nil:
+            type_check = schema.props.type.__accept__(self)
+
+            def check_items(value: Any, path: Path, errors: List[ValidationError]) -> None:
+                for index, elem in enumerate(value):
+                    type_check(elem, path[index], errors)
+            return self._make_list_check(constraints, check_items)
+
+        if schema.props.elements is Nil:
+            return _make_leaf_check(list, constraints, [])
+
+        elements = schema.props.elements
+
+        # body
+        if (len(elements) > 2) and is_ellipsis(elements[0]) and is_ellipsis(elements[-1]):
+            body = elements[1:-1]
+            check_body = self._compile_elements(body)
+            is_valid = self._validator._is_valid
+
+            def check_items(value: Any, path: Path, errors: List[ValidationError]) -> None:
+                start = match_body(value, len(body), lambda i, elem: is_valid(body[i], elem))
+                if start < 0:
+                    # Explained where it has the fewest errors
+                    start = closest_body(value, lambda s: len(check_body(value, path, s)))
+                    errors += check_body(value, path, start)
+            return self._make_list_check(constraints, check_items)
+
+        # head
+        if (len(elements) >= 2) and is_ellipsis(elements[-1]):
+            check_head = self._compile_elements(elements[:-1])
+
+            def check_items(value: Any, path: Path, errors: List[ValidationError]) -> None:
+                errors += check_head(value, path, 0)
+            return self._make_list_check(constraints, check_items)
+
+        # tail
+        if (len(elements) >= 1) and is_ellipsis(elements[0]):
+            tail_len = len(elements) - 1
+            check_tail = self._compile_elements(elements[1:])
+
+            def check_items(value: Any, path: Path, errors: List[ValidationError]) -> None:
+                errors += check_tail(value, path, max(0, len(value) - tail_len))
+            return self._make_list_check(constraints, check_items)
+
+        elements_len = len(elements)
+        check_exact = self._compile_elements(elements)
+
+        def check_exact_items(value: Any, path: Path,
+                              errors: List[ValidationError]) -> None:
+            errors += check_exact(value, path, 0)
+            for index in range(elements_len, len(value)):
+                errors.append(ExtraElementValidationError(path, value, index))
+        return self._make_list_check(constraints, check_exact_items)
+
+    def _make_list_check(self, constraints: List[ConstraintFn], check_items: CheckFn) -> CheckFn:
+        constraints_ = tuple(constraints)
+
+        def check(value: Any, path: Path, errors: List[ValidationError]) -> None:
+            if not isinstance(value, list):
+                errors.append(TypeValidationError(path, value, list))
+                return
+            for constraint in constraints_:
+                if (error := constraint(value, path)) is not None:
+                    errors.append(error)
+                    return
+            check_items(value, path, errors)
+        return check
+
+    def visit_dict(self, schema: DictSchema, **kwargs: Any) -> CheckFn:
+        if schema.props.keys is Nil:
+            return _make_leaf_check(dict, [], [])
+
+        keys: List[Tuple[Any, CheckFn, bool]] = []
+        for key, (val, is_optional) in schema.props.keys.items():
+            if is_ellipsis(key):
+                continue
+            keys.append((key, val.__accept__(self), is_optional))
+
+        declared_keys: Dict[Any, Any] = schema.props.keys
+        is_strict = ... not in declared_keys
+
+        def check(value: Any, path: Path, errors: List[ValidationError]) -> None:
+            if not isinstance(value, dict):
+                errors.append(TypeValidationError(path, value, dict))
+                return
+            for key, check_key, is_optional in keys:
+                if key in value:
+                    check_key(value[key], path[key], errors)
+                elif not is_optional:
+                    errors.append(MissingKeyValidationError(path, value, key))
+            if is_strict:
+                for key in value:
+                    if key not in declared_keys:
+                        errors.append(ExtraKeyValidationError(path, value, key))
+        return check
+
+    def visit_any(self, schema: AnySchema, **kwargs: Any) -> CheckFn:
+        if schema.props.types is Nil:
+            def check_nothing(value: Any, path: Path, errors: List[ValidationError]) -> None:
+                pass
+            return check_nothing
+
+        types = schema.props.types
+        checks = tuple(sch_type.__accept__(self) for sch_type in types)
+        union_index = get_union_index(schema)
+
+        def check(value: Any, path: Path, errors: List[ValidationError]) -> None:
+            branch_errors: List[Optional[List[ValidationError]]] = [None] * len(checks)
+            for index in union_index.candidates(value):
+                schema_errors: List[ValidationError] = []
+                checks[index](value, path, schema_errors)
+                if not schema_errors:
+                    return
+                branch_errors[index] = schema_errors
+
+            all_errors: List[List[ValidationError]] = []
+            for index, check_type in enumerate(checks):
+                type_errors = branch_errors[index]
+                if type_errors is None:
+                    type_errors = []
+                    check_type(value, path, type_errors)
+                all_errors.append(type_errors)
+            errors.append(SchemaMismatchValidationError(path, value, types, all_errors))
+        return check
+
+    def visit_bytes(self, schema: BytesSchema, **kwargs: Any) -> CheckFn:
+        terminal: List[ConstraintFn] = []
+        if schema.props.value is not Nil:
+            terminal.append(_make_value_constraint(schema.props.value))
+        return _make_leaf_check(bytes, terminal, [])
+
+    def visit_type_alias(self, schema: GenericTypeAliasSchema[TypeAliasPropsType],
+                         **kwargs: Any) -> CheckFn:
+        if isinstance(schema, RefSchema):
+            return self._compile_ref(schema, **kwargs)
+        return schema.props.type.__accept__(self, **kwargs)
+
+    def _compile_ref(self, schema: RefSchema, **kwargs: Any) -> CheckFn:
+        # The alias may contain the ref itself, so its check is looked up when
+        # it's called, once the alias is compiled
+        target = schema.props.type
+        if (entry := self._refs.get(id(target))) is None:
+            entry = self._refs[id(target)] = (target, [])
+            entry[1].append(target.__accept__(self, **kwargs))
+        cell = entry[1]
+
+        def check(value: Any, path: Path, errors: List[ValidationError]) -> None:
+            cell[0](value, path, errors)
+        return check
+
+    def visit_datetime(self, schema: DateTimeSchema, **kwargs: Any) -> CheckFn:
+        terminal: List[ConstraintFn] = []
+        if schema.props.value is not Nil:
+            terminal.append(_make_value_constraint(schema.props.value))
+        return _make_leaf_check(datetime, terminal, [])
+
+    def visit_uuid4(self, schema: UUID4Schema, **kwargs: Any) -> CheckFn:
+        def version_constraint(value: Any, path: Path) -> Optional[ValidationError]:
+            if value.version != 4:
+                return InvalidUUIDVersionValidationError(path, value, value.version, 4)
+            return None
+
+        terminal: List[ConstraintFn] = [version_constraint]
+        if schema.props.value is not Nil:
+            terminal.append(_make_value_constraint(schema.props.value))
+        return _make_leaf_check(UUID, terminal, [])
+
+    def visit_date(self, schema: DateSchema, **kwargs: Any) -> CheckFn:
+        terminal: List[ConstraintFn] = []
+        if schema.props.value is not Nil:
+            terminal.append(_make_value_constraint(schema.props.value))
+        return _make_leaf_check(date, terminal, [])
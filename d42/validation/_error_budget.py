@@ -0,0 +1,86 @@
+from typing import Any, Dict
+
+from ._validation_result import ValidationResult
+
+__all__ = ("ErrorBudget",)
+
+
+class ErrorBudget:
+    """
+    Stops a validation once it has found `max_errors` errors.
+
+    A budget is shared by a whole traversal through the `error_budget`
+    keyword argument. Errors bubble up from children to their parents
+    unchanged, so when a child is done its parent charges all of the child's
+    errors at once, replacing whatever the child has charged on its own.
+
+    Nodes ask `should_stop` before each child or error they may skip, so the
+    budget knows whether the traversal actually stopped early.
+    """
+
+    __slots__ = ("_max_errors", "_spent", "_stopped",)
+
+    def __init__(self, max_errors: int) -> None:
+        if max_errors < 1:
+            raise ValueError(f"max_errors must be positive, got {max_errors!r}")
+        self._max_errors = max_errors
+        self._spent = 0
+        self._stopped = False
+
+    @property
+    def max_errors(self) -> int:
+        return self._max_errors
+
+    @property
+    def spent(self) -> int:
+        return self._spent
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    def is_exhausted(self) -> bool:
+        return self._spent >= self._max_errors
+
+    def should_stop(self) -> bool:
+        """
+        Tell whether to skip the rest of a node, ask only if something is left.
+        """
+        if self._spent >= self._max_errors:
+            self._stopped = True
+        return self._stopped
+
+    def spend(self, count: int = 1) -> bool:
+        """
+        Charge errors found by the current node, tell whether to stop.
+        """
+        self._spent += count
+        return self._spent >= self._max_errors
+
+    def charge(self, spent_before: int, count: int) -> bool:
+        """
+        Charge the `count` errors of a finished child, tell whether to stop.
+
+        :param spent_before: `spent` when the child was started.
+        """
+        self._spent = spent_before + count
+        return self._spent >= self._max_errors
+
+    def fork(self) -> "ErrorBudget":
+        # Errors of an `AnySchema` branch may be thrown away, so every branch
+        # gets a budget of its own
+        return self.__class__(self._max_errors)
+
+    def finish(self, result: ValidationResult) -> ValidationResult:
+        # Errors may have been skipped, or found past the budget (custom
+        # types don't stop)
+        if self._stopped or (len(result.get_errors()) > self._max_errors):
+            return result.truncate(self._max_errors)
+        return result
+
+
+def fork_budget(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    budget = kwargs.get("error_budget")
+    if budget is None:
+        return kwargs
+    return {**kwargs, "error_budget": budget.fork()}
@@ -5,6 +5,7 @@ from typing import Any, List, Optional, Sequence
 from th import PathHolder
 
 from ._abstract_formatter import AbstractFormatter
+from ._snapshot import ValueSnapshot
 from .errors import (
     AlphabetValidationError,
     ExtraElementValidationError,
@@ -43,6 +44,8 @@ class Formatter(AbstractFormatter):
         return " at " + self._format_path(path) if len(path) > 0 else ""
 
     def _get_type(self, value: Any) -> str:
+        if isinstance(value, ValueSnapshot):
+            return str(value.type)
         return str(type(value))
 
     def _pluralize(self, count: int, options: Sequence[str]) -> str:
@@ -0,0 +1,217 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
+
+from niltype import Nil
+
+from d42.declaration import GenericSchema
+from d42.declaration.types import DictSchema, ListSchema
+from d42.utils import is_ellipsis, unwrap_alias
+
+from ._path import KeysLike, Path, as_index, parse_pointer, to_keys
+from ._validation_result import ValidationResult
+from ._validator import Validator, _default_validator, _is_plain_validator
+from .errors import ExtraKeyValidationError, MissingKeyValidationError, ValidationError
+
+__all__ = ("validate_incremental", "validate_patch", "patch_paths",)
+
+# Keys of a value, from the root
+Keys = Tuple[Any, ...]
+
+# Trie of changed paths: key -> subtrie, or `_CHANGED`
+Trie = Dict[Any, Any]
+# A changed subtree is validated from scratch
+_CHANGED: Trie = cast(Trie, object())
+
+
+def _get_error_keys(error: ValidationError) -> Keys:
+    # The raw path, `error.path` would build a PathHolder
+    return tuple(to_keys(error._path))
+
+
+def _build_trie(changed_paths: Iterable[KeysLike]) -> Trie:
+    trie: Trie = {}
+    for changed_path in changed_paths:
+        keys = to_keys(changed_path)
+        if not keys:
+            return _CHANGED
+        node = trie
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+            if node is _CHANGED:
+                break
+        else:
+            node[keys[-1]] = _CHANGED
+    return trie
+
+
+def _group(errors: List[Tuple[Keys, ValidationError]],
+           depth: int) -> Dict[Any, List[Tuple[Keys, ValidationError]]]:
+    # Errors under a node grouped by the child they are in, in their order.
+    # Errors of the node itself are dropped, they are checked again
+    groups: Dict[Any, List[Tuple[Keys, ValidationError]]] = {}
+    for keys, error in errors:
+        if len(keys) > depth:
+            groups.setdefault(keys[depth], []).append((keys, error))
+    return groups
+
+
+class _IncrementalWalker:
+    def __init__(self, validator: Validator, result: ValidationResult) -> None:
+        self._validator = validator
+        self._result = result
+
+    def _keep(self, errors: List[Tuple[Keys, ValidationError]]) -> None:
+        self._result.add_errors([error for _, error in errors])
+
+    def walk(self, schema: GenericSchema, value: Any, path: Path, trie: Trie,
+             errors: List[Tuple[Keys, ValidationError]], depth: int) -> None:
+        schema = unwrap_alias(schema)
+
+        if trie is not _CHANGED:
+            if isinstance(schema, DictSchema) and (schema.props.keys is not Nil):
+                return self._walk_dict(schema, value, path, trie, errors, depth)
+            if isinstance(schema, ListSchema) and (schema.props.type is not Nil):
+                return self._walk_list(schema, value, path, trie, errors, depth)
+
+        # Changed, or no cheaper than validating from scratch (unions, tuples,
+        # custom types)
+        res = schema.__accept__(self._validator, value=value, path=path)
+        if res is not self._result:
+            self._result.add_errors(res.get_errors())
+
+    def _walk_dict(self, schema: DictSchema, value: Any, path: Path, trie: Trie,
+                   errors: List[Tuple[Keys, ValidationError]], depth: int) -> None:
+        # Mirrors `Validator.visit_dict`, unchanged keys keep their errors
+        if error := self._validator._validate_type(path, value, dict):
+            self._result.add_error(error)
+            return
+        groups = _group(errors, depth)
+        keys = cast(Dict[Any, Tuple[GenericSchema, bool]], schema.props.keys)
+
+        for key, (val, is_optional) in keys.items():
+            if is_ellipsis(key):
+                continue
+            if key in value:
+                if key in trie:
+                    self.walk(val, value[key], path[key], trie[key], groups.get(key, []),
+                              depth + 1)
+                else:
+                    self._keep(groups.get(key, []))
+            elif not is_optional:
+                self._result.add_error(MissingKeyValidationError(path, value, key))
+
+        if ... not in keys:
+            for key in value:
+                if key not in keys:
+                    self._result.add_error(ExtraKeyValidationError(path, value, key))
+
+    def _walk_list(self, schema: ListSchema, value: Any, path: Path, trie: Trie,
+                   errors: List[Tuple[Keys, ValidationError]], depth: int) -> None:
+        # Mirrors `Validator.visit_list` for `schema.list(T)`
+        if error := self._validator._validate_list_props(schema, path, value):
+            self._result.add_error(error)
+            return
+
+        changed: Dict[int, Trie] = {}
+        for key, subtrie in trie.items():
+            index = as_index(key)
+            if index is None:
+                # e.g. "-" (the end of the list) in a JSON Patch
+                return self.walk(schema, value, path, _CHANGED, errors, depth)
+            changed[index] = subtrie
+        groups = _group(errors, depth)
+
+        type_schema = cast(GenericSchema, schema.props.type)
+        indexes = set(changed) | {key for key in groups if isinstance(key, int)}
+        for index in sorted(indexes):
+            if index >= len(value):
+                continue
+            if index in changed:
+                self.walk(type_schema, value[index], path[index], changed[index],
+                          groups.get(index, []), depth + 1)
+            else:
+                self._keep(groups[index])
+
+
+def validate_incremental(schema: GenericSchema, value: Any,
+                         changed_paths: Iterable[KeysLike],
+                         previous: Optional[ValidationResult] = None, *,
+                         validator: Optional[Validator] = None) -> ValidationResult:
+    """
+    Validate `value` after a change, walking only the changed parts.
+
+    `previous` is the result for the value before the change (no errors if
+    omitted). Subtrees under `changed_paths` are validated from scratch, the
+    containers above them check their own constraints (type, length,
+    uniqueness, missing and extra keys) again, and everything else keeps its
+    previous errors. The result is the one of `validate(schema, value)`.
+    A truncated `previous` (see `max_errors`) misses errors, so with one the
+    whole value is validated again.
+
+    Changed paths are JSON Pointers ("/items/0/id"), `th` paths or sequences
+    of keys. Adding or removing list elements moves the ones after them, so
+    for such a change pass the path of the list itself (`validate_patch`
+    does that on its own).
+    """
+    validator = validator or _default_validator
+    if not _is_plain_validator(validator):
+        return schema.__accept__(validator, value=value)
+    if (previous is not None) and previous.is_truncated():
+        # Errors a budget stopped at are unknown, they can't be kept
+        return schema.__accept__(validator, value=value)
+
+    result = validator.make_validation_result()
+    previous_errors = previous.get_errors() if (previous is not None) else []
+    errors = [(_get_error_keys(error), error) for error in previous_errors]
+    walker = _IncrementalWalker(validator, result)
+    walker.walk(schema, value, validator._as_path(Nil), _build_trie(changed_paths), errors, 0)
+    return result
+
+
+def patch_paths(patch: Iterable[Dict[str, Any]], value: Any) -> List[List[Any]]:
+    """
+    Return the paths changed by RFC 6902 `patch` operations applied to `value`.
+    """
+    paths: List[List[Any]] = []
+    for operation in patch:
+        op = operation["op"]
+        if op == "test":
+            continue
+        targets = [operation["path"]]
+        if op == "move":
+            targets.append(operation["from"])
+        for target in targets:
+            keys = parse_pointer(target)
+            if (op in ("add", "remove", "move", "copy")) and keys:
+                # Elements after an added (or copied) or removed one move, so
+                # the whole list has changed
+                parent = _get_existing(value, keys[:-1])
+                if isinstance(parent, list):
+                    keys = keys[:-1]
+            paths.append(keys)
+    return paths
+
+
+def _get_existing(value: Any, keys: List[Any]) -> Any:
+    for key in keys:
+        if isinstance(value, list):
+            index = as_index(key)
+            if (index is None) or (index >= len(value)):
+                return None
+            value = value[index]
+        elif isinstance(value, dict) and (key in value):
+            value = value[key]
+        else:
+            return None
+    return value
+
+
+def validate_patch(schema: GenericSchema, value: Any, patch: Iterable[Dict[str, Any]],
+                   previous: Optional[ValidationResult] = None, *,
+                   validator: Optional[Validator] = None) -> ValidationResult:
+    """
+    Validate `value` after RFC 6902 `patch` has been applied to it.
+
+    See `validate_incremental`.
+    """
+    return validate_incremental(schema, value, patch_paths(patch, value), previous,
+                                validator=validator)
@@ -0,0 +1,216 @@
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from niltype import Nil
+
+from d42.declaration import GenericSchema
+from d42.declaration.types import AnySchema, DictSchema, GenericTypeAliasSchema, ListSchema
+from d42.utils import get_union_index, is_ellipsis
+
+from ._path import Path
+from ._validation_result import ValidationResult
+from ._validator import Validator, _default_validator, _is_plain_validator
+from .errors import (
+    ExtraElementValidationError,
+    ExtraKeyValidationError,
+    MissingElementValidationError,
+    MissingKeyValidationError,
+    SchemaMismatchValidationError,
+    ValidationError,
+)
+
+__all__ = ("validate_iterative",)
+
+# Work items: validate a value, report an error, or take the next step of
+# a union once its branch is validated
+_VISIT, _ERROR, _UNION = 0, 1, 2
+
+Item = Tuple[Any, ...]
+
+
+class _Union:
+    """
+    A union being validated: its branches are tried one by one, each into a
+    result of its own, in the order `Validator.visit_any` tries them.
+    """
+
+    __slots__ = ("types", "value", "path", "candidates", "position", "branch_errors",
+                 "explaining", "pending",)
+
+    def __init__(self, schema: AnySchema, value: Any, path: Path) -> None:
+        self.types = cast(Tuple[GenericSchema, ...], schema.props.types)
+        self.value = value
+        self.path = path
+        self.candidates = get_union_index(schema).candidates(value)
+        self.position = 0
+        self.branch_errors: List[Optional[List[ValidationError]]] = [None] * len(self.types)
+        # Nothing matched, the remaining branches are validated for errors
+        self.explaining = False
+        self.pending = -1
+
+    def next_branch(self) -> int:
+        if not self.explaining:
+            if self.position < len(self.candidates):
+                self.position += 1
+                return self.candidates[self.position - 1]
+            self.explaining = True
+            self.position = 0
+        while self.position < len(self.types):
+            self.position += 1
+            if self.branch_errors[self.position - 1] is None:
+                return self.position - 1
+        return -1
+
+    def make_error(self) -> ValidationError:
+        all_errors = [cast(List[ValidationError], errors) for errors in self.branch_errors]
+        return SchemaMismatchValidationError(self.path, self.value, self.types, all_errors)
+
+
+def _element_items(path: Path, value: List[Any], elements: List[GenericSchema],
+                   start: int = 0) -> List[Item]:
+    # Mirrors `Validator._validate_elements`
+    items: List[Item] = []
+    for index, element_schema in enumerate(elements):
+        real_index = start + index
+        if real_index >= len(value):
+            items.append((_ERROR, MissingElementValidationError(path, value, real_index)))
+            break
+        items.append((_VISIT, element_schema, value[real_index], path[real_index]))
+    return items
+
+
+def _has_body(schema: ListSchema) -> bool:
+    # `[..., body, ...]` takes trials to find the body, it's left to the validator
+    elements = schema.props.elements
+    return (elements is not Nil) and (len(elements) > 2) and \
+        is_ellipsis(elements[0]) and is_ellipsis(elements[-1])
+
+
+def _run(validator: Validator, schema: GenericSchema, value: Any,
+         leaf_kwargs: Dict[str, Any]) -> ValidationResult:
+    result = validator.make_validation_result()
+    # Results being filled: the one of the call and the ones of union branches
+    sinks = [result]
+    stack: List[Item] = [(_VISIT, schema, value, validator._as_path(Nil))]
+
+    while stack:
+        item = stack.pop()
+        op = item[0]
+
+        if op == _ERROR:
+            sinks[-1].add_error(item[1])
+            continue
+
+        if op == _UNION:
+            union: _Union = item[1]
+            if union.pending >= 0:
+                errors = sinks.pop().get_errors()
+                if not errors and not union.explaining:
+                    continue
+                union.branch_errors[union.pending] = errors
+            union.pending = union.next_branch()
+            if union.pending < 0:
+                sinks[-1].add_error(union.make_error())
+                continue
+            sinks.append(validator.make_validation_result())
+            stack.append(item)
+            stack.append((_VISIT, union.types[union.pending], union.value, union.path))
+            continue
+
+        _, sch, val, path = item
+        sink = sinks[-1]
+        # Items are pushed in reverse, so they are popped in the order
+        # `Validator` visits them in
+        if type(sch) is DictSchema:
+            # Mirrors `Validator.visit_dict`
+            if not isinstance(val, dict):
+                sink.add_error(cast(ValidationError, validator._validate_type(path, val, dict)))
+                continue
+            keys = sch.props.keys
+            if keys is Nil:
+                continue
+            items: List[Item] = []
+            for key, (key_schema, is_optional) in keys.items():
+                if is_ellipsis(key):
+                    continue
+                if key in val:
+                    items.append((_VISIT, key_schema, val[key], path[key]))
+                elif not is_optional:
+                    items.append((_ERROR, MissingKeyValidationError(path, val, key)))
+            if ... not in keys:
+                for key in val:
+                    if key not in keys:
+                        items.append((_ERROR, ExtraKeyValidationError(path, val, key)))
+            items.reverse()
+            stack.extend(items)
+
+        elif (type(sch) is ListSchema) and not _has_body(sch):
+            # Mirrors `Validator.visit_list`
+            props = sch.props
+            if error := validator._validate_list_props(sch, path, val):
+                sink.add_error(error)
+                continue
+            if props.type is not Nil:
+                type_schema = props.type
+                stack.extend([(_VISIT, type_schema, val[index], path[index])
+                              for index in range(len(val) - 1, -1, -1)])
+                continue
+            if props.elements is Nil:
+                continue
+            elements = props.elements
+            if (len(elements) >= 2) and is_ellipsis(elements[-1]):
+                items = _element_items(path, val, elements[:-1])
+            elif (len(elements) >= 1) and is_ellipsis(elements[0]):
+                tail = elements[1:]
+                items = _element_items(path, val, tail, max(0, len(val) - len(tail)))
+            else:
+                items = _element_items(path, val, elements)
+                for index in range(len(elements), len(val)):
+                    items.append((_ERROR, ExtraElementValidationError(path, val, index)))
+            items.reverse()
+            stack.extend(items)
+
+        elif type(sch) is AnySchema:
+            if sch.props.types is not Nil:
+                stack.append((_UNION, _Union(sch, val, path)))
+
+        elif isinstance(sch, GenericTypeAliasSchema):
+            stack.append((_VISIT, sch.props.type, val, path))
+
+        else:
+            # Scalars and custom types add their errors to the current result
+            res = sch.__accept__(validator, value=val, path=path, error_sink=sink,
+                                 **leaf_kwargs)
+            if res is not sink:
+                sink.add_errors(res.get_errors())
+
+    return result
+
+
+def validate_iterative(schema: GenericSchema, value: Any, *,
+                       validator: Optional[Validator] = None) -> ValidationResult:
+    """
+    Validate `value` with an explicit work stack instead of recursion.
+
+    Dicts, lists, unions and aliases are walked in a loop, so the depth of a
+    value is not limited by `sys.getrecursionlimit()` and no Python frame is
+    entered per nesting level. Scalars are validated by the validator, custom
+    types and `[..., body, ...]` lists too (they may recurse on their own).
+    The result is the one of `validate(schema, value)`.
+
+    Subclasses of `Validator` may change what is valid and an error budget
+    (`max_errors`) changes where the traversal stops, so with such a
+    validator the validation is left to it.
+    """
+    validator = validator or _default_validator
+    if not _is_plain_validator(validator):
+        return schema.__accept__(validator, value=value)
+
+    metrics = validator.metrics
+    if metrics is None:
+        return _run(validator, schema, value, {})
+    # Nodes are visited one by one, so the whole call is observed here
+    started = perf_counter()
+    result = _run(validator, schema, value, {"metered": True})
+    metrics.observe(schema, perf_counter() - started, result)
+    return result
@@ -0,0 +1,318 @@
+import json
+import re
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from niltype import Nil
+
+from d42.declaration import GenericSchema, SchemaVisitor
+from d42.declaration.types import (
+    AnySchema,
+    BoolSchema,
+    BytesSchema,
+    DateSchema,
+    DateTimeSchema,
+    DictSchema,
+    FloatSchema,
+    GenericTypeAliasSchema,
+    IntSchema,
+    ListSchema,
+    NoneSchema,
+    StrSchema,
+    TypeAliasPropsType,
+    UUID4Schema,
+)
+from d42.utils import is_ellipsis
+
+from ._checker import Checker
+
+__all__ = ("JsonChecker", "JsonMismatch",)
+
+# (value, end position), the value is Nil unless the checker materializes
+Scanned = Tuple[Any, int]
+
+_WS = r"[ \t\n\r]*"
+_STRING = r'"(?:[^"\\\x00-\x1f]|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))*"'
+_LITERAL = r"(?:true|false|null|NaN|Infinity|-Infinity)"
+_NUMBER = r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?"
+_SCALAR = f"(?:{_STRING}|{_LITERAL}|{_NUMBER})"
+_MEMBER = f"{_STRING}{_WS}:{_WS}{_SCALAR}"
+
+_WHITESPACE = re.compile(_WS)
+_TOKEN = re.compile(f"""{_WS}(?:
+    (?P<string>{_STRING})
+  | (?P<literal>{_LITERAL})
+  | (?P<number>{_NUMBER})
+  | (?P<open>[{{\\[])
+  | (?P<close>[}}\\]])
+  | (?P<comma>,)
+  | (?P<colon>:)
+)""", re.VERBOSE)
+# A scalar, or a container of scalars only, in a single C-level match
+_FLAT_VALUE = re.compile(
+    f"{_WS}(?:{_SCALAR}"
+    f"|\\{{{_WS}(?:{_MEMBER}{_WS}(?:,{_WS}{_MEMBER}{_WS})*)?\\}}"
+    f"|\\[{_WS}(?:{_SCALAR}{_WS}(?:,{_WS}{_SCALAR}{_WS})*)?\\])"
+)
+
+# States of `_skip_value`: which tokens are allowed next
+_VALUE, _VALUE_OR_END, _KEY, _KEY_OR_END, _COLON, _NEXT = range(6)
+
+
+class JsonMismatch(Exception):
+    """
+    Raised when JSON text doesn't match the schema, or is not valid JSON.
+    """
+
+
+def _skip_value(text: str, pos: int) -> int:
+    # Finds where the JSON value at `pos` ends, checking its syntax but
+    # building no Python objects
+    closers: List[str] = []
+    state = _VALUE
+    while True:
+        if state in (_VALUE, _VALUE_OR_END):
+            flat = _FLAT_VALUE.match(text, pos)
+            if flat is not None:
+                pos = flat.end()
+                if not closers:
+                    return pos
+                state = _NEXT
+                continue
+
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            raise JsonMismatch()
+        pos, token, char = match.end(), match.lastgroup, text[match.end() - 1]
+
+        if (token == "close") and (state in (_VALUE_OR_END, _KEY_OR_END, _NEXT)) and \
+           (closers[-1] == char):
+            closers.pop()
+        elif (token in ("string", "literal", "number")) and (state in (_VALUE, _VALUE_OR_END)):
+            pass
+        elif (token == "open") and (state in (_VALUE, _VALUE_OR_END)):
+            closers.append("}" if char == "{" else "]")
+            state = _KEY_OR_END if (char == "{") else _VALUE_OR_END
+            continue
+        elif (token == "string") and (state in (_KEY, _KEY_OR_END)):
+            state = _COLON
+            continue
+        elif (token == "colon") and (state == _COLON):
+            state = _VALUE
+            continue
+        elif (token == "comma") and (state == _NEXT):
+            state = _KEY if (closers[-1] == "}") else _VALUE
+            continue
+        else:
+            raise JsonMismatch()
+
+        # A value is complete
+        if not closers:
+            return pos
+        state = _NEXT
+
+
+class JsonChecker(SchemaVisitor[Scanned]):
+    """
+    Checks JSON text against a schema without decoding it first.
+
+    Dicts and `schema.list(T)` lists are walked token by token, scalars are
+    decoded by the C scanner of `json` and checked by `Checker`, and values
+    under `...` keys are skipped without being built. Any mismatch (or
+    invalid JSON) raises `JsonMismatch`; callers are expected to decode the
+    text and run `Validator` to explain it.
+
+    With `materialize=True`, the decoded value is returned along with the
+    end position, so a single pass both checks and decodes.
+    """
+
+    def __init__(self, checker: Optional[Checker] = None, *, materialize: bool = False) -> None:
+        self._checker = checker or Checker()
+        self._materialize = materialize
+        self._decoder = json.JSONDecoder()
+
+    @property
+    def checker(self) -> Checker:
+        return self._checker
+
+    def _skip_whitespace(self, text: str, pos: int) -> int:
+        return _WHITESPACE.match(text, pos).end()  # type: ignore[union-attr]
+
+    def _decode(self, text: str, pos: int) -> Scanned:
+        try:
+            return self._decoder.raw_decode(text, pos)
+        except ValueError:
+            raise JsonMismatch() from None
+
+    def _skip(self, text: str, pos: int) -> Scanned:
+        if self._materialize:
+            return self._decode(text, pos)
+        return Nil, _skip_value(text, pos)
+
+    def _check_decoded(self, schema: GenericSchema, text: str, pos: int) -> Scanned:
+        value, end = self._decode(text, pos)
+        if not schema.__accept__(self._checker, value=value):
+            raise JsonMismatch()
+        return value, end
+
+    def check(self, schema: GenericSchema, text: str) -> Any:
+        """
+        Check the whole `text` against `schema`.
+
+        :return: The decoded value if materializing, Nil otherwise.
+        :raises JsonMismatch: If `text` is not valid JSON or doesn't match `schema`.
+        """
+        value, end = schema.__accept__(self, text=text, pos=self._skip_whitespace(text, 0))
+        if self._skip_whitespace(text, end) != len(text):
+            raise JsonMismatch()
+        return value
+
+    def visit(self, schema: GenericSchema, *, text: str = "", pos: int = 0,
+              **kwargs: Any) -> Scanned:
+        return self._check_decoded(schema, text, pos)
+
+    def visit_none(self, schema: NoneSchema, *, text: str = "", pos: int = 0,
+                   **kwargs: Any) -> Scanned:
+        return self._check_decoded(schema, text, pos)
+
+    def visit_bool(self, schema: BoolSchema, *, text: str = "", pos: int = 0,
+                   **kwargs: Any) -> Scanned:
+        return self._check_decoded(schema, text, pos)
+
+    def visit_int(self, schema: IntSchema, *, text: str = "", pos: int = 0,
+                  **kwargs: Any) -> Scanned:
+        return self._check_decoded(schema, text, pos)
+
+    def visit_float(self, schema: FloatSchema, *, text: str = "", pos: int = 0,
+                    **kwargs: Any) -> Scanned:
+        return self._check_decoded(schema, text, pos)
+
+    def visit_str(self, schema: StrSchema, *, text: str = "", pos: int = 0,
+                  **kwargs: Any) -> Scanned:
+        return self._check_decoded(schema, text, pos)
+
+    def visit_list(self, schema: ListSchema, *, text: str = "", pos: int = 0,
+                   **kwargs: Any) -> Scanned:
+        props = schema.props
+        if (props.elements is not Nil) or props.unique:
+            # Element patterns and uniqueness need the whole list anyway
+            return self._check_decoded(schema, text, pos)
+        if text[pos:pos + 1] != "[":
+            raise JsonMismatch()
+        if (props.type is Nil) and (props.len is Nil) and \
+           (props.min_len is Nil) and (props.max_len is Nil):
+            return self._skip(text, pos)
+
+        items: List[Any] = []
+        count = 0
+        pos = self._skip_whitespace(text, pos + 1)
+        if text[pos:pos + 1] == "]":
+            pos += 1
+        else:
+            while True:
+                if props.type is Nil:
+                    item, pos = self._skip(text, pos)
+                else:
+                    item, pos = props.type.__accept__(self, text=text, pos=pos)
+                if self._materialize:
+                    items.append(item)
+                count += 1
+                pos = self._skip_whitespace(text, pos)
+                char = text[pos:pos + 1]
+                if char == "]":
+                    pos += 1
+                    break
+                if char != ",":
+                    raise JsonMismatch()
+                pos = self._skip_whitespace(text, pos + 1)
+
+        if (props.len is not Nil) and (count != props.len):
+            raise JsonMismatch()
+        if (props.min_len is not Nil) and (count < props.min_len):
+            raise JsonMismatch()
+        if (props.max_len is not Nil) and (count > props.max_len):
+            raise JsonMismatch()
+        return (items if self._materialize else Nil), pos
+
+    def visit_dict(self, schema: DictSchema, *, text: str = "", pos: int = 0,
+                   **kwargs: Any) -> Scanned:
+        if text[pos:pos + 1] != "{":
+            raise JsonMismatch()
+        keys = schema.props.keys
+        if keys is Nil:
+            return self._skip(text, pos)
+        is_strict = ... not in keys
+
+        result: Dict[str, Any] = {}
+        seen: Set[str] = set()
+        pos = self._skip_whitespace(text, pos + 1)
+        if text[pos:pos + 1] == "}":
+            pos += 1
+        else:
+            while True:
+                if text[pos:pos + 1] != "\"":
+                    raise JsonMismatch()
+                try:
+                    key, pos = scanstring(text, pos + 1)
+                except ValueError:
+                    raise JsonMismatch() from None
+                if key in seen:
+                    # json keeps the last value of a duplicate key, let it decide
+                    raise JsonMismatch()
+                seen.add(key)
+
+                pos = self._skip_whitespace(text, pos)
+                if text[pos:pos + 1] != ":":
+                    raise JsonMismatch()
+                pos = self._skip_whitespace(text, pos + 1)
+
+                if key in keys:
+                    val, _ = keys[key]
+                    item, pos = val.__accept__(self, text=text, pos=pos)
+                elif is_strict:
+                    raise JsonMismatch()
+                else:
+                    item, pos = self._skip(text, pos)
+                if self._materialize:
+                    result[key] = item
+
+                pos = self._skip_whitespace(text, pos)
+                char = text[pos:pos + 1]
+                if char == "}":
+                    pos += 1
+                    break
+                if char != ",":
+                    raise JsonMismatch()
+                pos = self._skip_whitespace(text, pos + 1)
+
+        for key, (_, is_optional) in keys.items():
+            if not is_ellipsis(key) and not is_optional and (key not in seen):
+                raise JsonMismatch()
+        return (result if self._materialize else Nil), pos
+
+    def visit_any(self, schema: AnySchema, *, text: str = "", pos: int = 0,
+                  **kwargs: Any) -> Scanned:
+        if schema.props.types is Nil:
+            return self._skip(text, pos)
+        return self._check_decoded(schema, text, pos)
+
+    def visit_bytes(self, schema: BytesSchema, *, text: str = "", pos: int = 0,
+                    **kwargs: Any) -> Scanned:
+        # JSON has no bytes
+        raise JsonMismatch()
+
+    def visit_type_alias(self, schema: GenericTypeAliasSchema[TypeAliasPropsType], *,
+                         text: str = "", pos: int = 0, **kwargs: Any) -> Scanned:
+        return schema.props.type.__accept__(self, text=text, pos=pos, **kwargs)
+
+    def visit_datetime(self, schema: DateTimeSchema, *, text: str = "", pos: int = 0,
+                       **kwargs: Any) -> Scanned:
+        raise JsonMismatch()
+
+    def visit_uuid4(self, schema: UUID4Schema, *, text: str = "", pos: int = 0,
+                    **kwargs: Any) -> Scanned:
+        raise JsonMismatch()
+
+    def visit_date(self, schema: DateSchema, *, text: str = "", pos: int = 0,
+                   **kwargs: Any) -> Scanned:
+        raise JsonMismatch()
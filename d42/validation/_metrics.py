@@ -0,0 +1,235 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import OrderedDict
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from d42.declaration import GenericSchema
+
+from ._path import PathLike, path_keys
+from ._validation_result import ValidationResult
+
+__all__ = ("MetricsSink", "InMemoryMetrics", "SchemaMetrics", "Histogram", "path_template",
+           "set_metrics_sink", "get_metrics_sink", "meter", "LATENCY_BUCKETS",)
+
+# Upper bounds of latency buckets, in seconds
+LATENCY_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6,
+    1e-5, 2.5e-5, 5e-5,
+    1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0,
+)
+
+MetricsCallback = Callable[[GenericSchema, float, ValidationResult], None]
+
+_metrics_sink: Optional["MetricsSink"] = None
+
+
+class MetricsSink(ABC):
+    """
+    Receives one observation per validation: the validated schema, how long
+    the validation took (in seconds) and its result.
+    """
+
+    @abstractmethod
+    def observe(self, schema: GenericSchema, elapsed: float, result: ValidationResult) -> None:
+        pass
+
+
+def path_template(path: PathLike) -> str:
+    """
+    Return the path with list indexes collapsed, e.g. `_['items'][*]['id']`.
+
+    Unlike paths, templates don't grow with the size of values, so they can
+    label metrics.
+    """
+    # Bools are ints too, but never list indexes
+    return "_" + "".join(["[*]" if (type(key) is int) else f"[{key!r}]"
+                          for key in path_keys(path)])
+
+
+class Histogram:
+    """
+    Counts observations in fixed buckets, so quantiles are estimated in
+    constant memory. A quantile is reported as the upper bound of the bucket
+    it falls in.
+    """
+
+    __slots__ = ("_bounds", "_counts", "_count", "_sum", "_max",)
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self._bounds = tuple(bounds)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+        if value > self._max:
+            self._max = value
+
+    def quantile(self, q: float) -> float:
+        if not (0 <= q <= 1):
+            raise ValueError(f"q must be in [0, 1], got {q!r}")
+        if self._count == 0:
+            return 0.0
+        rank = q * self._count
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if (seen >= rank) and (count > 0):
+                if index < len(self._bounds):
+                    return min(self._bounds[index], self._max)
+                return self._max
+        return self._max
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        Return `(upper bound, cumulative count)` pairs, the last bound is `inf`.
+        """
+        pairs = []
+        seen = 0
+        for bound, count in zip(self._bounds + (float("inf"),), self._counts):
+            seen += count
+            pairs.append((bound, seen))
+        return pairs
+
+
+class SchemaMetrics:
+    """
+    What `InMemoryMetrics` has seen for one schema.
+
+    `errors` counts errors by `(error class name, path template)`.
+    """
+
+    __slots__ = ("calls", "failures", "latency", "errors",)
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.latency = Histogram(buckets)
+        self.errors: Dict[Tuple[str, str], int] = {}
+
+    def __repr__(self) -> str:
+        return (f"<{self.__class__.__name__} calls={self.calls} failures={self.failures} "
+                f"p50={self.latency.quantile(0.5)} p99={self.latency.quantile(0.99)}>")
+
+
+class InMemoryMetrics(MetricsSink):
+    """
+    Counts validations, failures and errors, and keeps a latency histogram
+    per schema.
+
+    Schemas are matched by `schema_fingerprint`, so schemas declared the same
+    way (e.g. rebuilt on every request) share their metrics. The least
+    recently observed schemas are dropped once there are more than `maxsize`
+    of them.
+
+    :param callback: Called with every observation after it's counted, for
+                     instance to feed an exporter.
+    """
+
+    def __init__(self, callback: Optional[MetricsCallback] = None, *,
+                 buckets: Sequence[float] = LATENCY_BUCKETS, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize!r}")
+        self._callback = callback
+        self._buckets = tuple(buckets)
+        self._maxsize = maxsize
+        # schema fingerprint -> (first schema observed, metrics)
+        self._schemas: "OrderedDict[Hashable, Tuple[GenericSchema, SchemaMetrics]]"
+        self._schemas = OrderedDict()
+        self._lock = Lock()
+
+    def observe(self, schema: GenericSchema, elapsed: float, result: ValidationResult) -> None:
+        errors = result.get_errors()
+        key = _fingerprint(schema)
+        with self._lock:
+            entry = self._schemas.get(key)
+            if entry is None:
+                entry = self._schemas[key] = (schema, SchemaMetrics(self._buckets))
+                if len(self._schemas) > self._maxsize:
+                    self._schemas.popitem(last=False)
+            else:
+                self._schemas.move_to_end(key)
+            metrics = entry[1]
+            metrics.calls += 1
+            metrics.latency.observe(elapsed)
+            if errors:
+                metrics.failures += 1
+                for error in errors:
+                    # The raw path, `error.path` would build a PathHolder
+                    error_key = (type(error).__name__, path_template(error._path))
+                    metrics.errors[error_key] = metrics.errors.get(error_key, 0) + 1
+        if self._callback is not None:
+            self._callback(schema, elapsed, result)
+
+    def get(self, schema: GenericSchema) -> SchemaMetrics:
+        entry = self._schemas.get(_fingerprint(schema))
+        return entry[1] if (entry is not None) else SchemaMetrics(self._buckets)
+
+    def items(self) -> List[Tuple[GenericSchema, SchemaMetrics]]:
+        with self._lock:
+            return list(self._schemas.values())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+
+def _fingerprint(schema: GenericSchema) -> Hashable:
+    from ._cache import schema_fingerprint  # circular import
+    return schema_fingerprint(schema)
+
+
+def set_metrics_sink(sink: Optional[MetricsSink]) -> None:
+    """
+    Make `validate` report to `sink` when no sink is passed, `None` turns
+    the reporting off.
+    """
+    global _metrics_sink
+    _metrics_sink = sink
+
+
+def get_metrics_sink() -> Optional[MetricsSink]:
+    return _metrics_sink
+
+
+def meter(visit: Callable[..., ValidationResult],
+          metrics: MetricsSink) -> Callable[..., ValidationResult]:
+    """
+    Wrap a visit method so that its outermost calls are observed by `metrics`.
+
+    Nested calls are told apart by the `metered` keyword argument that the
+    outermost call passes down along with the other ones.
+    """
+    def metered(schema: GenericSchema, **kwargs: Any) -> ValidationResult:
+        if "metered" in kwargs:
+            return visit(schema, **kwargs)
+        started = perf_counter()
+        result = visit(schema, metered=True, **kwargs)
+        metrics.observe(schema, perf_counter() - started, result)
+        return result
+    return metered
@@ -0,0 +1,124 @@
+from copy import deepcopy
+from typing import Any, Dict, Generator, List, Optional, Sequence, Union
+
+from th import PathHolder
+
+__all__ = ("Path", "PathLike", "KeysLike", "to_path_holder", "path_keys", "parse_pointer",
+           "to_keys", "as_index",)
+
+
+class Path:
+    """
+    Immutable path to a value, stored as a parent pointer plus the last key.
+
+    Extending a path is O(1) and never copies its parents, so validators can
+    hand a fresh path to every element of a container for free. A `Path` is
+    turned into a `th.PathHolder` (see `to_path_holder`) only when an error
+    actually needs it.
+    """
+
+    __slots__ = ("_holder", "_parent", "_key", "_depth",)
+
+    def __init__(self, holder: Optional[PathHolder] = None) -> None:
+        self._holder = holder if (holder is not None) else PathHolder()
+        self._parent: Optional[Path] = None
+        self._key: Any = None
+        self._depth = 0
+
+    @property
+    def holder(self) -> PathHolder:
+        return self._holder
+
+    def keys(self) -> List[Any]:
+        keys = []
+        node: Optional[Path] = self
+        while (node is not None) and (node._parent is not None):
+            keys.append(node._key)
+            node = node._parent
+        keys.reverse()
+        return keys
+
+    def to_path_holder(self) -> PathHolder:
+        holder = deepcopy(self._holder)
+        for key in self.keys():
+            holder = holder[key]
+        return holder
+
+    def __getitem__(self, key: Any) -> "Path":
+        child = self.__class__.__new__(self.__class__)
+        child._holder = self._holder
+        child._parent = self
+        child._key = key
+        child._depth = self._depth + 1
+        return child
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        yield from self.to_path_holder()
+
+    def __len__(self) -> int:
+        return len(self._holder) + self._depth
+
+    def __copy__(self) -> "Path":
+        return self
+
+    def __deepcopy__(self, memo: Optional[Dict[Any, Any]] = None) -> "Path":
+        return self
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Path):
+            other = other.to_path_holder()
+        return bool(self.to_path_holder() == other)
+
+    def __repr__(self) -> str:
+        return repr(self.to_path_holder())
+
+
+PathLike = Union[PathHolder, Path]
+
+
+def to_path_holder(path: PathLike) -> PathHolder:
+    return path.to_path_holder() if isinstance(path, Path) else path
+
+
+def path_keys(path: PathLike) -> List[Any]:
+    """
+    Return the keys a path is made of, from the root.
+    """
+    if isinstance(path, Path):
+        keys = path.keys()
+        if len(path.holder) > 0:
+            keys = [op.operand for op in path.holder] + keys
+        return keys
+    return [op.operand for op in path]
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """
+    Split an RFC 6901 JSON Pointer into keys, e.g. "/items/0" -> ["items", "0"].
+    """
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"JSON Pointer must start with '/', got {pointer!r}")
+    return [part.replace("~1", "/").replace("~0", "~") for part in pointer[1:].split("/")]
+
+
+# A path, a JSON Pointer or keys
+KeysLike = Union[PathLike, str, Sequence[Any]]
+
+
+def to_keys(path: KeysLike) -> List[Any]:
+    if isinstance(path, str):
+        return parse_pointer(path)
+    if isinstance(path, (Path, PathHolder)):
+        return path_keys(path)
+    return list(path)
+
+
+def as_index(key: Any) -> Optional[int]:
+    # JSON Pointers name list elements with strings
+    if isinstance(key, int) and not isinstance(key, bool):
+        return key
+    if isinstance(key, str) and key.isdigit():
+        return int(key)
+    return None
@@ -0,0 +1,150 @@
+from collections.abc import Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from datetime import date
+from typing import Any, List, Optional, Tuple, Type
+from uuid import UUID
+
+__all__ = ("ValueSnapshot", "set_value_snapshots", "value_snapshots_enabled",)
+
+# Values that are small and immutable enough to be kept as they are
+_SCALAR_TYPES = (type(None), bool, int, float, date, UUID)
+
+# Reprs that show the items of a container only, and the ones of sets
+_PLAIN_REPRS: Tuple[Any, ...] = (list.__repr__, tuple.__repr__, dict.__repr__)
+_SET_REPRS: Tuple[Any, ...] = (set.__repr__, frozenset.__repr__)
+
+_value_snapshots = False
+
+
+def _bounded_repr(value: Any, limit: int) -> str:
+    """
+    Return `repr(value)`, or its start once it's longer than `limit`
+    characters: containers (mappings, sets and sequences) are only walked
+    that far and strings only cut that far, so the cost doesn't depend on
+    the size of the value.
+
+    Containers with a repr of their own (e.g. `OrderedDict`, `deque`) are
+    shown as their type name around their items, like `deque([1, 2])`.
+    """
+    parts: List[str] = []
+    size = 0
+
+    def add(text: str) -> bool:
+        # False once the limit is passed
+        nonlocal size
+        parts.append(text)
+        size += len(text)
+        return size <= limit
+
+    def walk(val: Any) -> bool:
+        if isinstance(val, (str, bytes, bytearray)):
+            if len(val) <= limit:
+                return add(repr(val))
+            # Slices of subclasses are plain strings and bytes
+            head = val[:limit + 1]
+            if type(val).__repr__ is type(head).__repr__:
+                return add(repr(head))
+            return add(f"{type(val).__name__}(") and add(repr(head)) and add(")")
+        if isinstance(val, (range, memoryview)) or \
+                not isinstance(val, (Mapping, AbstractSet, Sequence)):
+            return add(repr(val))
+
+        val_repr = type(val).__repr__
+        if val_repr in _SET_REPRS:
+            # `{1}`, `set()`, `frozenset({1})`, `frozenset()`
+            wrapped = type(val) is not set
+            if not val:
+                return add(f"{type(val).__name__}()")
+        else:
+            wrapped = val_repr not in _PLAIN_REPRS
+        if wrapped and not add(f"{type(val).__name__}("):
+            return False
+
+        if isinstance(val, Mapping):
+            if not add("{"):
+                return False
+            for index, (key, item) in enumerate(val.items()):
+                if (index and not add(", ")) or not walk(key) or not add(": ") \
+                        or not walk(item):
+                    return False
+            closing = "}"
+        else:
+            is_tuple = isinstance(val, tuple)
+            opening, closing = ("{", "}") if isinstance(val, AbstractSet) else \
+                ("(", ")") if is_tuple else ("[", "]")
+            if not add(opening):
+                return False
+            for index, item in enumerate(val):
+                if (index and not add(", ")) or not walk(item):
+                    return False
+            if is_tuple and (len(val) == 1) and not add(","):
+                return False
+        return add(closing) and (not wrapped or add(")"))
+
+    walk(value)
+    return "".join(parts)
+
+
+class ValueSnapshot:
+    """
+    A bounded stand-in for a value referenced by a validation error.
+
+    Keeps the type, the length (for sized values) and a repr cut to
+    `MAX_REPR` characters, so that an error doesn't keep a whole payload
+    alive. Formatters treat it as the value itself: `repr()` and `len()`
+    give the ones of the original value.
+    """
+
+    __slots__ = ("type", "length", "repr",)
+
+    MAX_REPR = 200
+
+    def __init__(self, type_: Type[Any], length: Optional[int], repr_: str) -> None:
+        self.type = type_
+        self.length = length
+        self.repr = repr_
+
+    @classmethod
+    def capture(cls, value: Any, max_repr: Optional[int] = None) -> Any:
+        """
+        Return a snapshot of `value`, or `value` itself if it's cheap to keep.
+        """
+        max_repr = max_repr if (max_repr is not None) else cls.MAX_REPR
+        if isinstance(value, (cls, *_SCALAR_TYPES)):
+            return value
+        if isinstance(value, (str, bytes)) and (len(value) <= max_repr):
+            return value
+
+        try:
+            length: Optional[int] = len(value)
+        except TypeError:
+            length = None
+        value_repr = _bounded_repr(value, max_repr)
+        if len(value_repr) > max_repr:
+            value_repr = value_repr[:max_repr - 3] + "..."
+        return cls(type(value), length, value_repr)
+
+    def __len__(self) -> int:
+        if self.length is None:
+            raise TypeError(f"object of type {self.type.__name__!r} has no len()")
+        return self.length
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ValueSnapshot):
+            return False
+        return (self.type, self.length, self.repr) == (other.type, other.length, other.repr)
+
+    def __repr__(self) -> str:
+        return self.repr
+
+
+def set_value_snapshots(enabled: bool) -> None:
+    """
+    Make validators that aren't configured explicitly keep value snapshots.
+    """
+    global _value_snapshots
+    _value_snapshots = enabled
+
+
+def value_snapshots_enabled() -> bool:
+    return _value_snapshots
@@ -0,0 +1,260 @@
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union, cast
+
+from niltype import Nil, Nilable
+
+from d42.declaration import GenericSchema, SchemaVisitor
+from d42.declaration.types import (
+    AnySchema,
+    BoolSchema,
+    BytesSchema,
+    DateSchema,
+    DateTimeSchema,
+    DictSchema,
+    FloatSchema,
+    GenericTypeAliasSchema,
+    IntSchema,
+    ListSchema,
+    NoneSchema,
+    StrSchema,
+    TypeAliasPropsType,
+    UUID4Schema,
+)
+from d42.utils import get_union_index, is_ellipsis
+
+from ._error_budget import ErrorBudget
+from ._path import PathLike
+from ._validation_result import ValidationResult
+from ._validator import Validator
+from .errors import (
+    ExtraKeyValidationError,
+    MissingKeyValidationError,
+    SchemaMismatchValidationError,
+    ValidationError,
+)
+
+__all__ = ("Stepper", "Step", "Frame", "Task", "walk",)
+
+# A child to validate: (schema, value, path, keyword arguments)
+Task = Tuple[GenericSchema, Any, Nilable[PathLike], Dict[str, Any]]
+# Yields a task for every child, receives its result, returns the node result
+Frame = Generator[Task, ValidationResult, ValidationResult]
+Step = Union[ValidationResult, Frame]
+
+
+class Stepper(SchemaVisitor[Step]):
+    """
+    Splits validation into steps that can be driven without recursion.
+
+    Dicts, `schema.list(T)` lists, unions and aliases return a frame: a
+    generator that yields a `(schema, value, path)` task for every child and
+    is sent back the result of that child. Other schemas are validated by
+    `Validator` at once. Frames build the same result `Validator` builds,
+    and share its error budget (`max_errors`) the way its nodes do.
+    Subclasses of `Validator` may change what is valid, so with one every
+    schema is left to the validator (see `is_stepped`).
+    """
+
+    def __init__(self, validator: Optional[Validator] = None) -> None:
+        self._validator = validator or Validator()
+        self._is_stepped = type(self._validator) is Validator
+
+    @property
+    def validator(self) -> Validator:
+        return self._validator
+
+    @property
+    def is_stepped(self) -> bool:
+        return self._is_stepped
+
+    def _start_budget(self, kwargs: Dict[str, Any]) -> Optional[ErrorBudget]:
+        # The outermost container starts the budget, its children share it
+        max_errors = self._validator.max_errors
+        if (max_errors is None) or ("error_budget" in kwargs):
+            return None
+        return ErrorBudget(max_errors)
+
+    def _budgeted(self, budget: ErrorBudget, frame: Frame) -> Frame:
+        result = yield from frame
+        return budget.finish(result)
+
+    def visit(self, schema: GenericSchema, **kwargs: Any) -> Step:
+        return self._validator.visit(schema, **kwargs)
+
+    def visit_none(self, schema: NoneSchema, **kwargs: Any) -> Step:
+        return self._validator.visit_none(schema, **kwargs)
+
+    def visit_bool(self, schema: BoolSchema, **kwargs: Any) -> Step:
+        return self._validator.visit_bool(schema, **kwargs)
+
+    def visit_int(self, schema: IntSchema, **kwargs: Any) -> Step:
+        return self._validator.visit_int(schema, **kwargs)
+
+    def visit_float(self, schema: FloatSchema, **kwargs: Any) -> Step:
+        return self._validator.visit_float(schema, **kwargs)
+
+    def visit_str(self, schema: StrSchema, **kwargs: Any) -> Step:
+        return cast(ValidationResult, self._validator.visit_str(schema, **kwargs))
+
+    def visit_bytes(self, schema: BytesSchema, **kwargs: Any) -> Step:
+        return self._validator.visit_bytes(schema, **kwargs)
+
+    def visit_datetime(self, schema: DateTimeSchema, **kwargs: Any) -> Step:
+        return self._validator.visit_datetime(schema, **kwargs)
+
+    def visit_uuid4(self, schema: UUID4Schema, **kwargs: Any) -> Step:
+        return self._validator.visit_uuid4(schema, **kwargs)
+
+    def visit_date(self, schema: DateSchema, **kwargs: Any) -> Step:
+        return self._validator.visit_date(schema, **kwargs)
+
+    def visit_list(self, schema: ListSchema, *,
+                   value: Any = Nil, path: Nilable[PathLike] = Nil,
+                   **kwargs: Any) -> Step:
+        if not self._is_stepped or (schema.props.type is Nil):
+            # Element patterns are short, unlike `schema.list(T)` lists
+            return self._validator.visit_list(schema, value=value, path=path, **kwargs)
+        if (budget := self._start_budget(kwargs)) is not None:
+            kwargs = {**kwargs, "error_budget": budget}
+            return self._budgeted(budget, self._list_frame(schema, value, path, kwargs))
+        return self._list_frame(schema, value, path, kwargs)
+
+    def _list_frame(self, schema: ListSchema, value: Any, path: Nilable[PathLike],
+                    kwargs: Dict[str, Any]) -> Frame:
+        result = self._validator.make_validation_result()
+        path = self._validator._as_path(path)
+
+        if error := self._validator._validate_list_props(schema, path, value):
+            return result.add_error(error)
+
+        budget: Optional[ErrorBudget] = kwargs.get("error_budget")
+        type_schema = cast(GenericSchema, schema.props.type)
+        for index, elem in enumerate(value):
+            if budget and budget.should_stop():
+                break
+            spent = budget.spent if budget else 0
+            res = yield type_schema, elem, path[index], kwargs
+            result.add_errors(res.get_errors())
+            if budget:
+                budget.charge(spent, len(res.get_errors()))
+        return result
+
+    def visit_dict(self, schema: DictSchema, *,
+                   value: Any = Nil, path: Nilable[PathLike] = Nil,
+                   **kwargs: Any) -> Step:
+        if not self._is_stepped:
+            return self._validator.visit_dict(schema, value=value, path=path, **kwargs)
+        if (budget := self._start_budget(kwargs)) is not None:
+            kwargs = {**kwargs, "error_budget": budget}
+            return self._budgeted(budget, self._dict_frame(schema, value, path, kwargs))
+        return self._dict_frame(schema, value, path, kwargs)
+
+    def _dict_frame(self, schema: DictSchema, value: Any, path: Nilable[PathLike],
+                    kwargs: Dict[str, Any]) -> Frame:
+        result = self._validator.make_validation_result()
+        path = self._validator._as_path(path)
+
+        if error := self._validator._validate_type(path, value, dict):
+            return result.add_error(error)
+
+        keys = schema.props.keys
+        if keys is Nil:
+            return result
+
+        budget: Optional[ErrorBudget] = kwargs.get("error_budget")
+        for key, (val, is_optional) in keys.items():
+            if is_ellipsis(key) or (is_optional and (key not in value)):
+                continue
+            if budget and budget.should_stop():
+                return result
+            if key in value:
+                spent = budget.spent if budget else 0
+                res = yield val, value[key], path[key], kwargs
+                result.add_errors(res.get_errors())
+                if budget:
+                    budget.charge(spent, len(res.get_errors()))
+            else:
+                result.add_error(MissingKeyValidationError(path, value, key))
+                if budget:
+                    budget.spend()
+
+        if (... not in keys):
+            for key in value:
+                if key not in keys:
+                    if budget and budget.should_stop():
+                        return result
+                    result.add_error(ExtraKeyValidationError(path, value, key))
+                    if budget:
+                        budget.spend()
+
+        return result
+
+    def visit_any(self, schema: AnySchema, *,
+                  value: Any = Nil, path: Nilable[PathLike] = Nil,
+                  **kwargs: Any) -> Step:
+        if not self._is_stepped or (schema.props.types is Nil):
+            return self._validator.visit_any(schema, value=value, path=path, **kwargs)
+        return self._any_frame(schema, value, path, kwargs)
+
+    def _any_frame(self, schema: AnySchema, value: Any, path: Nilable[PathLike],
+                   kwargs: Dict[str, Any]) -> Frame:
+        result = self._validator.make_validation_result()
+        if path is Nil:
+            path = self._validator.make_path()
+
+        types = cast(Tuple[GenericSchema, ...], schema.props.types)
+        branch_errors: Dict[int, List[ValidationError]] = {}
+        for index in get_union_index(schema).candidates(value):
+            res = yield types[index], value, path, self._validator._branch_kwargs(kwargs)
+            if not res.has_errors():
+                return result
+            branch_errors[index] = res.get_errors()
+
+        all_errors: List[List[ValidationError]] = []
+        for index, sch_type in enumerate(types):
+            if index not in branch_errors:
+                res = yield sch_type, value, path, self._validator._branch_kwargs(kwargs)
+                branch_errors[index] = res.get_errors()
+            all_errors.append(branch_errors[index])
+
+        result.add_error(SchemaMismatchValidationError(path, value, types, all_errors))
+        return result
+
+    def visit_type_alias(self, schema: GenericTypeAliasSchema[TypeAliasPropsType], *,
+                         value: Any = Nil, path: Nilable[PathLike] = Nil,
+                         **kwargs: Any) -> Step:
+        if not self._is_stepped:
+            return self._validator.visit_type_alias(schema, value=value, path=path, **kwargs)
+        return self._alias_frame(schema, value, path, kwargs)
+
+    def _alias_frame(self, schema: GenericTypeAliasSchema[TypeAliasPropsType],
+                     value: Any, path: Nilable[PathLike], kwargs: Dict[str, Any]) -> Frame:
+        return (yield schema.props.type, value, path, kwargs)
+
+
+def walk(stepper: Stepper, schema: GenericSchema, value: Any,
+         path: Nilable[PathLike] = Nil, **kwargs: Any
+         ) -> Generator[None, None, ValidationResult]:
+    """
+    Validate `value` with an explicit stack of frames instead of recursion.
+
+    Yields once per visited node, so the caller decides when to pause, and
+    returns the result.
+    """
+    stack: List[Frame] = []
+    step = schema.__accept__(stepper, value=value, path=path, **kwargs)
+    while True:
+        yield
+        if isinstance(step, ValidationResult):
+            if not stack:
+                return step
+            frame, sent = stack[-1], step
+        else:
+            stack.append(step)
+            frame, sent = step, None
+        try:
+            sch, val, pth, kw = frame.send(sent)  # type: ignore[arg-type]
+        except StopIteration as stop:
+            stack.pop()
+            step = stop.value
+            continue
+        step = sch.__accept__(stepper, value=val, path=pth, **kw)
@@ -0,0 +1,147 @@
+import codecs
+import json
+from typing import IO, Any, Callable, Iterator, Optional, Tuple, Union
+
+from niltype import Nil
+
+from d42.declaration import GenericSchema
+from d42.declaration.types import ListSchema
+
+from ._validation_result import ValidationResult
+from ._validator import Validator
+
+__all__ = ("iter_validate",)
+
+_WHITESPACE = " \t\n\r"
+
+
+def _get_record_schema(schema: GenericSchema) -> Tuple[GenericSchema, bool]:
+    if not isinstance(schema, ListSchema):
+        return schema, False
+    props = schema.props
+    if (props.type is Nil) or (props.elements is not Nil) or props.unique or \
+       (props.len is not Nil) or (props.min_len is not Nil) or (props.max_len is not Nil):
+        raise ValueError(f"Only schema.list(T) can be validated record by record, got {schema!r}")
+    return props.type, True
+
+
+def _make_reader(fileobj: IO[Any]) -> Callable[[int], str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def read(size: int) -> str:
+        chunk = fileobj.read(size)
+        if isinstance(chunk, bytes):
+            return decoder.decode(chunk, final=(chunk == b""))
+        return str(chunk)
+    return read
+
+
+def _iter_lines(fileobj: IO[Any]) -> Iterator[Union[str, bytes]]:
+    for line in fileobj:
+        if line.strip():
+            yield line
+
+
+def _iter_array(fileobj: IO[Any], chunk_size: int) -> Iterator[Any]:
+    read = _make_reader(fileobj)
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = "", 0, False
+
+    def skip_whitespace() -> bool:
+        # Moves `pos` to the next significant char, reading more if needed
+        nonlocal buffer, pos, eof
+        while True:
+            while (pos < len(buffer)) and (buffer[pos] in _WHITESPACE):
+                pos += 1
+            if (pos < len(buffer)) or eof:
+                return pos < len(buffer)
+            buffer, pos = read(chunk_size), 0
+            eof = (buffer == "")
+
+    def read_more() -> None:
+        # Keeps the unparsed tail and at least doubles it, so that records
+        # bigger than `chunk_size` are re-parsed only a few times
+        nonlocal buffer, pos, eof
+        chunk = read(max(chunk_size, len(buffer) - pos))
+        eof = (chunk == "")
+        buffer, pos = buffer[pos:] + chunk, 0
+
+    if not skip_whitespace() or (buffer[pos] != "["):
+        raise ValueError("Expected a JSON array")
+    pos += 1
+
+    index = 0
+    while True:
+        if not skip_whitespace():
+            raise ValueError("Unexpected end of JSON array")
+        if (index == 0) and (buffer[pos] == "]"):
+            return
+        if index > 0:
+            if buffer[pos] == "]":
+                return
+            if buffer[pos] != ",":
+                raise ValueError(f"Expected ',' or ']', got {buffer[pos]!r}")
+            pos += 1
+            if not skip_whitespace():
+                raise ValueError("Unexpected end of JSON array")
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                read_more()
+                continue
+            # A number may go on in the next chunk (e.g. "2." + "5"), so the
+            # delimiter after the value has to be seen before trusting it
+            after = end
+            while (after < len(buffer)) and (buffer[after] in _WHITESPACE):
+                after += 1
+            if eof or ((after < len(buffer)) and (buffer[after] in ",]")):
+                break
+            read_more()
+        yield value
+        pos = end
+        index += 1
+
+
+def iter_validate(schema: GenericSchema, fileobj: IO[Any], *,
+                  format: str = "ndjson",
+                  chunk_size: int = 64 * 1024,
+                  validator: Optional[Validator] = None) -> Iterator[Tuple[int, ValidationResult]]:
+    """
+    Parse and validate JSON records from `fileobj` one at a time.
+
+    Only one record is kept in memory, so files of any size can be checked.
+    `schema` is either the schema of a single record or `schema.list(T)`,
+    in which case every record is validated against `T` and errors are
+    reported at `[index]`, as `validate` would do for the whole list.
+
+    :param format: "ndjson" (a record per line) or "json-array" (a top-level array).
+    :return: An iterator over `(index, result)` of the invalid records, where
+             `index` is the position of the record (blank NDJSON lines are skipped).
+    :raises ValueError: If the format is unknown or the file is malformed.
+    """
+    if format not in ("ndjson", "json-array"):
+        raise ValueError(f"Unknown format {format!r}, expected 'ndjson' or 'json-array'")
+    record_schema, is_list = _get_record_schema(schema)
+    validator = validator or Validator()
+
+    if format == "ndjson":
+        records: Iterator[Any] = (json.loads(line) for line in _iter_lines(fileobj))
+    else:
+        records = _iter_array(fileobj, chunk_size)
+    return _validate_records(record_schema, records, validator, is_list)
+
+
+def _validate_records(record_schema: GenericSchema, records: Iterator[Any],
+                      validator: Validator, is_list: bool
+                      ) -> Iterator[Tuple[int, ValidationResult]]:
+    for index, record in enumerate(records):
+        if validator._is_valid(record_schema, record):
+            continue
+        path = validator.make_path()
+        if is_list:
+            path = path[index]
+        yield index, record_schema.__accept__(validator, value=record, path=path)
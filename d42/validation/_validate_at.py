@@ -0,0 +1,159 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from niltype import Nil
+
+from d42.declaration import GenericSchema
+from d42.declaration.types import AnySchema, DictSchema, ListSchema
+from d42.utils import is_ellipsis, schema_cache, unwrap_alias
+
+from ._path import KeysLike, as_index, to_keys
+from ._validation_result import ValidationResult
+from ._validator import Validator, _default_validator
+from .errors import MissingElementValidationError, MissingKeyValidationError
+
+__all__ = ("validate_at", "resolve_schema",)
+
+# The subschema of every step of a path, and whether its key is optional
+Chain = List[Tuple[GenericSchema, bool]]
+
+# Resolved paths are kept per schema, up to this many
+MAX_CACHED_PATHS = 256
+
+_anything = AnySchema()
+
+
+def _resolve_step(schema: GenericSchema, key: Any) -> List[Tuple[GenericSchema, bool]]:
+    schema = unwrap_alias(schema)
+    props = schema.props
+
+    if isinstance(schema, AnySchema):
+        if props.types is Nil:
+            return [(_anything, True)]
+        # Every branch the path goes through may be the one the value matches
+        return [step for branch in props.types for step in _resolve_step(branch, key)]
+
+    if isinstance(schema, DictSchema):
+        if props.keys is Nil:
+            return [(_anything, True)]
+        if (key in props.keys) and not is_ellipsis(key):
+            sch, is_optional = props.keys[key]
+            return [(sch, is_optional)]
+        # Open dicts accept anything under keys they don't declare
+        return [(_anything, True)] if (... in props.keys) else []
+
+    if isinstance(schema, ListSchema):
+        index = as_index(key)
+        if index is None:
+            return []
+        if props.type is not Nil:
+            return [(props.type, False)]
+        if props.elements is Nil:
+            return [(_anything, False)]
+        elements = props.elements
+        if any(is_ellipsis(elem) for elem in elements):
+            # Only a head is where it's declared, e.g. `[schema.int, ...]`
+            head = elements[:-1] if is_ellipsis(elements[-1]) else []
+            if any(is_ellipsis(elem) for elem in head) or (index >= len(head)):
+                return []
+            return [(head[index], False)]
+        return [(elements[index], False)] if (index < len(elements)) else []
+
+    return []
+
+
+def _container_type(schema: GenericSchema) -> Optional[type]:
+    schema = unwrap_alias(schema)
+    if isinstance(schema, DictSchema):
+        return dict
+    if isinstance(schema, ListSchema):
+        return list
+    # Unions may take either
+    return None
+
+
+def _resolve(schema: GenericSchema, keys: List[Any]) -> Chain:
+    chain: Chain = [(schema, False)]
+    for key in keys:
+        steps = _resolve_step(chain[-1][0], key)
+        if not steps:
+            # Like `DictSchema.__getitem__`
+            raise KeyError(key)
+        subschemas: List[GenericSchema] = []
+        for sch, _ in steps:
+            if all(sch is not known for known in subschemas):
+                subschemas.append(sch)
+        is_optional = any(opt for _, opt in steps)
+        if len(subschemas) == 1:
+            chain.append((subschemas[0], is_optional))
+        else:
+            chain.append((AnySchema()(*subschemas), is_optional))
+    return chain
+
+
+def _get_chain(schema: GenericSchema, keys: List[Any]) -> Chain:
+    cache: Dict[Tuple[Any, ...], Chain] = schema_cache(schema, "resolved_paths", dict)
+    try:
+        cache_key = tuple(keys)
+        chain = cache.get(cache_key)
+    except TypeError:  # unhashable keys
+        return _resolve(schema, keys)
+    if chain is None:
+        chain = _resolve(schema, keys)
+        if len(cache) >= MAX_CACHED_PATHS:
+            cache.clear()
+        cache[cache_key] = chain
+    return chain
+
+
+def resolve_schema(schema: GenericSchema, path: KeysLike) -> GenericSchema:
+    """
+    Return the part of `schema` that describes values at `path`.
+
+    Lists, unions and type aliases are resolved too; a path through several
+    branches of a union resolves to a union of what it reaches in them.
+
+    :raises KeyError: If `schema` doesn't declare what's at `path`.
+    """
+    return _get_chain(schema, to_keys(path))[-1][0]
+
+
+def validate_at(schema: GenericSchema, value: Any, path: KeysLike, *,
+                validator: Optional[Validator] = None, **kwargs: Any) -> ValidationResult:
+    """
+    Validate the part of `value` at `path` against the matching part of `schema`.
+
+    `path` is a `th` path, a JSON Pointer ("/data/items/3") or a sequence of
+    keys. Only that subtree is walked, errors are reported at full paths.
+    A missing subtree is reported as a missing key or element, unless it's
+    optional; a container on the way that isn't one is validated against its
+    subschema, which reports its type.
+
+    :raises KeyError: If `schema` doesn't declare what's at `path`.
+    """
+    validator = validator or _default_validator
+    keys = to_keys(path)
+    chain = _get_chain(schema, keys)
+
+    current = validator._as_path(Nil)
+    for depth, key in enumerate(keys):
+        parent_schema, _ = chain[depth]
+        _, is_optional = chain[depth + 1]
+        expected = _container_type(parent_schema)
+        if isinstance(value, dict) and (expected in (dict, None)):
+            if key not in value:
+                if is_optional:
+                    return validator.make_validation_result()
+                missing_key = MissingKeyValidationError(current, value, key)
+                return validator.make_validation_result().add_error(missing_key)
+            value = value[key]
+        elif (isinstance(value, list) and (expected in (list, None))
+              and ((index := as_index(key)) is not None)):
+            if index >= len(value):
+                missing = MissingElementValidationError(current, value, index)
+                return validator.make_validation_result().add_error(missing)
+            key, value = index, value[index]
+        else:
+            return parent_schema.__accept__(validator, value=value, path=current, **kwargs)
+        current = current[key]
+
+    return chain[-1][0].__accept__(validator, value=value, path=current, **kwargs)
@@ -1,29 +1,59 @@
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 
+from ._snapshot import ValueSnapshot
 from .errors import ValidationError
 
 __all__ = ("ValidationResult",)
 
 
 class ValidationResult:
+    __slots__ = ("_errors", "_truncated", "_snapshot",)
+
     def __init__(self, errors: Optional[List[ValidationError]] = None) -> None:
         self._errors = errors if (errors is not None) else []
+        self._truncated = False
+        self._snapshot: Optional[Callable[[Any], Any]] = None
 
     def add_error(self, error: ValidationError) -> "ValidationResult":
+        if self._snapshot is not None:
+            error.snapshot_value(self._snapshot)
         self._errors.append(error)
         return self
 
     def add_errors(self, errors: List[ValidationError]) -> "ValidationResult":
         for error in errors:
+            if self._snapshot is not None:
+                error.snapshot_value(self._snapshot)
             self._errors.append(error)
         return self
 
+    def snapshot_values(self,
+                        snapshot: Callable[[Any], Any] = ValueSnapshot.capture
+                        ) -> "ValidationResult":
+        """
+        Make errors, the present ones and the ones added later, keep
+        `snapshot(value)` instead of the invalid value itself.
+        """
+        self._snapshot = snapshot
+        for error in self._errors:
+            error.snapshot_value(snapshot)
+        return self
+
     def has_errors(self) -> bool:
         return len(self._errors) > 0
 
     def get_errors(self) -> List[ValidationError]:
         return self._errors
 
+    def truncate(self, max_errors: int) -> "ValidationResult":
+        del self._errors[max_errors:]
+        self._truncated = True
+        return self
+
+    def is_truncated(self) -> bool:
+        return self._truncated
+
     def __repr__(self) -> str:
         errors = repr(self._errors) if self.has_errors() else ""
-        return f"{self.__class__.__name__}({errors})"
+        truncated = ", truncated" if self._truncated else ""
+        return f"{self.__class__.__name__}({errors}{truncated})"
@@ -1,8 +1,7 @@
-import re
 from copy import deepcopy
 from datetime import date, datetime
 from math import isclose
-from typing import Any, Callable, List, Optional, Type, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, cast
 from uuid import UUID
 
 from niltype import Nil, Nilable
@@ -25,8 +24,20 @@ from d42.declaration.types import (
     TypeAliasPropsType,
     UUID4Schema,
 )
-from d42.utils import is_ellipsis
+from d42.utils import (
+    closest_body,
+    compile_alphabet,
+    compile_pattern,
+    get_union_index,
+    is_ellipsis,
+    is_unique,
+    match_body,
+)
 
+from ._error_budget import ErrorBudget, fork_budget
+from ._metrics import MetricsSink, meter
+from ._path import Path, PathLike
+from ._snapshot import value_snapshots_enabled
 from ._validation_result import ValidationResult
 from .errors import (
     AlphabetValidationError,
@@ -49,64 +60,191 @@ from .errors import (
     ValueValidationError,
 )
 
+if TYPE_CHECKING:
+    from ._cache import ValidationMemo
+    from ._checker import Checker
+
 __all__ = ("Validator",)
 
 
 class Validator(SchemaVisitor[ValidationResult]):
     def __init__(self, *,
                  validation_result_factory: Callable[[], ValidationResult] = ValidationResult,
-                 path_holder_factory: Callable[[], PathHolder] = PathHolder) -> None:
+                 path_holder_factory: Callable[[], PathHolder] = PathHolder,
+                 max_errors: Optional[int] = None,
+                 fail_fast: bool = False,
+                 snapshot_values: Optional[bool] = None,
+                 metrics: Optional[MetricsSink] = None) -> None:
         self._validation_result_factory = validation_result_factory
         self._path_holder_factory = path_holder_factory
+        # None follows `set_value_snapshots`
+        self._snapshot_values = snapshot_values
+        self._max_errors = 1 if fail_fast else max_errors
+        if (self._max_errors is not None) and (self._max_errors < 1):
+            raise ValueError(f"max_errors must be positive, got {max_errors!r}")
+        # Subclasses may build results of their own, see `_get_result`
+        self._shares_result = type(self) is Validator
+        self._checker: Optional["Checker"] = None
+        self._metrics = metrics
+        if metrics is not None:
+            # Only validators with metrics pay for them: their visit methods
+            # are replaced on the instance, the class stays as it is
+            for name in dir(type(self)):
+                if (name == "visit") or name.startswith("visit_"):
+                    setattr(self, name, meter(getattr(self, name), metrics))
+
+    @property
+    def max_errors(self) -> Optional[int]:
+        return self._max_errors
+
+    @property
+    def metrics(self) -> Optional[MetricsSink]:
+        return self._metrics
+
+    @property
+    def snapshot_values(self) -> bool:
+        """
+        Whether errors keep a bounded `ValueSnapshot` of invalid values
+        instead of the values themselves.
+        """
+        if self._snapshot_values is None:
+            return value_snapshots_enabled()
+        return self._snapshot_values
 
     def make_validation_result(self) -> ValidationResult:
-        return self._validation_result_factory()
+        result = self._validation_result_factory()
+        if self.snapshot_values:
+            result.snapshot_values()
+        return result
 
     def make_path(self) -> PathHolder:
         return self._path_holder_factory()
 
-    def _validate_type(self, path: PathHolder, value: Any,
+    def _get_result(self, kwargs: Dict[str, Any]) -> ValidationResult:
+        # The outermost node creates the result and shares it with its
+        # descendants through `error_sink`: every node adds its errors to it
+        # and returns it, so errors are never copied and valid nodes allocate
+        # nothing
+        sink: Optional[ValidationResult] = kwargs.get("error_sink")
+        if sink is not None:
+            return sink
+        result = self.make_validation_result()
+        if self._shares_result:
+            kwargs["error_sink"] = result
+        return result
+
+    def _validate_child(self, result: ValidationResult, schema: GenericSchema,
+                        value: Any, path: PathLike, kwargs: Dict[str, Any]) -> bool:
+        """
+        Validate a child into `result`, tell whether the error budget is used up.
+        """
+        memo: Optional["ValidationMemo"] = kwargs.get("validation_memo")
+        if (memo is not None) and isinstance(value, (dict, list)):
+            if memo.is_valid(schema, value):
+                return False
+        else:
+            memo = None
+
+        errors = result.get_errors()
+        count = len(errors)
+        budget: Optional[ErrorBudget] = kwargs.get("error_budget")
+        spent = budget.spent if budget else 0
+        res = schema.__accept__(self, value=value, path=path, **kwargs)
+        if res is not result:
+            # Custom types (and subclasses) return results of their own
+            result.add_errors(res.get_errors())
+        if (memo is not None) and (len(errors) == count):
+            memo.add_valid(schema, value)
+        if budget is None:
+            return False
+        return budget.charge(spent, len(errors) - count)
+
+    def _branch_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # Errors of a branch may be thrown away, so it gets a result and an
+        # error budget of its own
+        return {**fork_budget(kwargs), "error_sink": None}
+
+    def _as_path(self, path: Nilable[PathLike]) -> Path:
+        if isinstance(path, Path):
+            return path
+        if path is Nil:
+            return Path(self._path_holder_factory())
+        # Snapshot the holder, it's mutable and still owned by the caller
+        return Path(deepcopy(path))
+
+    def _is_valid(self, schema: GenericSchema, value: Any, **kwargs: Any) -> bool:
+        """
+        Tell whether `value` is valid without building errors.
+
+        `Checker` mirrors this class only, so subclasses (that may change what
+        is valid) fall back to a full validation.
+        """
+        kwargs = self._branch_kwargs(kwargs)
+        if type(self) is not Validator:
+            return not schema.__accept__(self, value=value, **kwargs).has_errors()
+        if self._checker is None:
+            from ._checker import Checker  # circular import
+            self._checker = Checker(self)
+        return schema.__accept__(self._checker, value=value, **kwargs)
+
+    def _validate_type(self, path: PathLike, value: Any,
                        expected_type: Type[Any]) -> Optional[ValidationError]:
         if not isinstance(value, expected_type):
             return TypeValidationError(path, value, expected_type)
         return None
 
-    def _validate_value(self, path: PathHolder, value: Any,
+    def _validate_value(self, path: PathLike, value: Any,
                         expected_val: Any) -> Optional[ValidationError]:
         if value != expected_val:
             return ValueValidationError(path, value, expected_val)
         return None
 
     def _validate_elements(self,
-                           path: PathHolder,
+                           result: ValidationResult,
+                           path: Path,
                            value: List[Any],
                            elements: List[GenericSchema],
                            start: int = 0,
-                           **kwargs: Any) -> List[ValidationError]:
-        errors: List[ValidationError] = []
+                           **kwargs: Any) -> ValidationResult:
+        budget: Optional[ErrorBudget] = kwargs.get("error_budget")
         for index, element_schema in enumerate(elements):
+            if budget and budget.should_stop():
+                break
             real_index = start + index
-            try:
-                val = value[real_index]
-            except IndexError:
-                errors.append(MissingElementValidationError(path, value, real_index))
+            if real_index >= len(value):
+                result.add_error(MissingElementValidationError(path, value, real_index))
+                if budget:
+                    budget.spend()
                 break
-            else:
-                nested_path = deepcopy(path)[real_index]
-                res = element_schema.__accept__(self, value=val, path=nested_path, **kwargs)
-                errors += res.get_errors()
-        return errors
+            self._validate_child(result, element_schema, value[real_index],
+                                 path[real_index], kwargs)
+        return result
 
-    def visit(self, schema: GenericSchema, *, value: Any = Nil, path: Nilable[PathHolder] = Nil,
+    def _with_budget(self, visit: Callable[..., ValidationResult], schema: GenericSchema,
+                     value: Any, path: Nilable[PathLike],
+                     kwargs: Dict[str, Any]) -> Optional[ValidationResult]:
+        # The outermost container starts the budget, its children share it
+        if (self._max_errors is None) or ("error_budget" in kwargs):
+            return None
+        budget = ErrorBudget(self._max_errors)
+        result = visit(schema, value=value, path=path, error_budget=budget, **kwargs)
+        return budget.finish(result)
+
+    def visit(self, schema: GenericSchema, *, value: Any = Nil, path: Nilable[PathLike] = Nil,
               **kwargs: Any) -> ValidationResult:
         if validate_method := getattr(schema, "__d42_validate__", None):
+            # Custom types build results of their own
+            kwargs.pop("error_sink", None)
+            if isinstance(path, Path):
+                # Custom types work with th.PathHolder
+                path = path.to_path_holder()
             return cast(ValidationResult, validate_method(self, value=value, path=path, **kwargs))
         raise NotImplementedError(f"{schema.__class__.__name__} has no method '__d42_validate__'")
 
     def visit_none(self, schema: NoneSchema, *,
-                   value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                   value: Any = Nil, path: Nilable[PathLike] = Nil,
                    **kwargs: Any) -> ValidationResult:
-        result = self._validation_result_factory()
+        result = self._get_result(kwargs)
         if path is Nil:
             path = self._path_holder_factory()
 
@@ -116,9 +254,9 @@ class Validator(SchemaVisitor[ValidationResult]):
         return result
 
     def visit_bool(self, schema: BoolSchema, *,
-                   value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                   value: Any = Nil, path: Nilable[PathLike] = Nil,
                    **kwargs: Any) -> ValidationResult:
-        result = self._validation_result_factory()
+        result = self._get_result(kwargs)
         if path is Nil:
             path = self._path_holder_factory()
 
@@ -132,9 +270,9 @@ class Validator(SchemaVisitor[ValidationResult]):
         return result
 
     def visit_int(self, schema: IntSchema, *,
-                  value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                  value: Any = Nil, path: Nilable[PathLike] = Nil,
                   **kwargs: Any) -> ValidationResult:
-        result = self._validation_result_factory()
+        result = self._get_result(kwargs)
         if path is Nil:
             path = self._path_holder_factory()
 
@@ -156,9 +294,9 @@ class Validator(SchemaVisitor[ValidationResult]):
         return result
 
     def visit_float(self, schema: FloatSchema, *,
-                    value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                    value: Any = Nil, path: Nilable[PathLike] = Nil,
                     **kwargs: Any) -> ValidationResult:
-        result = self._validation_result_factory()
+        result = self._get_result(kwargs)
         if path is Nil:
             path = self._path_holder_factory()
 
@@ -187,9 +325,9 @@ class Validator(SchemaVisitor[ValidationResult]):
         return result
 
     def visit_str(self, schema: StrSchema, *,
-                  value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                  value: Any = Nil, path: Nilable[PathLike] = Nil,
                   **kwargs: Any) -> Any:
-        result = self._validation_result_factory()
+        result = self._get_result(kwargs)
         if path is Nil:
             path = self._path_holder_factory()
 
@@ -201,7 +339,7 @@ class Validator(SchemaVisitor[ValidationResult]):
                 return result.add_error(error)
 
         if schema.props.pattern is not Nil:
-            match_object = re.search(schema.props.pattern, value)
+            match_object = compile_pattern(schema.props.pattern).search(value)
             if match_object is None:
                 error = RegexValidationError(path, value, schema.props.pattern)
                 return result.add_error(error)
@@ -221,39 +359,25 @@ class Validator(SchemaVisitor[ValidationResult]):
                 result.add_error(SubstrValidationError(path, value, schema.props.substr))
 
         if schema.props.alphabet is not Nil:
-            alphabet = set(schema.props.alphabet)
-            for letter in value:
-                if letter not in alphabet:
-                    return result.add_error(
-                        AlphabetValidationError(PathHolder(), value, schema.props.alphabet))
+            if not compile_alphabet(schema.props.alphabet)(value):
+                return result.add_error(
+                    AlphabetValidationError(path, value, schema.props.alphabet))
 
         return result
 
     def visit_list(self, schema: ListSchema, *,
-                   value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                   value: Any = Nil, path: Nilable[PathLike] = Nil,
                    **kwargs: Any) -> ValidationResult:
-        result = self._validation_result_factory()
-        if path is Nil:
-            path = self._path_holder_factory()
+        budgeted = self._with_budget(self.visit_list, schema, value, path, kwargs)
+        if budgeted is not None:
+            return budgeted
+        budget: Optional[ErrorBudget] = kwargs.get("error_budget")
 
-        if error := self._validate_type(path, value, list):
-            return result.add_error(error)
+        result = self._get_result(kwargs)
+        path = self._as_path(path)
 
-        if schema.props.len is not Nil:
-            if len(value) != schema.props.len:
-                return result.add_error(LengthValidationError(path, value, schema.props.len))
-        if schema.props.min_len is not Nil:
-            if len(value) < schema.props.min_len:
-                return result.add_error(
-                    MinLengthValidationError(path, value, schema.props.min_len))
-        if schema.props.max_len is not Nil:
-            if len(value) > schema.props.max_len:
-                return result.add_error(
-                    MaxLengthValidationError(path, value, schema.props.max_len))
-
-        if schema.props.unique and not self._validate_all_unique(value):
-            result.add_error(UniqueValidationError(path, value))
-            return result
+        if error := self._validate_list_props(schema, path, value):
+            return result.add_error(error)
 
         if (schema.props.type is Nil) and (schema.props.elements is Nil):
             return result
@@ -261,64 +385,86 @@ class Validator(SchemaVisitor[ValidationResult]):
         if schema.props.type is not Nil:
             type_schema = schema.props.type
             for index, elem in enumerate(value):
-                nested_path = deepcopy(path)[index]
-                res = type_schema.__accept__(self, value=elem, path=nested_path, **kwargs)
-                result.add_errors(res.get_errors())
+                if budget and budget.should_stop():
+                    break
+                self._validate_child(result, type_schema, elem, path[index], kwargs)
             return result
 
         elements = cast(List[GenericSchema], schema.props.elements)
 
         # body
         if (len(elements) > 2) and is_ellipsis(elements[0]) and is_ellipsis(elements[-1]):
-            if len(value) == 0:
-                errors = self._validate_elements(path, value, elements[1:-1], **kwargs)
-                return result.add_errors(errors)
-            all_errors = []
-            for index, val in enumerate(value):
-                errors = self._validate_elements(path, value, elements[1:-1], index, **kwargs)
-                all_errors.append(errors)
-            all_errors.sort(key=len)
-            return result.add_errors(all_errors[0])
+            body = elements[1:-1]
+            start = match_body(
+                value, len(body), lambda i, elem: self._is_valid(body[i], elem, **kwargs))
+            if start >= 0:
+                return result
+
+            # Nothing matches, so explain the candidate with the fewest errors,
+            # all of them are counted whatever the error budget
+            counting = {**kwargs, "error_sink": None, "error_budget": None}
+
+            def count_errors(candidate: int) -> int:
+                res = self._validate_elements(self.make_validation_result(), path, value,
+                                              body, candidate, **counting)
+                return len(res.get_errors())
+            start = closest_body(value, count_errors)
+            return self._validate_elements(result, path, value, body, start, **kwargs)
 
         # head
         if (len(elements) >= 2) and is_ellipsis(elements[-1]):
-            errors = self._validate_elements(path, value, elements[:-1], **kwargs)
-            return result.add_errors(errors)
+            return self._validate_elements(result, path, value, elements[:-1], **kwargs)
 
         # tail
         if (len(elements) >= 1) and is_ellipsis(elements[0]):
             elements = elements[1:]
             start = max(0, len(value) - len(elements))
-            errors = self._validate_elements(path, value, elements, start, **kwargs)
-            return result.add_errors(errors)
+            return self._validate_elements(result, path, value, elements, start, **kwargs)
 
-        errors = self._validate_elements(path, value, elements, **kwargs)
-        result.add_errors(errors)
+        self._validate_elements(result, path, value, elements, **kwargs)
         if len(value) > len(elements):
             for index in range(len(elements), len(value)):
+                if budget and budget.should_stop():
+                    break
                 result.add_error(ExtraElementValidationError(path, value, index))
+                if budget:
+                    budget.spend()
 
         return result
 
-    def _validate_all_unique(self, elements: List[Any]) -> bool:
-        for i in range(len(elements)):
-            other_elements = elements[:i] + elements[i + 1:]
-            if not self._is_elem_unique(elements[i], other_elements):
-                return False
-        return True
+    def _validate_list_props(self, schema: ListSchema, path: PathLike,
+                             value: Any) -> Optional[ValidationError]:
+        # Checks that stop the validation of a list before its elements
+        if error := self._validate_type(path, value, list):
+            return error
 
-    def _is_elem_unique(self, elem: Any, elements: List[Any]) -> bool:
-        for existing_elem in elements:
-            if elem == existing_elem:
-                return False
-        return True
+        if schema.props.len is not Nil:
+            if len(value) != schema.props.len:
+                return LengthValidationError(path, value, schema.props.len)
+        if schema.props.min_len is not Nil:
+            if len(value) < schema.props.min_len:
+                return MinLengthValidationError(path, value, schema.props.min_len)
+        if schema.props.max_len is not Nil:
+            if len(value) > schema.props.max_len:
+                return MaxLengthValidationError(path, value, schema.props.max_len)
+
+        if schema.props.unique and not self._validate_all_unique(value):
+            return UniqueValidationError(path, value)
+        return None
+
+    def _validate_all_unique(self, elements: List[Any]) -> bool:
+        return is_unique(elements)
 
     def visit_dict(self, schema: DictSchema, *,
-                   value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                   value: Any = Nil, path: Nilable[PathLike] = Nil,
                    **kwargs: Any) -> ValidationResult:
-        result = self._validation_result_factory()
-        if path is Nil:
-            path = self._path_holder_factory()
+        budgeted = self._with_budget(self.visit_dict, schema, value, path, kwargs)
+        if budgeted is not None:
+            return budgeted
+        budget: Optional[ErrorBudget] = kwargs.get("error_budget")
+
+        result = self._get_result(kwargs)
+        path = self._as_path(path)
 
         if error := self._validate_type(path, value, dict):
             return result.add_error(error)
@@ -327,44 +473,57 @@ class Validator(SchemaVisitor[ValidationResult]):
             return result
 
         for key, (val, is_optional) in schema.props.keys.items():
-            if is_ellipsis(key):
+            if is_ellipsis(key) or (is_optional and (key not in value)):
                 continue
+            if budget and budget.should_stop():
+                return result
             if key in value:
-                nested_path = deepcopy(path)[key]
-                res = val.__accept__(self, value=value[key], path=nested_path, **kwargs)
-                result.add_errors(res.get_errors())
+                self._validate_child(result, val, value[key], path[key], kwargs)
             else:
-                if not is_optional:
-                    result.add_error(MissingKeyValidationError(path, value, key))
+                result.add_error(MissingKeyValidationError(path, value, key))
+                if budget:
+                    budget.spend()
 
         if (... not in schema.props.keys):
             for key, val in value.items():
                 if key not in schema.props.keys:
+                    if budget and budget.should_stop():
+                        return result
                     result.add_error(ExtraKeyValidationError(path, value, key))
+                    if budget:
+                        budget.spend()
 
         return result
 
     def visit_any(self, schema: AnySchema, *,
-                  value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                  value: Any = Nil, path: Nilable[PathLike] = Nil,
                   **kwargs: Any) -> ValidationResult:
-        result = self._validation_result_factory()
+        result = self._get_result(kwargs)
         if path is Nil:
             path = self._path_holder_factory()
 
         if schema.props.types is Nil:
             return result
 
-        all_errors: List[List[ValidationError]] = []
-        for sch_type in schema.props.types:
-            res = sch_type.__accept__(self, path=path, value=value, **kwargs)
+        types = schema.props.types
+        branch_errors: List[Optional[List[ValidationError]]] = [None] * len(types)
+        # Only branches that accept the type of the value can match
+        for index in get_union_index(schema).candidates(value):
+            res = types[index].__accept__(self, path=path, value=value,
+                                          **self._branch_kwargs(kwargs))
             if not res.has_errors():
                 return result
+            branch_errors[index] = res.get_errors()
 
-            schema_errors: List[ValidationError] = []
-            for error in res.get_errors():
-                schema_errors.append(error)
-
-            all_errors.append(schema_errors)
+        # Nothing matches, so explain every branch in the declared order
+        all_errors: List[List[ValidationError]] = []
+        for index, sch_type in enumerate(types):
+            errors = branch_errors[index]
+            if errors is None:
+                res = sch_type.__accept__(self, path=path, value=value,
+                                          **self._branch_kwargs(kwargs))
+                errors = res.get_errors()
+            all_errors.append(errors)
 
         result.add_error(SchemaMismatchValidationError(
             path, value, schema.props.types, all_errors
@@ -372,9 +531,9 @@ class Validator(SchemaVisitor[ValidationResult]):
         return result
 
     def visit_bytes(self, schema: BytesSchema, *,
-                    value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                    value: Any = Nil, path: Nilable[PathLike] = Nil,
                     **kwargs: Any) -> ValidationResult:
-        result = self._validation_result_factory()
+        result = self._get_result(kwargs)
         if path is Nil:
             path = self._path_holder_factory()
 
@@ -388,14 +547,14 @@ class Validator(SchemaVisitor[ValidationResult]):
         return result
 
     def visit_type_alias(self, schema: GenericTypeAliasSchema[TypeAliasPropsType], *,
-                         value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                         value: Any = Nil, path: Nilable[PathLike] = Nil,
                          **kwargs: Any) -> ValidationResult:
         return schema.props.type.__accept__(self, value=value, path=path, **kwargs)
 
     def visit_datetime(self, schema: DateTimeSchema, *,
-                       value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                       value: Any = Nil, path: Nilable[PathLike] = Nil,
                        **kwargs: Any) -> ValidationResult:
-        result = self._validation_result_factory()
+        result = self._get_result(kwargs)
         if path is Nil:
             path = self._path_holder_factory()
 
@@ -409,9 +568,9 @@ class Validator(SchemaVisitor[ValidationResult]):
         return result
 
     def visit_uuid4(self, schema: UUID4Schema, *,
-                    value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                    value: Any = Nil, path: Nilable[PathLike] = Nil,
                     **kwargs: Any) -> ValidationResult:
-        result = self._validation_result_factory()
+        result = self._get_result(kwargs)
         if path is Nil:
             path = self._path_holder_factory()
 
@@ -429,9 +588,9 @@ class Validator(SchemaVisitor[ValidationResult]):
         return result
 
     def visit_date(self, schema: DateSchema, *,
-                   value: Any = Nil, path: Nilable[PathHolder] = Nil,
+                   value: Any = Nil, path: Nilable[PathLike] = Nil,
                    **kwargs: Any) -> ValidationResult:
-        result = self._validation_result_factory()
+        result = self._get_result(kwargs)
         if path is Nil:
             path = self._path_holder_factory()
 
@@ -443,3 +602,17 @@ class Validator(SchemaVisitor[ValidationResult]):
                 return result.add_error(error)
 
         return result
+
+
+_default_validator = Validator()
+
+
+def _is_plain_validator(validator: Validator) -> bool:
+    """
+    Tell whether `validator` validates the way `Validator` does, to the end.
+
+    Modules that walk values on their own mirror `Validator`. A subclass may
+    change what is valid and an error budget (`max_errors`) changes where
+    the traversal stops, so they leave any other validator to itself.
+    """
+    return (type(validator) is Validator) and (validator.max_errors is None)
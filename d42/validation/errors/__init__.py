@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
 
 from th import PathHolder
 
 from d42.declaration import GenericSchema
 
+from .._path import PathLike, to_path_holder
+
 if TYPE_CHECKING:
     from .._formatter import Formatter
 
@@ -18,8 +20,41 @@ __all__ = ("ValidationError", "TypeValidationError", "ValueValidationError",
 
 
 class ValidationError(ABC):
+    __slots__ = ("_path",)
+
+    _path: PathLike
+
+    @property
+    def path(self) -> PathHolder:
+        # Validators pass lightweight paths around, they are converted
+        # into a PathHolder only when someone actually looks at them
+        path = self._path = to_path_holder(self._path)
+        return path
+
+    @path.setter
+    def path(self, path: PathHolder) -> None:
+        self._path = path
+
+    def _get_fields(self) -> Dict[str, Any]:
+        fields = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if (name != "_path") and hasattr(self, name):
+                    fields[name] = getattr(self, name)
+        return fields
+
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, self.__class__) and (self.__dict__ == other.__dict__)
+        if not isinstance(other, self.__class__):
+            return False
+        return (self.path == other.path) and (self._get_fields() == other._get_fields())
+
+    def snapshot_value(self, snapshot: Callable[[Any], Any]) -> None:
+        """
+        Replace the kept invalid value with `snapshot(value)`.
+        """
+        # Custom errors may keep no value at all
+        if hasattr(self, "actual_value"):
+            setattr(self, "actual_value", snapshot(getattr(self, "actual_value")))
 
     @abstractmethod
     def format(self, formatter: "Formatter") -> str:
@@ -27,8 +62,10 @@ class ValidationError(ABC):
 
 
 class TypeValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, expected_type: Type[Any]) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "expected_type",)
+
+    def __init__(self, path: PathLike, actual_value: Any, expected_type: Type[Any]) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.expected_type = expected_type
 
@@ -43,8 +80,10 @@ class TypeValidationError(ValidationError):
 
 
 class ValueValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, expected_value: Any) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "expected_value",)
+
+    def __init__(self, path: PathLike, actual_value: Any, expected_value: Any) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.expected_value = expected_value
 
@@ -57,8 +96,10 @@ class ValueValidationError(ValidationError):
 
 
 class MinValueValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, min_value: Any) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "min_value",)
+
+    def __init__(self, path: PathLike, actual_value: Any, min_value: Any) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.min_value = min_value
 
@@ -71,8 +112,10 @@ class MinValueValidationError(ValidationError):
 
 
 class MaxValueValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, max_value: Any) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "max_value",)
+
+    def __init__(self, path: PathLike, actual_value: Any, max_value: Any) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.max_value = max_value
 
@@ -85,8 +128,10 @@ class MaxValueValidationError(ValidationError):
 
 
 class LengthValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, length: int) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "length",)
+
+    def __init__(self, path: PathLike, actual_value: Any, length: int) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.length = length
 
@@ -99,8 +144,10 @@ class LengthValidationError(ValidationError):
 
 
 class MinLengthValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, min_length: int) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "min_length",)
+
+    def __init__(self, path: PathLike, actual_value: Any, min_length: int) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.min_length = min_length
 
@@ -113,8 +160,10 @@ class MinLengthValidationError(ValidationError):
 
 
 class MaxLengthValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, max_length: int) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "max_length",)
+
+    def __init__(self, path: PathLike, actual_value: Any, max_length: int) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.max_length = max_length
 
@@ -127,8 +176,10 @@ class MaxLengthValidationError(ValidationError):
 
 
 class AlphabetValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: str, alphabet: str) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "alphabet",)
+
+    def __init__(self, path: PathLike, actual_value: str, alphabet: str) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.alphabet = alphabet
 
@@ -141,8 +192,10 @@ class AlphabetValidationError(ValidationError):
 
 
 class SubstrValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, substr: str) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "substr",)
+
+    def __init__(self, path: PathLike, actual_value: Any, substr: str) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.substr = substr
 
@@ -155,8 +208,10 @@ class SubstrValidationError(ValidationError):
 
 
 class RegexValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, pattern: str) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "pattern",)
+
+    def __init__(self, path: PathLike, actual_value: Any, pattern: str) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.pattern = pattern
 
@@ -169,8 +224,10 @@ class RegexValidationError(ValidationError):
 
 
 class MissingElementValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, index: int) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "index",)
+
+    def __init__(self, path: PathLike, actual_value: Any, index: int) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.index = index
 
@@ -182,8 +239,10 @@ class MissingElementValidationError(ValidationError):
 
 
 class ExtraElementValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, index: int) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "index",)
+
+    def __init__(self, path: PathLike, actual_value: Any, index: int) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.index = index
 
@@ -195,8 +254,10 @@ class ExtraElementValidationError(ValidationError):
 
 
 class MissingKeyValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, missing_key: Any) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "missing_key",)
+
+    def __init__(self, path: PathLike, actual_value: Any, missing_key: Any) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.missing_key = missing_key
 
@@ -209,8 +270,10 @@ class MissingKeyValidationError(ValidationError):
 
 
 class ExtraKeyValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any, extra_key: Any) -> None:
-        self.path = path
+    __slots__ = ("actual_value", "extra_key",)
+
+    def __init__(self, path: PathLike, actual_value: Any, extra_key: Any) -> None:
+        self._path = path
         self.actual_value = actual_value
         self.extra_key = extra_key
 
@@ -223,14 +286,22 @@ class ExtraKeyValidationError(ValidationError):
 
 
 class SchemaMismatchValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any,
+    __slots__ = ("actual_value", "expected_schemas", "subschema_errors",)
+
+    def __init__(self, path: PathLike, actual_value: Any,
                  expected_schemas: Tuple[GenericSchema, ...],
                  subschema_errors: Optional[List[List[ValidationError]]] = None) -> None:
-        self.path = path
+        self._path = path
         self.actual_value = actual_value
         self.expected_schemas = expected_schemas
         self.subschema_errors = subschema_errors
 
+    def snapshot_value(self, snapshot: Callable[[Any], Any]) -> None:
+        super().snapshot_value(snapshot)
+        for errors in (self.subschema_errors or []):
+            for error in errors:
+                error.snapshot_value(snapshot)
+
     def format(self, formatter: "Formatter") -> str:
         return formatter.format_schema_missmatch_error(self)
 
@@ -242,9 +313,11 @@ class SchemaMismatchValidationError(ValidationError):
 
 
 class InvalidUUIDVersionValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any,
+    __slots__ = ("actual_value", "actual_version", "expected_version",)
+
+    def __init__(self, path: PathLike, actual_value: Any,
                  actual_version: int, expected_version: int) -> None:
-        self.path = path
+        self._path = path
         self.actual_value = actual_value
         self.actual_version = actual_version
         self.expected_version = expected_version
@@ -258,8 +331,10 @@ class InvalidUUIDVersionValidationError(ValidationError):
 
 
 class UniqueValidationError(ValidationError):
-    def __init__(self, path: PathHolder, actual_value: Any) -> None:
-        self.path = path
+    __slots__ = ("actual_value",)
+
+    def __init__(self, path: PathLike, actual_value: Any) -> None:
+        self._path = path
         self.actual_value = actual_value
 
     def format(self, formatter: "Formatter") -> str:
@@ -0,0 +1,74 @@
+import re
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from d42 import schema
+from d42.utils import compile_alphabet, compile_pattern
+
+
+def test_compile_pattern():
+    with when:
+        compiled = compile_pattern(r"^\d+$")
+
+    with then:
+        assert isinstance(compiled, re.Pattern)
+        assert compiled.pattern == r"^\d+$"
+
+
+def test_compile_pattern_cached():
+    with given:
+        pattern = r"^cached-\d+$"
+        compiled = compile_pattern(pattern)
+        hits = compile_pattern.cache_info().hits
+
+    with when:
+        res = compile_pattern(pattern)
+
+    with then:
+        assert res is compiled
+        assert compile_pattern.cache_info().hits == hits + 1
+
+
+def test_compile_pattern_invalid():
+    with when, raises(Exception) as exception:
+        compile_pattern("[")
+
+    with then:
+        assert exception.type is re.error
+
+
+def test_regex_declaration_shares_compiled_pattern():
+    with given:
+        pattern = r"^shared-[a-z]+$"
+        sch = schema.str.regex(pattern)
+
+    with when:
+        misses = compile_pattern.cache_info().misses
+        res = sch == "shared-abc"
+
+    with then:
+        assert res is True
+        assert compile_pattern.cache_info().misses == misses
+
+
+@pytest.mark.parametrize(("alphabet", "value", "expected"), [
+    ("abc", "", True),
+    ("abc", "cab", True),
+    ("abc", "cabd", False),
+    ("abc", "dcab", False),
+    ("", "", True),
+    ("", "a", False),
+    ("^]-\\", "\\-]^", True),
+    ("a-c", "b", False),
+])
+def test_compile_alphabet(alphabet: str, value: str, expected: bool):
+    with given:
+        is_in_alphabet = compile_alphabet(alphabet)
+
+    with when:
+        res = is_in_alphabet(value)
+
+    with then:
+        assert res is expected
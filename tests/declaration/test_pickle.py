@@ -0,0 +1,49 @@
+import pickle
+from copy import deepcopy
+
+import pytest
+from baby_steps import given, then, when
+from niltype import Nil
+
+from d42 import optional, schema
+from d42.declaration import GenericSchema
+from d42.substitution import substitute
+from d42.utils import get_union_index
+
+
+@pytest.mark.parametrize("sch", [
+    schema.int.min(1),
+    schema.str.regex(r"^\d+$"),
+    schema.list([..., schema.int(1), ...]).unique(),
+    schema.dict({"id": schema.int, optional("name"): schema.str, ...: ...}),
+    schema.int | schema.none,
+    substitute(schema.list(schema.int), [1]),
+])
+def test_pickle_schema(sch: GenericSchema):
+    with when:
+        res = pickle.loads(pickle.dumps(sch))
+
+    with then:
+        assert res == sch
+        assert repr(res) == repr(sch)
+
+
+def test_pickle_nil():
+    with when:
+        res = pickle.loads(pickle.dumps(Nil))
+
+    with then:
+        assert res is Nil
+
+
+def test_pickle_schema_without_cache():
+    with given:
+        sch = schema.int | schema.str
+        get_union_index(sch)
+
+    with when:
+        res = pickle.loads(pickle.dumps(sch)), deepcopy(sch)
+
+    with then:
+        assert all("__d42_cache__" not in copied.__dict__ for copied in res)
+        assert "__d42_cache__" in sch.__dict__
@@ -0,0 +1,126 @@
+import pickle
+
+from baby_steps import given, then, when
+from pytest import raises
+
+from d42 import schema
+from d42.declaration import DeclarationError
+from d42.declaration.types import RefSchema, RefTarget
+
+
+def make_category_schema():
+    return schema.alias("Category", schema.dict({
+        "name": schema.str,
+        "children": schema.list(schema.ref("Category")),
+    }))
+
+
+def test_ref_declaration():
+    with when:
+        sch = schema.ref("Category")
+
+    with then:
+        assert isinstance(sch, RefSchema)
+        assert sch.props.name == "Category"
+        assert sch.props.target == RefTarget("Category")
+        assert sch.props.is_resolved is False
+
+
+def test_ref_unresolved_type():
+    with given:
+        sch = schema.ref("Category")
+
+    with when, raises(Exception) as exception:
+        sch.props.type
+
+    with then:
+        assert exception.type is DeclarationError
+
+
+def test_ref_resolved_in_alias():
+    with when:
+        category = make_category_schema()
+
+    with then:
+        ref = category.props.type.props.keys["children"][0].props.type
+        assert ref.props.is_resolved is True
+        assert ref.props.type is category
+
+
+def test_ref_resolved_through_aliases():
+    with given:
+        sub = schema.alias("Sub", schema.dict({"parent": schema.ref("Category")}))
+
+    with when:
+        category = schema.alias("Category", schema.dict({
+            "subs": schema.list(sub),
+        }))
+
+    with then:
+        ref = sub.props.type.props.keys["parent"][0]
+        assert ref.props.type is category
+
+
+def test_ref_of_other_name_not_resolved():
+    with when:
+        category = schema.alias("Category", schema.dict({
+            "children": schema.list(schema.ref("Tag")),
+        }))
+
+    with then:
+        ref = category.props.type.props.keys["children"][0].props.type
+        assert ref.props.is_resolved is False
+
+
+def test_ref_unguarded_declaration_error():
+    with when, raises(Exception) as exception:
+        schema.alias("Node", schema.none | schema.ref("Node"))
+
+    with then:
+        assert exception.type is DeclarationError
+
+
+def test_ref_recursive_schema_eq():
+    with when:
+        res = make_category_schema() == make_category_schema()
+
+    with then:
+        assert res is True
+
+
+def test_ref_recursive_schema_pickle():
+    with given:
+        category = make_category_schema()
+
+    with when:
+        res = pickle.loads(pickle.dumps(category))
+
+    with then:
+        assert res == category
+        ref = res.props.type.props.keys["children"][0].props.type
+        assert ref.props.type is res
+
+
+def test_ref_bound_to_other_alias_declaration_error():
+    with given:
+        node = schema.dict({"next": schema.none | schema.ref("Node")})
+        schema.alias("Node", schema.dict({"a": schema.int, "nodes": schema.list(node)}))
+
+    with when, raises(Exception) as exception:
+        schema.alias("Node", schema.dict({"b": schema.int, "nodes": schema.list(node)}))
+
+    with then:
+        assert exception.type is DeclarationError
+
+
+def test_ref_in_alias_of_same_name_declaration():
+    with given:
+        inner = make_category_schema()
+
+    with when:
+        outer = schema.alias("Category", schema.dict({"root": inner}))
+
+    with then:
+        ref = inner.props.type.props.keys["children"][0].props.type
+        assert ref.props.type is inner
+        assert outer.props.type.props.keys["root"][0] is inner
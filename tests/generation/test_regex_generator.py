@@ -12,7 +12,7 @@ import pytest
 from baby_steps import given, then, when
 from pytest import raises
 
-from d42.generation import Random, RegexGenerator
+from d42.generation import Random, RegexGenerator, parse_pattern
 
 from ._fixtures import *  # noqa: F401, F403
 
@@ -331,3 +331,17 @@ def test_unknown_category(*, regex_generator: RegexGenerator, random_: Mock):
     with then:
         assert exception.type is ValueError
         assert str(exception.value) == "Unknown category CATEGORY_NOT_WORD"
+
+
+def test_parse_pattern_cached():
+    with given:
+        pattern = r"^parsed-\d{2}$"
+        parsed = parse_pattern(pattern)
+        hits = parse_pattern.cache_info().hits
+
+    with when:
+        res = parse_pattern(pattern)
+
+    with then:
+        assert res is parsed
+        assert parse_pattern.cache_info().hits == hits + 1
@@ -0,0 +1,83 @@
+from typing import Any
+
+from baby_steps import given, then, when
+from pytest import raises
+
+from d42 import schema
+from d42.generation import Generator, Random, RegexGenerator
+from d42.generation._consts import REF_DEPTH_MAX
+from d42.validation import validate
+
+from ..._fixtures import *  # noqa: F401, F403
+
+Category = schema.alias("Category", schema.dict({
+    "name": schema.str,
+    "children": schema.list(schema.ref("Category")),
+}))
+
+
+def get_depth(value: Any) -> int:
+    return 1 + max((get_depth(child) for child in value["children"]), default=0)
+
+
+def get_size(value: Any) -> int:
+    return 1 + sum(get_size(child) for child in value["children"])
+
+
+def test_ref_generation(*, generate):
+    with when:
+        values = [generate(Category) for _ in range(20)]
+
+    with then:
+        assert all(validate(Category, value).get_errors() == [] for value in values)
+        assert max(get_depth(value) for value in values) <= REF_DEPTH_MAX + 2
+
+
+def test_ref_generation_lists_shrink(*, generate):
+    with when:
+        values = [generate(Category) for _ in range(20)]
+
+    with then:
+        # 16 children at most, then 4 per child, then 1 per grandchild
+        assert max(get_size(value) for value in values) <= 1 + 16 + 16 * 4 + 16 * 4
+
+
+def test_ref_generation_max_ref_depth():
+    with given:
+        random_ = Random()
+        generator = Generator(random_, RegexGenerator(random_), max_ref_depth=0)
+        sch = schema.alias("Node", schema.dict({
+            "value": schema.int,
+            "next": schema.none | schema.dict({"node": schema.ref("Node")}),
+        }))
+
+    with when:
+        res = sch.__accept__(generator)
+
+    with then:
+        assert validate(sch, res).get_errors() == []
+        assert (res["next"] is None) or (res["next"]["node"]["next"] is None)
+
+
+def test_ref_generation_min_len(*, generate):
+    with given:
+        sch = schema.alias("Tree", schema.dict({
+            "children": schema.list(schema.ref("Tree")).len(1, ...),
+        }) | schema.none)
+
+    with when:
+        res = generate(sch)
+
+    with then:
+        assert validate(sch, res).get_errors() == []
+
+
+def test_ref_generation_never_ends_error(*, generate):
+    with given:
+        sch = schema.alias("Loop", schema.dict({"next": schema.ref("Loop")}))
+
+    with when, raises(Exception) as exception:
+        generate(sch)
+
+    with then:
+        assert exception.type is RuntimeError
@@ -0,0 +1,198 @@
+from itertools import count
+from typing import Any
+
+from baby_steps import given, then, when
+from pytest import raises
+
+from d42 import fake, profile, schema, substitute, validate
+from d42.custom_type import CustomSchema, Props
+from d42.custom_type.visitors import Validator
+from d42.profiling import Profiler
+from d42.validation import InMemoryMetrics, ValidationResult
+
+
+def test_profile_validate():
+    with given:
+        sch = schema.dict({"id": schema.int, "tags": schema.list(schema.str)})
+        value = {"id": 1, "tags": ["a", "b", "c"]}
+
+    with when:
+        result, profiler = profile(validate, sch, value)
+
+    with then:
+        assert result.get_errors() == []
+        calls = {node.path: node.calls for node in profiler.get_stats()}
+        assert calls == {"_": 1, "_['id']": 1, "_['tags']": 1, "_['tags'][*]": 3}
+
+
+def test_profile_validator():
+    with given:
+        sch = schema.list(schema.int)
+        value = [1, "2"]
+
+    with when:
+        result, profiler = profile(Validator(), sch, value)
+
+    with then:
+        assert result.get_errors() == validate(sch, value).get_errors()
+        assert {node.path: node.calls for node in profiler.get_stats()} == {"_": 1, "_[*]": 2}
+
+
+def test_profile_validator_with_metrics():
+    with given:
+        sch = schema.list(schema.int)
+        value = [1, "2"]
+        metrics = InMemoryMetrics()
+
+    with when:
+        result, profiler = profile(Validator(metrics=metrics), sch, value)
+
+    with then:
+        assert result.get_errors() == validate(sch, value).get_errors()
+        assert {node.path: node.calls for node in profiler.get_stats()} == {"_": 1, "_[*]": 2}
+
+
+def test_profile_generate():
+    with given:
+        sch = schema.dict({"id": schema.int, "name": schema.str})
+
+    with when:
+        result, profiler = profile(fake, sch)
+
+    with then:
+        assert validate(sch, result).get_errors() == []
+        assert sorted(node.path for node in profiler.get_stats()) == \
+               ["_", "_['id']", "_['name']"]
+
+
+def test_profile_substitute():
+    with given:
+        sch = schema.dict({"id": schema.int})
+
+    with when:
+        result, profiler = profile(substitute, sch, {"id": 1})
+
+    with then:
+        assert result == substitute(sch, {"id": 1})
+        assert sorted(node.path for node in profiler.get_stats()) == ["_", "_['id']"]
+
+
+def test_profile_any_and_alias():
+    with given:
+        sch = schema.alias("Id", schema.int | schema.str)
+
+    with when:
+        _, profiler = profile(validate, sch, "1")
+
+    with then:
+        assert sorted(node.path for node in profiler.get_stats()) == \
+               ["_", "_@Id", "_@Id|1"]
+
+
+def test_profile_custom_type():
+    with given:
+        class Pair(CustomSchema[Props]):
+            elem_schema = schema.int
+
+            def __validate__(self, validator: Validator, *, value: Any = None,
+                             **kwargs: Any) -> ValidationResult:
+                result = validator.make_validation_result()
+                for elem in value:
+                    res = self.elem_schema.__accept__(validator, value=elem)
+                    result.add_errors(res.get_errors())
+                return result
+
+        sch = schema.dict({"pair": Pair()})
+
+    with when:
+        result, profiler = profile(validate, sch, {"pair": [1, "2"]})
+
+    with then:
+        assert len(result.get_errors()) == 1
+        assert {node.path: node.calls for node in profiler.get_stats()} == \
+               {"_": 1, "_['pair']": 1, "_['pair'].<IntSchema>": 2}
+
+
+def test_profiler_times():
+    with given:
+        ticks = count()
+        profiler = Profiler(timer=lambda: next(ticks))
+        sch = schema.list(schema.int)
+
+    with when:
+        sch.__accept__(profiler.wrap(Validator()), value=[1, 2])
+
+    with then:
+        root, elem = sorted(profiler.get_stats(), key=lambda node: node.path)
+        assert (elem.calls, elem.total_time, elem.self_time) == (2, 2, 2)
+        assert (root.calls, root.total_time, root.self_time) == (1, 5, 3)
+
+
+def test_profiler_report():
+    with given:
+        ticks = count()
+        profiler = Profiler(timer=lambda: next(ticks) / 1000)
+        sch = schema.dict({"id": schema.int.min(0)})
+        sch.__accept__(profiler.wrap(Validator()), value={"id": 1})
+
+    with when:
+        report = profiler.report(top=1)
+
+    with then:
+        header, line = report.splitlines()
+        assert header.split() == ["calls", "total", "ms", "self", "ms", "node"]
+        calls, total_time, self_time, *node = line.split()
+        assert (calls, total_time, self_time) == ("1", "3.000", "2.000")
+        assert node == ["_", "schema.dict({", "'id':", "schema.int.min(0)", "})"]
+
+
+def test_profiler_track_allocations():
+    with given:
+        profiler = Profiler(track_allocations=True)
+        sch = schema.list(schema.dict({"id": schema.int}))
+        sch.__accept__(profiler.wrap(Validator()), value=[{"id": "1"}] * 100)
+
+    with when:
+        report = profiler.report(top=1)
+
+    with then:
+        header, line = report.splitlines()
+        assert header.split() == ["calls", "total", "ms", "self", "ms", "blocks", "node"]
+        calls, _, _, blocks, path, *_ = line.split()
+        assert calls.isdigit() and blocks.lstrip("-").isdigit()
+        assert path.startswith("_")
+        root = next(node for node in profiler.get_stats() if node.path == "_")
+        assert root.allocated_blocks > 0
+
+
+def test_profiler_no_allocations_tracked():
+    with given:
+        profiler = Profiler()
+        sch = schema.list(schema.dict({"id": schema.int}))
+
+    with when:
+        sch.__accept__(profiler.wrap(Validator()), value=[{"id": "1"}] * 100)
+
+    with then:
+        assert all(node.allocated_blocks == 0 for node in profiler.get_stats())
+
+
+def test_profiler_keeps_visitor():
+    with given:
+        validator = Validator()
+        profiler = Profiler()
+
+    with when:
+        wrapped = profiler.wrap(validator)
+
+    with then:
+        assert wrapped is not validator
+        assert "visit_int" not in vars(validator)
+
+
+def test_profile_unknown_target():
+    with when, raises(Exception) as exception:
+        profile(print, schema.int)
+
+    with then:
+        assert exception.type is TypeError
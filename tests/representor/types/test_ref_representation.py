@@ -0,0 +1,32 @@
+from baby_steps import given, then, when
+
+from d42 import schema
+from d42.representation import represent
+
+
+def test_ref_representation():
+    with given:
+        sch = schema.ref("Category")
+
+    with when:
+        res = represent(sch)
+
+    with then:
+        assert res == "schema.ref('Category')"
+
+
+def test_ref_in_alias_representation():
+    with given:
+        sch = schema.alias("Node", schema.dict({
+            "next": schema.none | schema.ref("Node"),
+        }))
+
+    with when:
+        res = represent(sch)
+
+    with then:
+        assert res == "\n".join([
+            "Node<schema.dict({",
+            "    'next': schema.any(schema.none, schema.ref('Node'))",
+            "})>",
+        ])
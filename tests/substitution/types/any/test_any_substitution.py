@@ -145,3 +145,32 @@ def test_any_dict_substitution_error():
 
     with then:
         assert exception.type is SubstitutionError
+
+
+def test_any_discriminated_substitution():
+    with given:
+        created = schema.dict({"type": schema.str("created"), "id": schema.int})
+        deleted = schema.dict({"type": schema.str("deleted"), "id": schema.int})
+        sch = schema.any(created, deleted)
+
+    with when:
+        res = substitute(sch, {"type": "deleted", "id": 1})
+
+    with then:
+        assert res == schema.any(schema.dict({"type": schema.str("deleted"), "id": schema.int(1)}))
+
+
+def test_any_discriminated_ellipsis_substitution():
+    with given:
+        created = schema.dict({"type": schema.str("created"), "id": schema.int})
+        deleted = schema.dict({"type": schema.str("deleted"), "id": schema.int})
+        sch = schema.any(created, deleted)
+
+    with when:
+        res = substitute(sch, {"type": ..., "id": 1})
+
+    with then:
+        assert res == schema.any(
+            schema.dict({"type": schema.str("created"), "id": schema.int(1)}),
+            schema.dict({"type": schema.str("deleted"), "id": schema.int(1)}),
+        )
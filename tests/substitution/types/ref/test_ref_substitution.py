@@ -0,0 +1,41 @@
+from baby_steps import given, then, when
+from pytest import raises
+
+from d42 import schema
+from d42.substitution import substitute
+from d42.substitution.errors import SubstitutionError
+
+Category = schema.alias("Category", schema.dict({
+    "name": schema.str,
+    "children": schema.list(schema.ref("Category")),
+}))
+
+
+def test_ref_substitution():
+    with given:
+        value = {"name": "root", "children": [{"name": "leaf", "children": []}]}
+
+    with when:
+        res = substitute(Category, value)
+
+    with then:
+        assert res == schema.alias("Category", schema.dict({
+            "name": schema.str("root"),
+            "children": schema.list([
+                schema.alias("Category", schema.dict({
+                    "name": schema.str("leaf"),
+                    "children": schema.list([]),
+                })),
+            ]),
+        }))
+
+
+def test_ref_substitution_error():
+    with given:
+        value = {"name": "root", "children": [{"name": 1, "children": []}]}
+
+    with when, raises(Exception) as exception:
+        substitute(Category, value)
+
+    with then:
+        assert exception.type is SubstitutionError
@@ -0,0 +1,84 @@
+from typing import Any, List, Tuple
+
+import pytest
+from baby_steps import given, then, when
+
+from d42.utils import closest_body, match_body
+
+
+def make_is_valid(body: List[Any], calls: List[Tuple[int, Any]]):
+    def is_valid(index: int, elem: Any) -> bool:
+        calls.append((index, elem))
+        return bool(body[index] == elem)
+    return is_valid
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ([1, 2], 0),
+    ([0, 1, 2], 1),
+    ([1, 2, 1, 2], 0),
+    ([], -1),
+    ([1], -1),
+    ([2, 1], -1),
+    ([0, 0, 2], -1),
+])
+def test_match_body(value: List[Any], expected: int):
+    with given:
+        body = [1, 2]
+
+    with when:
+        res = match_body(value, len(body), make_is_valid(body, []))
+
+    with then:
+        assert res == expected
+
+
+def test_match_body_stops_at_first_match():
+    with given:
+        body = [1, 2]
+        calls: List[Tuple[int, Any]] = []
+
+    with when:
+        res = match_body([0, 1, 2] + [1, 2] * 1000, len(body), make_is_valid(body, calls))
+
+    with then:
+        assert res == 1
+        assert calls == [(0, 0), (0, 1), (1, 2)]
+
+
+def test_match_body_abandons_failed_candidates():
+    with given:
+        body = [1, 2, 3]
+        calls: List[Tuple[int, Any]] = []
+
+    with when:
+        res = match_body([1, 2, 0, 0], len(body), make_is_valid(body, calls))
+
+    with then:
+        assert res == -1
+        assert calls == [(0, 1), (1, 2), (2, 0), (0, 2), (0, 0), (0, 0)]
+
+
+def test_match_body_from_start():
+    with given:
+        body = [1]
+
+    with when:
+        res = match_body([1, 0, 1], len(body), make_is_valid(body, []), start=1)
+
+    with then:
+        assert res == 2
+
+
+@pytest.mark.parametrize(("counts", "expected"), [
+    ([], 0),
+    ([3], 0),
+    ([3, 1, 2], 1),
+    ([2, 1, 1], 1),
+])
+def test_closest_body(counts: List[int], expected: int):
+    with when:
+        res = closest_body(counts, counts.__getitem__)
+
+    with then:
+        assert res == expected
@@ -0,0 +1,146 @@
+from datetime import date, datetime
+from typing import Any, Tuple
+from unittest.mock import Mock
+
+import pytest
+from baby_steps import given, then, when
+from niltype import Nil
+
+from d42 import optional, schema
+from d42.custom_type import CustomSchema, Props
+from d42.utils import UnionIndex, get_union_index, schema_cache
+
+
+class CustomType(CustomSchema[Props]):
+    pass
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    (None, (0,)),
+    (1, (1,)),
+    (True, (1, 2)),
+    (1.0, ()),
+    ("1", (3,)),
+    ([], (4,)),
+    ({}, (5,)),
+    (date(2024, 1, 1), (6,)),
+    (datetime(2024, 1, 1), (6, 7)),
+])
+def test_union_index_candidates(value: Any, expected: Tuple[int, ...]):
+    with given:
+        sch = schema.any(schema.none, schema.int, schema.bool, schema.str,
+                         schema.list, schema.dict, schema.date, schema.datetime)
+        index = UnionIndex(sch.props.types)
+
+    with when:
+        res = index.candidates(value)
+
+    with then:
+        assert res == expected
+
+
+def test_union_index_unknown_branches():
+    with given:
+        sch = schema.any(schema.int, CustomType(), schema.alias("Name", schema.str))
+        index = UnionIndex(sch.props.types)
+
+    with when:
+        res = index.candidates("banana"), index.candidates(1)
+
+    with then:
+        assert res == ((1, 2), (0, 1))
+
+
+def test_get_union_index_cached():
+    with given:
+        sch = schema.int | schema.str
+
+    with when:
+        index = get_union_index(sch)
+
+    with then:
+        assert index.types == sch.props.types
+        assert get_union_index(sch) is index
+        assert get_union_index(schema.int | schema.str) is not index
+
+
+def test_schema_cache():
+    with given:
+        sch = schema.int
+        factory = Mock(return_value=42)
+
+    with when:
+        res = [schema_cache(sch, "key", factory), schema_cache(sch, "key", factory)]
+
+    with then:
+        assert res == [42, 42]
+        assert factory.call_count == 1
+
+
+def make_event(name: str, **keys: Any):
+    return schema.dict({"type": schema.str(name), "id": schema.int, **keys})
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ({"type": "created", "id": 1}, (0, 3)),
+    ({"type": "deleted", "id": 1}, (1, 3)),
+    ({"type": "unknown", "id": 1}, (3,)),
+    ({"id": 1}, (0, 1, 3)),
+    ({"type": [], "id": 1}, (0, 1, 3)),
+    ({"type": ..., "id": 1}, (0, 1, 3)),
+    ("created", (2, 3)),
+])
+def test_union_index_discriminator(value: Any, expected: Tuple[int, ...]):
+    with given:
+        sch = schema.any(make_event("created"), make_event("deleted"), schema.str, CustomType())
+        index = UnionIndex(sch.props.types)
+
+    with when:
+        res = index.candidates(value)
+
+    with then:
+        assert index.discriminator == "type"
+        assert res == expected
+
+
+def test_union_index_int_discriminator():
+    with given:
+        sch = schema.any(schema.dict({"v": schema.int(1)}),
+                         schema.alias("V2", schema.dict({"v": schema.int(2), "x": schema.str})))
+        index = UnionIndex(sch.props.types)
+
+    with when:
+        res = index.candidates({"v": 2}), index.candidates({"v": 3})
+
+    with then:
+        assert index.discriminator == "v"
+        assert res == ((1,), ())
+
+
+def test_union_index_unknown_literals_not_cached():
+    with given:
+        sch = schema.any(make_event("created"), make_event("deleted"))
+        index = UnionIndex(sch.props.types)
+
+    with when:
+        res = [index.candidates({"type": f"unknown{i}", "id": 1}) for i in range(1000)]
+        index.candidates({"type": "created", "id": 1})
+
+    with then:
+        assert set(res) == {()}
+        assert len(index._discriminated) == 2
+
+
+@pytest.mark.parametrize("types", [
+    (make_event("created"),),
+    (make_event("created"), schema.dict),
+    (make_event("created"), schema.dict({"type": schema.str})),
+    (make_event("created"), schema.dict({optional("type"): schema.str("deleted")})),
+])
+def test_union_index_no_discriminator(types: Tuple[Any, ...]):
+    with when:
+        index = UnionIndex(types)
+
+    with then:
+        assert index.discriminator is Nil
+        assert index.candidates({"type": "deleted"}) == tuple(range(len(types)))
@@ -0,0 +1,96 @@
+from typing import Any, List
+
+import pytest
+from baby_steps import given, then, when
+
+from d42.utils import UniqueSet, canonicalize, is_unique
+
+
+class Unhashable:
+    __hash__ = None
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Unhashable) and self.value == other.value
+
+
+@pytest.mark.parametrize("values", [
+    [],
+    [1, 2, 3],
+    [[1], (1,)],
+    [[1, 2], [2, 1]],
+    [{"a": [1]}, {"a": [2]}],
+    [{1, 2}, {1, 3}],
+    [float("nan"), float("nan")],
+    [Unhashable(1), Unhashable(2), 1],
+])
+def test_is_unique(values: List[Any]):
+    with when:
+        res = is_unique(values)
+
+    with then:
+        assert res is True
+
+
+@pytest.mark.parametrize("values", [
+    [1, 2, 1],
+    [1, True],
+    [1, 1.0],
+    [[1, 2], [1, 2]],
+    [(1, [2]), (1, [2])],
+    [{"a": [1], "b": {"c": 2}}, {"b": {"c": 2}, "a": [1]}],
+    [{1, 2}, {2, 1}],
+    [Unhashable(1), Unhashable(1)],
+    [Unhashable([1]), 1, Unhashable([1])],
+])
+def test_is_not_unique(values: List[Any]):
+    with when:
+        res = is_unique(values)
+
+    with then:
+        assert res is False
+
+
+def test_is_unique_large_list():
+    with given:
+        values = [{"id": i, "tags": [str(i)]} for i in range(20_000)]
+
+    with when:
+        res_unique = is_unique(values)
+        res_duplicate = is_unique(values + [{"id": 0, "tags": ["0"]}])
+
+    with then:
+        assert res_unique is True
+        assert res_duplicate is False
+
+
+def test_canonicalize_equal_values():
+    with when:
+        res1 = canonicalize({"a": [1, {"b": 2}]})
+        res2 = canonicalize({"a": [1, {"b": 2}]})
+
+    with then:
+        assert res1 == res2
+        assert hash(res1) == hash(res2)
+
+
+def test_canonicalize_unhashable():
+    with when, pytest.raises(Exception) as exception:
+        canonicalize([Unhashable(1)])
+
+    with then:
+        assert exception.type is TypeError
+
+
+def test_unique_set_add():
+    with given:
+        seen = UniqueSet()
+
+    with when:
+        added = [seen.add(v) for v in [[1], [1], Unhashable(1), Unhashable(1), (1,)]]
+
+    with then:
+        assert added == [True, False, True, False, True]
+        assert len(seen) == 3
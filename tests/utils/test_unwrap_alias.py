@@ -0,0 +1,27 @@
+from baby_steps import given, then, when
+
+from d42 import schema
+from d42.utils import unwrap_alias
+
+
+def test_unwrap_alias():
+    with given:
+        sch = schema.dict({"id": schema.int})
+        alias = schema.alias("Outer", schema.alias("Inner", sch))
+
+    with when:
+        res = unwrap_alias(alias)
+
+    with then:
+        assert res is sch
+
+
+def test_unwrap_alias_not_alias():
+    with given:
+        sch = schema.int
+
+    with when:
+        res = unwrap_alias(sch)
+
+    with then:
+        assert res is sch
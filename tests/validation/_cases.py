@@ -0,0 +1,108 @@
+from datetime import date, datetime
+from typing import Any, List, Tuple
+from uuid import UUID, uuid1, uuid4
+
+from d42 import optional, schema
+from d42.declaration import GenericSchema
+
+__all__ = ("CASES",)
+
+_UUID = UUID("2f3b8c9a-54d6-4b0f-9ed4-14a59cd8a2c3")
+
+_user = schema.dict({
+    "id": schema.int.min(1),
+    "name": schema.str.len(1, 8),
+    optional("email"): schema.str.contains("@"),
+    "tags": schema.list(schema.str.alphabet("abc")).len(0, 3),
+})
+
+_event = schema.any(*[
+    schema.dict({"type": schema.str(name), "id": schema.int.min(1)})
+    for name in ("created", "updated", "deleted")
+]) | schema.none
+
+CASES: List[Tuple[GenericSchema, Any]] = [
+    (schema.none, None),
+    (schema.none, 0),
+    (schema.bool, True),
+    (schema.bool, 1),
+    (schema.bool(False), True),
+    (schema.int, 42),
+    (schema.int, 4.2),
+    (schema.int, True),
+    (schema.int(42), 41),
+    (schema.int.min(0), -1),
+    (schema.int.max(0), 1),
+    (schema.int.min(1).max(0), 5),
+    (schema.float, 3.14),
+    (schema.float, 3),
+    (schema.float(3.14), 3.15),
+    (schema.float(3.14).precision(1), 3.11),
+    (schema.float(3.14).precision(2), 3.11),
+    (schema.float.min(0.0).max(1.0), 1.5),
+    (schema.str, "banana"),
+    (schema.str, b"banana"),
+    (schema.str("banana"), "apple"),
+    (schema.str.len(3), "ab"),
+    (schema.str.len(1, 2), "abc"),
+    (schema.str.len(4, ...), "abc"),
+    (schema.str.len(2).contains("z"), "abc"),
+    (schema.str.alphabet("ab"), "abc"),
+    (schema.str.alphabet("^]-\\"), "]^\\-"),
+    (schema.str.alphabet("a-c"), "b"),
+    (schema.str.alphabet(""), ""),
+    (schema.str.alphabet(""), "a"),
+    (schema.str.regex(r"^\d+$"), "12a"),
+    (schema.str.regex(r"^\d+$"), "123"),
+    (schema.bytes, b"banana"),
+    (schema.bytes(b"banana"), b"apple"),
+    (schema.uuid4, _UUID),
+    (schema.uuid4, uuid1()),
+    (schema.uuid4(_UUID), uuid4()),
+    (schema.uuid4, str(_UUID)),
+    (schema.datetime, datetime(2024, 1, 1)),
+    (schema.datetime(datetime(2024, 1, 1)), datetime(2024, 1, 2)),
+    (schema.date, date(2024, 1, 1)),
+    (schema.date(date(2024, 1, 1)), date(2024, 1, 2)),
+    (schema.list, []),
+    (schema.list, {}),
+    (schema.list.len(2), [1]),
+    (schema.list.unique(), [1, 2, 1]),
+    (schema.list(schema.int), [1, "2", 3, None]),
+    (schema.list(schema.int).len(1, 2), [1, 2, 3]),
+    (schema.list([schema.int, schema.str]), [1, "2", 3]),
+    (schema.list([schema.int, schema.str]), [1]),
+    (schema.list([schema.int(1), ...]), [2, 3]),
+    (schema.list([..., schema.int(1)]), [2, 3]),
+    (schema.list([..., schema.int(1)]), []),
+    (schema.list([..., schema.int(1), schema.int(2), ...]), [0, 1, 2, 3]),
+    (schema.list([..., schema.int(1), schema.int(2), ...]), [0, 1, 3, 2]),
+    (schema.list([..., schema.int(1), schema.int(2), ...]), [2, 1]),
+    (schema.list([..., schema.int(1), schema.int(2), ...]), []),
+    (schema.dict, {}),
+    (schema.dict, []),
+    (schema.dict({}), {"a": 1}),
+    (schema.dict({"a": schema.int, ...: ...}), {"a": 1, "b": 2}),
+    (schema.dict({"a": schema.int, optional("b"): schema.str}), {"b": 1, "c": 2}),
+    (schema.any, object()),
+    (schema.any(schema.int, schema.str), None),
+    (schema.any(schema.int, schema.str), "banana"),
+    (schema.any(schema.int(1), schema.dict({"a": schema.int})), {"a": "1"}),
+    (schema.any(schema.str, schema.int(1)), True),
+    (schema.any(schema.str, schema.int, schema.bool(False)), True),
+    (schema.any(schema.date(date(2024, 1, 1)), schema.datetime), date(2024, 1, 2)),
+    (schema.any(schema.none, schema.alias("Id", schema.int.min(1))), 0),
+    (schema.any(schema.none, schema.alias("Id", schema.int.min(1))), 1),
+    (schema.any(schema.none, schema.str, schema.list(schema.int)), ["1"]),
+    (schema.alias("Id", schema.int.min(1)), 0),
+    (_user, {"id": 1, "name": "Bob", "tags": ["ab"]}),
+    (_user, {"id": 0, "name": "", "email": "bob", "tags": ["abd", "c", "a", "b"], "x": 1}),
+    (_event, {"type": "updated", "id": 1}),
+    (_event, {"type": "updated", "id": 0}),
+    (_event, {"type": "moved", "id": 1}),
+    (_event, {"type": ["updated"], "id": 1}),
+    (_event, {"id": 1}),
+    (_event, "updated"),
+    (schema.list(_user), [{"id": 1, "name": "Bob", "tags": []}, {"id": "1"}, None]),
+    (schema.list(schema.int | schema.list(schema.int)), [1, [2, "3"], "4"]),
+]
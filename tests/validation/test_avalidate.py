@@ -0,0 +1,195 @@
+import asyncio
+import sys
+from typing import Any, AsyncIterator, List
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+from th import PathHolder
+
+from d42 import avalidate, schema
+from d42.declaration import GenericSchema
+from d42.substitution import SubstitutorValidator
+from d42.validation import ValidationResult, Validator, validate
+from d42.validation.errors import LengthValidationError, TypeValidationError
+
+from ._cases import CASES
+
+
+async def aiterate(values: List[Any]) -> AsyncIterator[Any]:
+    for value in values:
+        yield value
+
+
+@pytest.mark.parametrize(("sch", "value"), CASES)
+@pytest.mark.parametrize("yield_every", [1, 1000])
+def test_avalidate_same_errors_as_validator(sch: GenericSchema, value: Any, yield_every: int):
+    with when:
+        result = asyncio.run(avalidate(sch, value, yield_every=yield_every))
+
+    with then:
+        assert result.get_errors() == validate(sch, value).get_errors()
+
+
+@pytest.mark.parametrize(("sch", "value"), CASES)
+@pytest.mark.parametrize("max_errors", [1, 2])
+def test_avalidate_max_errors_same_result_as_validator(sch: GenericSchema, value: Any,
+                                                       max_errors: int):
+    with given:
+        expected = sch.__accept__(Validator(max_errors=max_errors), value=value)
+
+    with when:
+        result = asyncio.run(avalidate(sch, value, yield_every=1,
+                                       validator=Validator(max_errors=max_errors)))
+
+    with then:
+        assert result.get_errors() == expected.get_errors()
+        assert result.is_truncated() == expected.is_truncated()
+
+
+def test_avalidate_deeper_than_recursion_limit():
+    with given:
+        sch: GenericSchema = schema.int
+        value: Any = 1
+        for _ in range(sys.getrecursionlimit()):
+            sch, value = schema.list(sch), [value]
+
+    with when:
+        result = asyncio.run(avalidate(sch, value))
+
+    with then:
+        assert result.get_errors() == []
+
+
+def test_avalidate_yields_to_event_loop():
+    with given:
+        sch = schema.list(schema.dict({"id": schema.int, "name": schema.str}))
+        value = [{"id": index, "name": "Bob"} for index in range(10_000)]
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        async def main() -> int:
+            task = asyncio.create_task(ticker())
+            await asyncio.sleep(0)
+            ticks_before = ticks
+            await avalidate(sch, value, yield_every=100)
+            task.cancel()
+            return ticks - ticks_before
+
+    with when:
+        ticks_during = asyncio.run(main())
+
+    with then:
+        # 30,001 nodes / 100
+        assert ticks_during >= 300
+
+
+def test_avalidate_max_errors_yields_to_event_loop():
+    with given:
+        sch = schema.list(schema.dict({"id": schema.int}))
+        value = [{"id": index} for index in range(10_000)] + [{"id": "1"}, {"id": "2"}]
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        async def main() -> ValidationResult:
+            task = asyncio.create_task(ticker())
+            await asyncio.sleep(0)
+            result = await avalidate(sch, value, yield_every=100,
+                                     validator=Validator(max_errors=1))
+            task.cancel()
+            return result
+
+    with when:
+        result = asyncio.run(main())
+
+    with then:
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()[10_000]["id"], "1", int),
+        ]
+        assert result.is_truncated()
+        # 20,003 nodes / 100
+        assert ticks >= 200
+
+
+def test_avalidate_async_iterable():
+    with given:
+        values = [1, "2", 3, None]
+        sch = schema.list(schema.int)
+
+    with when:
+        result = asyncio.run(avalidate(sch, aiterate(values)))
+
+    with then:
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()[1], "2", int),
+            TypeValidationError(PathHolder()[3], None, int),
+        ]
+        assert result.get_errors() == validate(sch, values).get_errors()
+
+
+def test_avalidate_async_iterable_max_errors():
+    with given:
+        values = [1, "2", "3", "4", 5]
+        consumed: List[Any] = []
+
+        async def consume() -> AsyncIterator[Any]:
+            for value in values:
+                consumed.append(value)
+                yield value
+
+    with when:
+        result = asyncio.run(avalidate(schema.list(schema.int), consume(),
+                                       validator=Validator(max_errors=2)))
+
+    with then:
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()[1], "2", int),
+            TypeValidationError(PathHolder()[2], "3", int),
+        ]
+        assert result.is_truncated()
+        # The element that tells there's more is the last one pulled
+        assert consumed == values[:4]
+
+
+def test_avalidate_async_iterable_with_list_constraints():
+    with given:
+        values = [1, 2, 3]
+        sch = schema.list(schema.int).len(2)
+
+    with when:
+        result = asyncio.run(avalidate(sch, aiterate(values)))
+
+    with then:
+        assert result.get_errors() == [
+            LengthValidationError(PathHolder(), values, 2),
+        ]
+
+
+def test_avalidate_custom_validator():
+    with given:
+        sch = schema.list(schema.int)
+        value = [..., 1, ...]
+
+    with when, pytest.warns(RuntimeWarning):
+        result = asyncio.run(avalidate(sch, value, validator=SubstitutorValidator()))
+
+    with then:
+        assert result.get_errors() == []
+
+
+def test_avalidate_invalid_yield_every():
+    with when, raises(Exception) as exception:
+        asyncio.run(avalidate(schema.int, 1, yield_every=0))
+
+    with then:
+        assert exception.type is ValueError
@@ -0,0 +1,78 @@
+from typing import Any
+from unittest.mock import Mock, sentinel
+
+import pytest
+from baby_steps import given, then, when
+from th import PathHolder
+
+from d42 import schema
+from d42.custom_type import CustomSchema, Props, ValidationResult
+from d42.declaration import GenericSchema
+from d42.validation import Checker, Validator, eq, is_valid, validate
+from d42.validation.errors import TypeValidationError
+
+from ._cases import CASES
+
+
+@pytest.mark.parametrize(("sch", "value"), CASES)
+def test_is_valid_agrees_with_validator(sch: GenericSchema, value: Any):
+    with when:
+        result = is_valid(sch, value)
+
+    with then:
+        assert result is (not validate(sch, value).has_errors())
+
+
+@pytest.mark.parametrize(("sch", "value"), CASES)
+def test_eq_agrees_with_validator(sch: GenericSchema, value: Any):
+    with when:
+        result = (sch == value)
+
+    with then:
+        assert result is (not validate(sch, value).has_errors())
+
+
+def test_eq_schema():
+    with when:
+        result = eq(schema.list(schema.int), schema.list(schema.int))
+
+    with then:
+        assert result is True
+
+
+def test_is_valid_short_circuits():
+    with given:
+        mock = Mock(return_value=ValidationResult())
+
+        class CustomType(CustomSchema[Props]):
+            __validate__ = mock
+
+        sch = schema.list([schema.int, CustomType()])
+
+    with when:
+        result = is_valid(sch, ["1", sentinel.value])
+
+    with then:
+        assert result is False
+        assert mock.mock_calls == []
+
+
+@pytest.mark.parametrize(("errors", "expected"), [
+    ([], True),
+    ([TypeValidationError(PathHolder(), sentinel.value, int)], False),
+])
+def test_is_valid_custom_type_fallback(errors, expected):
+    with given:
+        mock = Mock(return_value=ValidationResult(errors))
+
+        class CustomType(CustomSchema[Props]):
+            __validate__ = mock
+
+        checker = Checker(Validator())
+
+    with when:
+        result = CustomType().__accept__(checker, value=sentinel.value)
+
+    with then:
+        assert result is expected
+        assert len(mock.mock_calls) == 1
@@ -0,0 +1,102 @@
+from typing import Any
+from unittest.mock import Mock, sentinel
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+from th import PathHolder
+
+from d42 import schema
+from d42.custom_type import CustomSchema, Props, ValidationResult
+from d42.declaration import GenericSchema
+from d42.validation import CompiledValidator, Compiler, Validator, compile, validate
+from d42.validation.errors import TypeValidationError
+
+from ._cases import CASES
+
+
+@pytest.mark.parametrize(("sch", "value"), CASES)
+def test_compile_same_errors_as_validator(sch: GenericSchema, value: Any):
+    with given:
+        compiled = compile(sch)
+
+    with when:
+        result = compiled(value)
+
+    with then:
+        assert isinstance(result, ValidationResult)
+        assert result.get_errors() == validate(sch, value).get_errors()
+
+
+def test_compile_returns_compiled_validator():
+    with given:
+        sch = schema.int
+
+    with when:
+        compiled = compile(sch)
+
+    with then:
+        assert isinstance(compiled, CompiledValidator)
+        assert compiled.schema is sch
+        assert repr(compiled) == "CompiledValidator(schema.int)"
+
+
+def test_compile_reusable():
+    with given:
+        compiled = compile(schema.list(schema.int))
+
+    with when:
+        results = [compiled([1, 2]), compiled(["1"]), compiled([3])]
+
+    with then:
+        assert [r.has_errors() for r in results] == [False, True, False]
+
+
+def test_compile_custom_path():
+    with given:
+        compiled = compile(schema.int)
+
+    with when:
+        result = compiled("1", path=PathHolder()["id"])
+
+    with then:
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()["id"], "1", int),
+        ]
+
+
+def test_compile_custom_type_fallback():
+    with given:
+        error = TypeValidationError(PathHolder()[0], sentinel.value, int)
+        mock = Mock(return_value=ValidationResult([error]))
+
+        class CustomType(CustomSchema[Props]):
+            __validate__ = mock
+
+        compiled = compile(schema.list([CustomType()]))
+
+    with when:
+        result = compiled([sentinel.value])
+
+    with then:
+        assert result.get_errors() == [error]
+        assert len(mock.mock_calls) == 1
+        assert isinstance(mock.mock_calls[0].args[0], Validator)
+        assert mock.mock_calls[0].kwargs == {"value": sentinel.value, "path": PathHolder()[0]}
+
+
+class CustomValidator(Validator):
+    pass
+
+
+@pytest.mark.parametrize("validator", [
+    Validator(max_errors=2),
+    Validator(fail_fast=True),
+    CustomValidator(),
+])
+def test_compiler_unsupported_validator(validator: Validator):
+    with when, raises(Exception) as exception:
+        Compiler(validator)
+
+    with then:
+        assert exception.type is ValueError
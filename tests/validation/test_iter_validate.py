@@ -0,0 +1,110 @@
+import io
+import json
+from typing import Any, List
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+from th import PathHolder
+
+from d42 import schema
+from d42.validation import iter_validate, validate
+from d42.validation.errors import MinValueValidationError, TypeValidationError
+
+RecordSchema = schema.dict({
+    "id": schema.int.min(1),
+    "name": schema.str,
+    "tags": schema.list(schema.str),
+})
+
+RECORDS: List[Any] = [
+    {"id": 1, "name": "Bob", "tags": []},
+    {"id": 0, "name": "Alice", "tags": ["a"]},
+    {"id": 2, "name": "Eve, \"the ]spy[\"", "tags": ["a", "b"]},
+    {"id": 3, "name": None, "tags": [1]},
+    12345678901234567890,
+    {"id": 4, "name": "Mallory", "tags": []},
+]
+
+
+def get_errors(results):
+    return [(index, result.get_errors()) for index, result in results]
+
+
+def test_iter_validate_ndjson():
+    with given:
+        fileobj = io.StringIO("\n".join(json.dumps(r) for r in RECORDS) + "\n\n")
+
+    with when:
+        results = list(iter_validate(RecordSchema, fileobj))
+
+    with then:
+        assert [index for index, _ in results] == [1, 3, 4]
+        assert results[0][1].get_errors() == [
+            MinValueValidationError(PathHolder()["id"], 0, 1),
+        ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_iter_validate_json_array(chunk_size: int):
+    with given:
+        data = json.dumps(RECORDS, indent=2).encode()
+        sch = schema.list(RecordSchema)
+
+    with when:
+        results = iter_validate(sch, io.BytesIO(data), format="json-array",
+                                chunk_size=chunk_size)
+
+    with then:
+        assert [e for _, errors in get_errors(results) for e in errors] == \
+            validate(sch, RECORDS).get_errors()
+
+
+@pytest.mark.parametrize("data", ["[]", " [ ] ", "[1]", "[1, 2.5e3, \"x\"]"])
+def test_iter_validate_json_array_values(data: str):
+    with when:
+        results = list(iter_validate(schema.int, io.StringIO(data), format="json-array",
+                                     chunk_size=2))
+
+    with then:
+        assert [index for index, _ in results] == [
+            index for index, value in enumerate(json.loads(data)) if not isinstance(value, int)
+        ]
+
+
+def test_iter_validate_list_path():
+    with given:
+        fileobj = io.StringIO('[1, "2"]')
+
+    with when:
+        results = list(iter_validate(schema.list(schema.int), fileobj, format="json-array"))
+
+    with then:
+        assert get_errors(results) == [
+            (1, [TypeValidationError(PathHolder()[1], "2", int)]),
+        ]
+
+
+@pytest.mark.parametrize("data", ["", "{}", "[1", "[1 2]", "[1,]"])
+def test_iter_validate_malformed_json_array(data: str):
+    with when, raises(Exception) as exception:
+        list(iter_validate(schema.int, io.StringIO(data), format="json-array", chunk_size=2))
+
+    with then:
+        assert isinstance(exception.value, ValueError)
+
+
+def test_iter_validate_unknown_format():
+    with when, raises(Exception) as exception:
+        iter_validate(schema.int, io.StringIO(""), format="csv")
+
+    with then:
+        assert exception.type is ValueError
+
+
+def test_iter_validate_unsupported_list_schema():
+    with when, raises(Exception) as exception:
+        iter_validate(schema.list(schema.int).len(1), io.StringIO(""))
+
+    with then:
+        assert exception.type is ValueError
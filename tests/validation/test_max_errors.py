@@ -0,0 +1,186 @@
+from typing import Any
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+from th import PathHolder
+
+from d42 import optional, schema
+from d42.declaration import GenericSchema
+from d42.validation import ValidationException, Validator, validate, validate_or_fail
+from d42.validation.errors import (
+    ExtraKeyValidationError,
+    MissingKeyValidationError,
+    TypeValidationError,
+)
+
+from ._cases import CASES
+
+
+@pytest.mark.parametrize(("sch", "value"), [
+    (sch, value) for sch, value in CASES if not isinstance(sch, type(schema.any))
+])
+@pytest.mark.parametrize("max_errors", [1, 2, 3])
+def test_max_errors_keeps_first_errors(sch: GenericSchema, value: Any, max_errors: int):
+    with given:
+        errors = validate(sch, value).get_errors()
+
+    with when:
+        result = validate(sch, value, max_errors=max_errors)
+
+    with then:
+        assert result.get_errors() == errors[:max_errors]
+        assert result.is_truncated() == (len(errors) > max_errors)
+
+
+def test_max_errors_stops_traversal():
+    with given:
+        sch = schema.list(schema.dict({"id": schema.int}))
+        value = [{"id": str(index)} for index in range(1000)]
+        visited = 0
+
+        class CountingValidator(Validator):
+            def visit_int(self, *args: Any, **kwargs: Any) -> Any:
+                nonlocal visited
+                visited += 1
+                return super().visit_int(*args, **kwargs)
+
+    with when:
+        result = sch.__accept__(CountingValidator(max_errors=3), value=value)
+
+    with then:
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()[index]["id"], str(index), int)
+            for index in range(3)
+        ]
+        assert result.is_truncated()
+        assert visited == 3
+
+
+def test_max_errors_not_reached():
+    with given:
+        sch = schema.list(schema.int)
+        value = [1, "2", 3]
+
+    with when:
+        result = validate(sch, value, max_errors=2)
+
+    with then:
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()[1], "2", int),
+        ]
+        assert not result.is_truncated()
+
+
+@pytest.mark.parametrize(("sch", "value"), [
+    (schema.list(schema.int), [1, "2"]),
+    (schema.list(schema.int), ["1"]),
+    (schema.list([schema.int, schema.str]), [1, 2]),
+    (schema.list([schema.int, schema.str]), [1]),
+    (schema.dict({"id": schema.int, optional("name"): schema.str, ...: ...}), {"id": "1"}),
+    (schema.dict({"id": schema.int}), {"id": 1, "name": "Bob"}),
+    (schema.dict({"a": schema.list(schema.int), "b": schema.int}), {"a": [1, 2], "b": "3"}),
+])
+def test_max_errors_reached_at_the_end(sch: GenericSchema, value: Any):
+    with when:
+        result = validate(sch, value, max_errors=1)
+
+    with then:
+        assert result.get_errors() == validate(sch, value).get_errors()
+        assert not result.is_truncated()
+
+
+def test_max_errors_dict_keys():
+    with given:
+        sch = schema.dict({"id": schema.int, "name": schema.str})
+        value = {"extra1": 1, "extra2": 2}
+
+    with when:
+        result = validate(sch, value, max_errors=3)
+
+    with then:
+        assert result.get_errors() == [
+            MissingKeyValidationError(PathHolder(), value, "id"),
+            MissingKeyValidationError(PathHolder(), value, "name"),
+            ExtraKeyValidationError(PathHolder(), value, "extra1"),
+        ]
+        assert result.is_truncated()
+
+
+def test_max_errors_union_branches_dont_share_budget():
+    with given:
+        # The first branch fails, its errors must not stop the second one
+        sch = schema.list(schema.list(schema.str) | schema.list(schema.int))
+        value = [[1, 2, 3], [1, 2, 3], ["a", 2]]
+
+    with when:
+        result = validate(sch, value, max_errors=2)
+
+    with then:
+        errors = result.get_errors()
+        assert [error.path for error in errors] == [PathHolder()[2]]
+        assert not result.is_truncated()
+
+
+def test_fail_fast():
+    with given:
+        sch = schema.list(schema.int)
+        value = ["1", "2"]
+
+    with when:
+        result = validate(sch, value, fail_fast=True)
+
+    with then:
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()[0], "1", int),
+        ]
+        assert result.is_truncated()
+
+
+def test_validator_fail_fast():
+    with when:
+        validator = Validator(fail_fast=True)
+
+    with then:
+        assert validator.max_errors == 1
+
+
+def test_validate_or_fail_max_errors():
+    with given:
+        sch = schema.list(schema.int)
+        value = [str(index) for index in range(100)]
+
+    with when, raises(Exception) as exception:
+        validate_or_fail(sch, value, max_errors=2)
+
+    with then:
+        assert exception.type is ValidationException
+        assert str(exception.value) == "\n - ".join([
+            "",
+            "Value '0' at _[0] must be <class 'int'>, but <class 'str'> given",
+            "Value '1' at _[1] must be <class 'int'>, but <class 'str'> given",
+            "... (stopped after 2 errors)",
+        ])
+
+
+@pytest.mark.parametrize("max_errors", [0, -1])
+def test_invalid_max_errors(max_errors: int):
+    with when, raises(Exception) as exception:
+        validate(schema.int, 1, max_errors=max_errors)
+
+    with then:
+        assert exception.type is ValueError
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    (["1", "2"], ["Value '1' at _[0] must be <class 'int'>, but <class 'str'> given",
+                  "... (stopped after 1 error)"]),
+    (["1"], ["Value '1' at _[0] must be <class 'int'>, but <class 'str'> given"]),
+])
+def test_validate_or_fail_fail_fast(value: Any, expected: Any):
+    with when, raises(Exception) as exception:
+        validate_or_fail(schema.list(schema.int), value, fail_fast=True)
+
+    with then:
+        assert exception.type is ValidationException
+        assert str(exception.value) == "\n - ".join(["", *expected])
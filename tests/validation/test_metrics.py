@@ -0,0 +1,198 @@
+import asyncio
+from typing import Any, List, Tuple
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+from th import PathHolder
+
+from d42 import avalidate, schema, validate
+from d42.declaration import GenericSchema
+from d42.validation import (
+    Compiler,
+    Histogram,
+    InMemoryMetrics,
+    Path,
+    ValidationResult,
+    Validator,
+    compile,
+    get_metrics_sink,
+    path_template,
+    set_metrics_sink,
+)
+
+
+@pytest.mark.parametrize(("path", "expected"), [
+    (PathHolder(), "_"),
+    (PathHolder()["items"][0]["id"], "_['items'][*]['id']"),
+    (Path()["items"][10][2], "_['items'][*][*]"),
+    (Path(PathHolder()["items"])[1], "_['items'][*]"),
+    (Path()[True]["1"], "_[True]['1']"),
+])
+def test_path_template(path: Any, expected: str):
+    with when:
+        template = path_template(path)
+
+    with then:
+        assert template == expected
+
+
+def test_validate_metrics():
+    with given:
+        sch = schema.dict({"items": schema.list(schema.dict({"id": schema.int}))})
+        metrics = InMemoryMetrics()
+
+    with when:
+        validate(sch, {"items": [{"id": 1}]}, metrics=metrics)
+        validate(sch, {"items": [{"id": "1"}, {"id": "2"}, {}]}, metrics=metrics)
+
+    with then:
+        stats = metrics.get(sch)
+        assert (stats.calls, stats.failures, stats.latency.count) == (2, 1, 2)
+        assert stats.errors == {
+            ("TypeValidationError", "_['items'][*]['id']"): 2,
+            ("MissingKeyValidationError", "_['items'][*]"): 1,
+        }
+        assert metrics.items() == [(sch, stats)]
+
+
+def test_validate_metrics_same_declaration():
+    with given:
+        metrics = InMemoryMetrics()
+
+    with when:
+        for value in [1, "2", 3]:
+            validate(schema.dict({"id": schema.int}), {"id": value}, metrics=metrics)
+
+    with then:
+        assert len(metrics) == 1
+        stats = metrics.get(schema.dict({"id": schema.int}))
+        assert (stats.calls, stats.failures) == (3, 1)
+
+
+def test_validate_metrics_maxsize():
+    with given:
+        metrics = InMemoryMetrics(maxsize=2)
+        first, second, third = schema.int(1), schema.int(2), schema.int(3)
+
+    with when:
+        validate(first, 1, metrics=metrics)
+        validate(second, 2, metrics=metrics)
+        validate(first, 1, metrics=metrics)
+        validate(third, 3, metrics=metrics)
+
+    with then:
+        assert [(s, m.calls) for s, m in metrics.items()] == [(first, 2), (third, 1)]
+        assert metrics.get(second).calls == 0
+
+
+def test_metrics_invalid_maxsize():
+    with when, raises(Exception) as exception:
+        InMemoryMetrics(maxsize=0)
+
+    with then:
+        assert exception.type is ValueError
+
+
+def test_validate_metrics_callback():
+    with given:
+        observed: List[Tuple[GenericSchema, float, ValidationResult]] = []
+        metrics = InMemoryMetrics(lambda *args: observed.append(args))
+        sch = schema.int
+
+    with when:
+        result = validate(sch, "1", metrics=metrics)
+
+    with then:
+        (observed_schema, elapsed, observed_result), = observed
+        assert observed_schema is sch
+        assert elapsed >= 0
+        assert observed_result is result
+
+
+def test_set_metrics_sink():
+    with given:
+        metrics = InMemoryMetrics()
+        sch = schema.int
+        set_metrics_sink(metrics)
+
+    try:
+        with when:
+            validate(sch, 1)
+            validate(sch, "1")
+    finally:
+        set_metrics_sink(None)
+
+    with then:
+        assert (metrics.get(sch).calls, metrics.get(sch).failures) == (2, 1)
+        assert get_metrics_sink() is None
+
+
+def test_validator_metrics_observes_outermost_call():
+    with given:
+        metrics = InMemoryMetrics()
+        validator = Validator(metrics=metrics, max_errors=5)
+        item = schema.int | schema.str
+        sch = schema.list(item)
+
+    with when:
+        result = sch.__accept__(validator, value=[1, "2", None])
+
+    with then:
+        assert result.get_errors() == validate(sch, [1, "2", None]).get_errors()
+        assert [(s, m.calls) for s, m in metrics.items()] == [(sch, 1)]
+        assert metrics.get(sch).errors == {("SchemaMismatchValidationError", "_[*]"): 1}
+
+
+def test_compiled_validator_metrics():
+    with given:
+        metrics = InMemoryMetrics()
+        sch = schema.list(schema.int)
+        compiled = compile(sch)
+
+    with when:
+        metered = Compiler(Validator(metrics=metrics)).compile(sch)
+        metered([1, "2"])
+        compiled([1, "2"])
+
+    with then:
+        assert metrics.get(sch).calls == 1
+        assert metrics.get(sch).errors == {("TypeValidationError", "_[*]"): 1}
+
+
+def test_avalidate_metrics():
+    with given:
+        metrics = InMemoryMetrics()
+        sch = schema.list(schema.dict({"id": schema.int}))
+
+    with when:
+        asyncio.run(avalidate(sch, [{"id": "1"}] * 3, validator=Validator(metrics=metrics)))
+
+    with then:
+        assert [(s, m.calls) for s, m in metrics.items()] == [(sch, 1)]
+        assert metrics.get(sch).errors == {("TypeValidationError", "_[*]['id']"): 3}
+
+
+def test_histogram():
+    with given:
+        histogram = Histogram([1, 2, 5])
+
+    with when:
+        for value in [0.5, 1.5, 1.5, 3, 7]:
+            histogram.observe(value)
+
+    with then:
+        assert (histogram.count, histogram.sum, histogram.max) == (5, 13.5, 7)
+        assert histogram.buckets() == [(1, 1), (2, 3), (5, 4), (float("inf"), 5)]
+        assert histogram.quantile(0) == 1
+        assert histogram.quantile(0.5) == 2
+        assert histogram.quantile(0.8) == 5
+        assert histogram.quantile(0.99) == 7
+
+
+def test_histogram_invalid_quantile():
+    with when, raises(Exception) as exception:
+        Histogram().quantile(1.5)
+
+    with then:
+        assert exception.type is ValueError
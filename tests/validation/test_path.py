@@ -0,0 +1,122 @@
+from copy import deepcopy
+from unittest.mock import Mock
+
+from baby_steps import given, then, when
+from th import PathHolder
+
+from d42 import schema
+from d42.custom_type import CustomSchema, Props, ValidationResult
+from d42.validation import Path, validate
+from d42.validation.errors import AlphabetValidationError, TypeValidationError
+
+
+def test_path_root():
+    with when:
+        path = Path()
+
+    with then:
+        assert len(path) == 0
+        assert path.keys() == []
+        assert path.to_path_holder() == PathHolder()
+
+
+def test_path_getitem():
+    with given:
+        root = Path()
+
+    with when:
+        path = root["items"][0]
+
+    with then:
+        assert len(path) == 2
+        assert path.keys() == ["items", 0]
+        assert path.to_path_holder() == PathHolder()["items"][0]
+        assert len(root) == 0
+
+
+def test_path_shares_parents():
+    with given:
+        parent = Path()["items"]
+
+    with when:
+        first, second = parent[0], parent[1]
+
+    with then:
+        assert first.to_path_holder() == PathHolder()["items"][0]
+        assert second.to_path_holder() == PathHolder()["items"][1]
+        assert parent.to_path_holder() == PathHolder()["items"]
+
+
+def test_path_custom_holder():
+    with given:
+        holder = PathHolder("_").items
+
+    with when:
+        path = Path(holder)[0]
+
+    with then:
+        assert len(path) == 2
+        assert path.to_path_holder() == PathHolder("_").items[0]
+        assert holder == PathHolder("_").items
+
+
+def test_path_immutable_copy():
+    with given:
+        path = Path()[0]
+
+    with when:
+        copied = deepcopy(path)
+
+    with then:
+        assert copied is path
+
+
+def test_path_eq_repr():
+    with given:
+        path = Path()["key"][1]
+
+    with then:
+        assert path == Path()["key"][1]
+        assert path == PathHolder()["key"][1]
+        assert path != Path()["key"]
+        assert repr(path) == "PathHolder()['key'][1]"
+
+
+def test_error_path_is_materialized_lazily():
+    with given:
+        value = {"items": [1, "2"]}
+
+    with when:
+        errors = validate(schema.dict({"items": schema.list(schema.int)}), value).get_errors()
+
+    with then:
+        assert isinstance(errors[0]._path, Path)
+        assert errors[0].path == PathHolder()["items"][1]
+        assert isinstance(errors[0]._path, PathHolder)
+        assert errors == [TypeValidationError(PathHolder()["items"][1], "2", int)]
+
+
+def test_nested_alphabet_error_path():
+    with when:
+        result = validate(schema.list(schema.str.alphabet("ab")), ["ab", "abc"])
+
+    with then:
+        assert result.get_errors() == [
+            AlphabetValidationError(PathHolder()[1], "abc", "ab"),
+        ]
+
+
+def test_custom_type_receives_path_holder():
+    with given:
+        mock = Mock(return_value=ValidationResult())
+
+        class CustomType(CustomSchema[Props]):
+            __validate__ = mock
+
+    with when:
+        validate(schema.dict({"key": schema.list([CustomType()])}), {"key": [None]})
+
+    with then:
+        path = mock.mock_calls[0].kwargs["path"]
+        assert isinstance(path, PathHolder)
+        assert path == PathHolder()["key"][0]
@@ -0,0 +1,91 @@
+from typing import Any
+
+import pytest
+from baby_steps import given, then, when
+
+from d42 import optional, schema, validate
+from d42.validation import Validator, matching_schemas, validate_against
+
+ItemV1 = schema.dict({"id": schema.int})
+ItemV2 = schema.dict({"id": schema.int.min(0), optional("tags"): schema.list(schema.str)})
+ItemV3 = schema.dict({"id": schema.int, "tags": schema.list(schema.str).unique(), ...: ...})
+
+V1 = schema.dict({"name": schema.str, "items": schema.list(ItemV1)})
+V2 = schema.dict({"name": schema.str, "items": schema.list(ItemV2).len(1, ...)})
+V3 = schema.dict({
+    "name": schema.str | schema.none,
+    "items": schema.list(schema.alias("Item", ItemV3)),
+    optional("meta"): schema.dict,
+})
+V4 = schema.list(schema.dict({"name": schema.str}))
+V5 = schema.dict({"name": schema.str, "items": schema.list([ItemV1, ...])})
+
+VERSIONS = [V1, V2, V3, V4, V5]
+
+
+@pytest.mark.parametrize("value", [
+    {"name": "a", "items": [{"id": 1}]},
+    {"name": "a", "items": [{"id": -1, "tags": ["x", "x"]}]},
+    {"name": None, "items": [{"id": 1, "tags": ["x"], "extra": True}], "meta": {}},
+    {"name": "a", "items": []},
+    {"name": 1, "items": [{"id": "1"}, {}, 5]},
+    {"name": "a", "items": {"id": 1}, "meta": []},
+    [{"name": "a"}, {"name": 1}],
+    None,
+])
+def test_validate_against_same_errors_as_validate(value: Any):
+    with when:
+        results = validate_against(VERSIONS, value)
+
+    with then:
+        assert [res.get_errors() for res in results] == \
+            [validate(version, value).get_errors() for version in VERSIONS]
+
+
+def test_validate_against_same_schema_twice():
+    with given:
+        value = {"name": "a", "items": [{"id": "1"}]}
+
+    with when:
+        results = validate_against([V1, V1], value)
+
+    with then:
+        assert results[0].get_errors() == results[1].get_errors() == \
+            validate(V1, value).get_errors()
+        assert results[0] is not results[1]
+
+
+def test_validate_against_no_schemas():
+    with when:
+        results = validate_against([], {"name": "a"})
+
+    with then:
+        assert results == []
+
+
+def test_validate_against_with_max_errors():
+    with given:
+        validator = Validator(max_errors=1)
+        value = {"name": 1, "items": [{"id": "1"}, {}]}
+
+    with when:
+        results = validate_against(VERSIONS, value, validator=validator)
+
+    with then:
+        assert [len(res.get_errors()) for res in results] == [1, 1, 1, 1, 1]
+
+
+@pytest.mark.parametrize(("value", "expected"), [
+    ({"name": "a", "items": [{"id": 1}]}, [V1, V2, V5]),
+    ({"name": "a", "items": []}, [V1, V3]),
+    ({"name": None, "items": [{"id": 1, "tags": []}]}, [V3]),
+    ([], [V4]),
+    (None, []),
+])
+def test_matching_schemas(value: Any, expected: Any):
+    with when:
+        matching = matching_schemas(VERSIONS, value)
+
+    with then:
+        assert [VERSIONS.index(sch) for sch in matching] == \
+            [VERSIONS.index(sch) for sch in expected]
@@ -0,0 +1,223 @@
+from typing import Any
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+from th import PathHolder, _
+
+from d42 import optional, schema, validate
+from d42.utils import schema_cache
+from d42.validation import Validator, resolve_schema, validate_at
+from d42.validation._path import to_keys
+from d42.validation.errors import (
+    MinValueValidationError,
+    MissingElementValidationError,
+    MissingKeyValidationError,
+    TypeValidationError,
+)
+
+ItemSchema = schema.dict({
+    "id": schema.int.min(0),
+    optional("note"): schema.str,
+})
+DocSchema = schema.dict({
+    "items": schema.list(ItemSchema),
+    "pair": schema.list([schema.str, schema.int]),
+    "head": schema.list([schema.bool, ...]),
+    "meta": schema.alias("Meta", schema.dict({"version": schema.int, ...: ...})),
+    "either": schema.dict({"k": schema.int}) | schema.dict({"k": schema.str}),
+})
+
+
+def make_doc() -> Any:
+    return {
+        "items": [{"id": 1}, {"id": -1}, {"id": "2", "note": 3}],
+        "pair": ["a", "b"],
+        "head": [True, 1, 2],
+        "meta": {"version": None, "extra": 1},
+        "either": {"k": 1.5},
+    }
+
+
+def errors_under(result: Any, path: PathHolder) -> Any:
+    keys = to_keys(path)
+    return [error for error in result.get_errors() if to_keys(error.path)[:len(keys)] == keys]
+
+
+@pytest.mark.parametrize("path", [
+    _["items"],
+    _["items"][1],
+    _["items"][2]["id"],
+    _["items"][2]["note"],
+    _["pair"][1],
+    _["head"][0],
+    _["meta"],
+    _["meta"]["version"],
+    _["meta"]["extra"],
+    _["either"],
+])
+def test_validate_at_same_errors_as_validate(path: PathHolder):
+    with given:
+        value = make_doc()
+
+    with when:
+        result = validate_at(DocSchema, value, path)
+
+    with then:
+        assert result.get_errors() == errors_under(validate(DocSchema, value), path)
+
+
+def test_validate_at_reports_full_paths():
+    with given:
+        value = make_doc()
+
+    with when:
+        result = validate_at(DocSchema, value, _["items"][1]["id"])
+
+    with then:
+        assert result.get_errors() == [
+            MinValueValidationError(PathHolder()["items"][1]["id"], -1, 0)
+        ]
+
+
+@pytest.mark.parametrize(("pointer", "path"), [
+    ("/items/2/id", _["items"][2]["id"]),
+    ("/items/1", _["items"][1]),
+    ("", _),
+])
+def test_validate_at_json_pointer(pointer: str, path: PathHolder):
+    with given:
+        value = make_doc()
+
+    with when:
+        result = validate_at(DocSchema, value, pointer)
+
+    with then:
+        assert result.get_errors() == validate_at(DocSchema, value, path).get_errors()
+
+
+def test_validate_at_root():
+    with given:
+        value = make_doc()
+
+    with when:
+        result = validate_at(DocSchema, value, [])
+
+    with then:
+        assert result.get_errors() == validate(DocSchema, value).get_errors()
+
+
+def test_validate_at_missing_key():
+    with given:
+        value = {"items": [{}]}
+
+    with when:
+        result = validate_at(DocSchema, value, "/items/0/id")
+
+    with then:
+        assert result.get_errors() == [
+            MissingKeyValidationError(PathHolder()["items"][0], {}, "id")
+        ]
+
+
+def test_validate_at_missing_optional_key():
+    with given:
+        value = {"items": [{"id": 1}]}
+
+    with when:
+        result = validate_at(DocSchema, value, "/items/0/note")
+
+    with then:
+        assert result.get_errors() == []
+
+
+def test_validate_at_missing_element():
+    with given:
+        value = {"items": [{"id": 1}]}
+
+    with when:
+        result = validate_at(DocSchema, value, "/items/3/id")
+
+    with then:
+        assert result.get_errors() == [
+            MissingElementValidationError(PathHolder()["items"], [{"id": 1}], 3)
+        ]
+
+
+def test_validate_at_not_a_container():
+    with given:
+        value = {"items": {"0": {"id": 1}}}
+
+    with when:
+        result = validate_at(DocSchema, value, "/items/0/id")
+
+    with then:
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()["items"], {"0": {"id": 1}}, list)
+        ]
+
+
+def test_validate_at_undeclared_path():
+    with when, raises(Exception) as exception:
+        validate_at(DocSchema, make_doc(), _["items"][0]["name"])
+
+    with then:
+        assert exception.type is KeyError
+        assert str(exception.value) == repr("name")
+
+
+def test_validate_at_custom_validator():
+    with given:
+        validator = Validator(fail_fast=True)
+
+    with when:
+        result = validate_at(DocSchema, make_doc(), "/items/2", validator=validator)
+
+    with then:
+        assert len(result.get_errors()) == 1
+
+
+@pytest.mark.parametrize(("path", "expected"), [
+    (_["items"], schema.list(ItemSchema)),
+    (_["items"][10], ItemSchema),
+    ("/items/10/id", schema.int.min(0)),
+    (_["pair"][1], schema.int),
+    (_["head"][0], schema.bool),
+    (_["meta"]["version"], schema.int),
+    (_["meta"]["extra"], schema.any),
+    (_["either"]["k"], schema.any(schema.int, schema.str)),
+])
+def test_resolve_schema(path: Any, expected: Any):
+    with when:
+        resolved = resolve_schema(DocSchema, path)
+
+    with then:
+        assert resolved == expected
+
+
+@pytest.mark.parametrize("path", [
+    _["missing"],
+    _["items"]["id"],
+    _["pair"][2],
+    _["head"][1],
+    _["items"][0]["id"]["x"],
+])
+def test_resolve_schema_undeclared(path: PathHolder):
+    with when, raises(Exception) as exception:
+        resolve_schema(DocSchema, path)
+
+    with then:
+        assert exception.type is KeyError
+
+
+def test_resolve_schema_cached():
+    with given:
+        sch = schema.dict({"a": schema.list(schema.dict({"b": schema.int}))})
+        first = resolve_schema(sch, "/a/0/b")
+
+    with when:
+        second = resolve_schema(sch, "/a/0/b")
+
+    with then:
+        assert second is first
+        assert len(schema_cache(sch, "resolved_paths", dict)) == 1
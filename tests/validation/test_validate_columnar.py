@@ -0,0 +1,167 @@
+import random
+from typing import Any, List
+from unittest.mock import Mock
+
+import pytest
+from baby_steps import given, then, when
+from th import PathHolder
+
+from d42 import optional, schema, validate
+from d42.validation import Validator, _columnar, validate_columnar
+
+RowSchema = schema.dict({
+    "id": schema.int.min(0),
+    "score": schema.float.min(0.0).max(1.0),
+    "name": schema.str.len(1, 8),
+    "code": schema.str.regex(r"[A-Z]{2}"),
+    "flag": schema.bool(True),
+    "note": schema.none,
+    optional("tag"): schema.str.alphabet("abc"),
+    "meta": schema.dict({"v": schema.int(1)}),
+})
+TableSchema = schema.list(RowSchema)
+
+CELLS = {
+    "id": [0, 5, -1, "1", True, 2 ** 70, -(2 ** 70), 1.0],
+    "score": [0.5, 1.5, -0.1, float("nan"), 1, "x"],
+    "name": ["a", "", "abcdefghi", 1, None],
+    "code": ["AB", "ab", "A", 3],
+    "flag": [True, False, 1, None],
+    "note": [None, 0, ""],
+    "tag": ["abc", "abd", 1],
+    "meta": [{"v": 1}, {"v": 2}, {}, [], {"v": 1, "w": 2}],
+}
+
+
+def make_row(rnd: random.Random) -> Any:
+    if rnd.random() < 0.05:
+        return rnd.choice([None, [], "row"])
+    row = {}
+    for key, cells in CELLS.items():
+        if rnd.random() < 0.9:
+            # Mostly the valid first cell
+            row[key] = cells[0] if (rnd.random() < 0.7) else rnd.choice(cells)
+    if rnd.random() < 0.1:
+        row["extra"] = 1
+    return row
+
+
+def make_valid_rows(count: int) -> List[Any]:
+    return [{"id": index, "score": 0.5, "name": "a", "code": "AB", "flag": True, "note": None,
+             "meta": {"v": 1}} for index in range(count)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_validate_columnar_same_errors_as_validate(seed: int):
+    with given:
+        rnd = random.Random(seed)
+        value = [make_row(rnd) for _ in range(50)]
+
+    with when:
+        result = validate_columnar(TableSchema, value)
+
+    with then:
+        assert result.get_errors() == validate(TableSchema, value).get_errors()
+
+
+def test_validate_columnar_valid():
+    with given:
+        value = make_valid_rows(100)
+
+    with when:
+        result = validate_columnar(TableSchema, value)
+
+    with then:
+        assert result.get_errors() == []
+
+
+def test_validate_columnar_error_paths():
+    with given:
+        value = make_valid_rows(5)
+        value[3]["id"] = -1
+        del value[1]["name"]
+
+    with when:
+        result = validate_columnar(TableSchema, value)
+
+    with then:
+        assert [error.path for error in result.get_errors()] == [
+            PathHolder()[1], PathHolder()[3]["id"],
+        ]
+
+
+@pytest.mark.parametrize(("sch", "value"), [
+    (TableSchema, {"id": 1}),
+    (TableSchema.len(1, 2), make_valid_rows(3)),
+    (schema.list(schema.int.min(0)), [1, -1]),
+    (schema.list(schema.dict), [{}, 1]),
+    (schema.list([RowSchema]), make_valid_rows(2)),
+    (schema.alias("Table", schema.list(schema.alias("Row", RowSchema))), [{"id": -1}]),
+    (schema.list(schema.dict({"a": schema.int, ...: ...})), [{"a": 1, "b": 2}, {"b": 1}]),
+])
+def test_validate_columnar_other_schemas(sch: Any, value: Any):
+    with when:
+        result = validate_columnar(sch, value)
+
+    with then:
+        assert result.get_errors() == validate(sch, value).get_errors()
+
+
+def test_validate_columnar_with_max_errors():
+    with given:
+        value = [{"id": -1}, {"id": -2}]
+
+    with when:
+        result = validate_columnar(TableSchema, value, validator=Validator(max_errors=2))
+
+    with then:
+        assert len(result.get_errors()) == 2
+        assert result.is_truncated()
+
+
+NUMERIC_COLUMNS = [
+    (schema.int.min(0).max(2 ** 63 - 1), [0, 2 ** 63 - 1, 2 ** 64 - 1, -1, True, 5]),
+    (schema.int.min(-(2 ** 70)).max(2 ** 70), [0, -(2 ** 63), 2 ** 63 - 1, 2 ** 71]),
+    (schema.int.min(2 ** 64), [2 ** 64 - 1, 2 ** 64, 1]),
+    (schema.int.max(2 ** 63), [2 ** 63 - 1, 2 ** 63, 2 ** 63 + 1]),
+    (schema.int(2 ** 64 - 1), [2 ** 64 - 1, 2 ** 64 - 2]),
+    (schema.int.max(1), [True, False, 2, 1]),
+    (schema.int.min(1), [True, False, True]),
+    (schema.float.min(0.5), [1.0, 0.2, float("nan"), float("inf"), -float("inf")]),
+    (schema.float.max(2.0 ** 53), [2.0 ** 53, 2.0 ** 53 + 2, 1, 2 ** 53 + 1]),
+    (schema.float.min(0.5).max(1.5), [0.5, 1.5, 1.5000000000000002, True, 2 ** 80]),
+]
+
+
+@pytest.mark.parametrize(("sch", "column"), NUMERIC_COLUMNS)
+@pytest.mark.parametrize("with_numpy", [False, True])
+def test_validate_columnar_numeric_columns(sch: Any, column: List[Any], with_numpy: bool,
+                                           monkeypatch):
+    with given:
+        if with_numpy:
+            monkeypatch.setattr(_columnar, "_numpy", pytest.importorskip("numpy"))
+        else:
+            monkeypatch.setattr(_columnar, "_numpy", None)
+        table = schema.list(schema.dict({"v": sch}))
+        value = [{"v": cell} for cell in column]
+
+    with when:
+        result = validate_columnar(table, value)
+
+    with then:
+        assert result.get_errors() == validate(table, value).get_errors()
+
+
+def test_validate_columnar_uses_numpy(monkeypatch):
+    with given:
+        numpy = Mock(wraps=pytest.importorskip("numpy"))
+        monkeypatch.setattr(_columnar, "_numpy", numpy)
+        value = make_valid_rows(10)
+        value[7]["id"] = -1
+
+    with when:
+        result = validate_columnar(TableSchema, value)
+
+    with then:
+        assert result.get_errors() == validate(TableSchema, value).get_errors()
+        assert numpy.asarray.call_count == 2  # "id" and "score"
@@ -0,0 +1,266 @@
+import random
+from copy import deepcopy
+from typing import Any, Callable, List
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+from th import PathHolder
+
+from d42 import optional, schema, validate
+from d42.validation import Validator, patch_paths, validate_incremental, validate_patch
+from d42.validation._path import parse_pointer
+
+ItemSchema = schema.dict({
+    "id": schema.int.min(0),
+    "tags": schema.list(schema.str).unique(),
+    optional("kind"): schema.str("a") | schema.str("b"),
+})
+DocSchema = schema.dict({
+    "name": schema.str,
+    "items": schema.list(ItemSchema).len(0, 6),
+    "meta": schema.alias("Meta", schema.dict({"version": schema.int, ...: ...})),
+})
+
+
+def make_doc() -> Any:
+    return {
+        "name": "doc",
+        "items": [{"id": index, "tags": ["a", "b"]} for index in range(4)],
+        "meta": {"version": 1},
+    }
+
+
+def set_item_id(doc: Any) -> List[Any]:
+    doc["items"][1]["id"] = -1
+    return ["items", 1, "id"]
+
+
+def add_tag(doc: Any) -> List[Any]:
+    doc["items"][2]["tags"].append("a")
+    return ["items", 2, "tags", 2]
+
+
+def remove_item_key(doc: Any) -> List[Any]:
+    del doc["items"][0]["tags"]
+    return ["items", 0, "tags"]
+
+
+def add_extra_key(doc: Any) -> List[Any]:
+    doc["items"][3]["extra"] = 1
+    return ["items", 3, "extra"]
+
+
+def set_kind(doc: Any) -> List[Any]:
+    doc["items"][0]["kind"] = "c"
+    return ["items", 0, "kind"]
+
+
+def replace_items(doc: Any) -> List[Any]:
+    doc["items"] = [{"id": "1"}] * 7
+    return ["items"]
+
+
+def set_meta(doc: Any) -> List[Any]:
+    doc["meta"]["version"] = "1"
+    return ["meta", "version"]
+
+
+def replace_root(doc: Any) -> List[Any]:
+    doc.clear()
+    return []
+
+
+CHANGES = [set_item_id, add_tag, remove_item_key, add_extra_key, set_kind, replace_items,
+           set_meta, replace_root]
+# Changes that keep the structure, so that any other change still applies
+KEEPING_CHANGES = [set_item_id, add_tag, add_extra_key, set_kind, set_meta]
+
+
+@pytest.mark.parametrize("change", CHANGES)
+def test_validate_incremental(change: Callable[[Any], List[Any]]):
+    with given:
+        doc = make_doc()
+        previous = validate(DocSchema, doc)
+        changed_path = change(doc)
+
+    with when:
+        result = validate_incremental(DocSchema, doc, [changed_path], previous)
+
+    with then:
+        assert result.get_errors() == validate(DocSchema, doc).get_errors()
+
+
+@pytest.mark.parametrize("first", KEEPING_CHANGES)
+@pytest.mark.parametrize("second", CHANGES)
+def test_validate_incremental_keeps_previous_errors(first: Callable[[Any], List[Any]],
+                                                    second: Callable[[Any], List[Any]]):
+    with given:
+        doc = make_doc()
+        first(doc)
+        previous = validate(DocSchema, doc)
+        changed_path = second(doc)
+
+    with when:
+        result = validate_incremental(DocSchema, doc, [changed_path], previous)
+
+    with then:
+        assert result.get_errors() == validate(DocSchema, doc).get_errors()
+
+
+def test_validate_incremental_random_changes():
+    with given:
+        rnd = random.Random(42)
+        doc = make_doc()
+        previous = validate(DocSchema, doc)
+
+    for _ in range(200):
+        with when:
+            index = rnd.randrange(len(doc["items"]))
+            key = rnd.choice(["id", "tags", "kind"])
+            doc["items"][index][key] = rnd.choice([1, -1, "a", "c", ["a"], ["a", "a"]])
+            result = validate_incremental(DocSchema, doc, [f"/items/{index}/{key}"], previous)
+
+        with then:
+            assert result.get_errors() == validate(DocSchema, doc).get_errors()
+            previous = result
+
+
+def test_validate_incremental_path_types():
+    with given:
+        doc = make_doc()
+        doc["items"][1]["id"] = -1
+        expected = validate(DocSchema, doc).get_errors()
+
+    with when:
+        results = [
+            validate_incremental(DocSchema, doc, ["/items/1/id"]),
+            validate_incremental(DocSchema, doc, [("items", 1, "id")]),
+            validate_incremental(DocSchema, doc, [PathHolder()["items"][1]["id"]]),
+        ]
+
+    with then:
+        assert [result.get_errors() for result in results] == [expected] * 3
+
+
+def test_validate_incremental_skips_unchanged():
+    with given:
+        doc = make_doc()
+        doc["items"][0]["id"] = "broken, but not reported"
+
+    with when:
+        result = validate_incremental(DocSchema, doc, ["/name"])
+
+    with then:
+        assert result.get_errors() == []
+
+
+def test_validate_incremental_validator_subclass():
+    with given:
+        class CustomValidator(Validator):
+            pass
+
+        doc = make_doc()
+        doc["items"][0]["id"] = "1"
+
+    with when:
+        result = validate_incremental(DocSchema, doc, ["/name"], validator=CustomValidator())
+
+    with then:
+        assert result.get_errors() == validate(DocSchema, doc).get_errors()
+
+
+def test_validate_incremental_truncated_previous():
+    with given:
+        sch = schema.dict({"a": schema.int, "b": schema.int})
+        previous = validate(sch, {"a": "x", "b": "y"}, max_errors=1)
+        value = {"a": 1, "b": "y"}
+
+    with when:
+        result = validate_incremental(sch, value, ["/a"], previous)
+
+    with then:
+        assert result.get_errors() == validate(sch, value).get_errors()
+        assert len(result.get_errors()) == 1
+
+
+@pytest.mark.parametrize("patch", [
+    [{"op": "add", "path": "/items/0", "value": {"id": "1", "tags": []}}],
+    [{"op": "add", "path": "/items/-", "value": {"id": -1, "tags": []}}],
+    [{"op": "remove", "path": "/items/1"}],
+    [{"op": "replace", "path": "/items/2/tags/0", "value": "b"}],
+    [{"op": "move", "from": "/items/0/tags", "path": "/items/1/kind"}],
+    [{"op": "copy", "from": "/items/0/tags", "path": "/items/1/extra"}],
+    [{"op": "copy", "from": "/items/0", "path": "/items/1"}],
+])
+def test_validate_patch(patch: List[Any]):
+    with given:
+        doc = make_doc()
+        doc["items"][3]["id"] = -1
+        previous = validate(DocSchema, doc)
+        new_doc = apply_patch(doc, patch)
+
+    with when:
+        result = validate_patch(DocSchema, new_doc, patch, previous)
+
+    with then:
+        assert result.get_errors() == validate(DocSchema, new_doc).get_errors()
+
+
+def test_patch_paths():
+    with given:
+        doc = make_doc()
+        patch = [
+            {"op": "test", "path": "/name", "value": "doc"},
+            {"op": "replace", "path": "/items/0/id", "value": 1},
+            {"op": "remove", "path": "/items/1"},
+            {"op": "add", "path": "/meta/x~1y", "value": 1},
+            {"op": "copy", "from": "/items/0", "path": "/items/1"},
+        ]
+
+    with when:
+        paths = patch_paths(patch, doc)
+
+    with then:
+        assert paths == [["items", "0", "id"], ["items"], ["meta", "x/y"], ["items"]]
+
+
+def test_parse_pointer_invalid():
+    with when, raises(Exception) as exception:
+        parse_pointer("items/0")
+
+    with then:
+        assert exception.type is ValueError
+
+
+def apply_patch(doc: Any, patch: List[Any]) -> Any:
+    doc = deepcopy(doc)
+
+    def locate(pointer: str) -> Any:
+        *parents, last = parse_pointer(pointer)
+        target = doc
+        for key in parents:
+            target = target[int(key)] if isinstance(target, list) else target[key]
+        return target, last
+
+    for operation in patch:
+        op = operation["op"]
+        if op in ("move", "copy"):
+            source, key = locate(operation["from"])
+            value = source[key] if isinstance(source, dict) else source[int(key)]
+            if op == "move":
+                del source[key if isinstance(source, dict) else int(key)]
+            operation = {"op": "add", "path": operation["path"], "value": deepcopy(value)}
+        target, key = locate(operation["path"])
+        if isinstance(target, list):
+            if operation["op"] == "remove":
+                del target[int(key)]
+            elif operation["op"] == "add":
+                target.insert(len(target) if key == "-" else int(key), operation["value"])
+            else:
+                target[int(key)] = operation["value"]
+        elif operation["op"] == "remove":
+            del target[key]
+        else:
+            target[key] = operation["value"]
+    return doc
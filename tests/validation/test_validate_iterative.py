@@ -0,0 +1,102 @@
+import sys
+from typing import Any
+
+import pytest
+from baby_steps import given, then, when
+from th import PathHolder
+
+from d42 import schema
+from d42.declaration import GenericSchema
+from d42.substitution import SubstitutorValidator
+from d42.validation import InMemoryMetrics, Validator, validate, validate_iterative
+from d42.validation.errors import TypeValidationError
+
+from ._cases import CASES
+
+
+@pytest.mark.parametrize(("sch", "value"), CASES)
+def test_validate_iterative_same_errors_as_validator(sch: GenericSchema, value: Any):
+    with when:
+        result = validate_iterative(sch, value)
+
+    with then:
+        assert result.get_errors() == validate(sch, value).get_errors()
+
+
+@pytest.mark.parametrize(("sch", "value"), [
+    (schema.list([schema.int, schema.str]), [1]),
+    (schema.list([schema.int, schema.str]), ["1", 2, 3]),
+    (schema.list([schema.int, ...]), ["1", 2]),
+    (schema.list([..., schema.int, schema.str]), [1, 2]),
+    (schema.list([..., schema.str]), []),
+    (schema.list([..., schema.int, ...]), ["a", "b"]),
+    (schema.list([]), [1]),
+    (schema.any(schema.list(schema.int), schema.dict({"a": schema.int})), {"a": "1"}),
+    (schema.any(schema.int | schema.str, schema.none), 1.5),
+    (schema.alias("A", schema.dict({"a": schema.alias("B", schema.int)})), {"a": None}),
+])
+def test_validate_iterative_containers(sch: GenericSchema, value: Any):
+    with when:
+        result = validate_iterative(sch, value)
+
+    with then:
+        assert result.get_errors() == validate(sch, value).get_errors()
+
+
+def test_validate_iterative_deeper_than_recursion_limit():
+    with given:
+        depth = sys.getrecursionlimit() * 2
+        sch: GenericSchema = schema.int
+        value: Any = 1
+        for _ in range(depth):
+            sch = schema.dict({"next": schema.none | schema.list(sch)})
+            value = {"next": [value]}
+
+    with when:
+        result = validate_iterative(sch, value)
+
+    with then:
+        assert result.get_errors() == []
+
+
+def test_validate_iterative_error_deeper_than_recursion_limit():
+    with given:
+        depth = sys.getrecursionlimit() * 2
+        sch: GenericSchema = schema.int
+        value: Any = "1"
+        for _ in range(depth):
+            sch, value = schema.dict({"next": sch}), {"next": value}
+
+    with when:
+        result = validate_iterative(sch, value)
+
+    with then:
+        errors = result.get_errors()
+        assert len(errors) == 1
+        assert isinstance(errors[0], TypeValidationError)
+        assert len(errors[0].path) == depth
+
+
+def test_validate_iterative_custom_validator():
+    with given:
+        sch = schema.dict({"id": schema.int})
+        validator = SubstitutorValidator()
+
+    with when:
+        result = validate_iterative(sch, {"id": "1"}, validator=validator)
+
+    with then:
+        assert result.get_errors() == [TypeValidationError(PathHolder()["id"], "1", int)]
+
+
+def test_validate_iterative_metrics():
+    with given:
+        metrics = InMemoryMetrics()
+        sch = schema.list(schema.dict({"id": schema.int}))
+
+    with when:
+        validate_iterative(sch, [{"id": 1}, {"id": "2"}], validator=Validator(metrics=metrics))
+
+    with then:
+        assert [(observed, stats.calls, stats.failures)
+                for observed, stats in metrics.items()] == [(sch, 1, 1)]
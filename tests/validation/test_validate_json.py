@@ -0,0 +1,149 @@
+import json
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+from th import PathHolder
+
+from d42 import optional, schema
+from d42.declaration import GenericSchema
+from d42.validation import ValidationException, load_json_or_fail, validate, validate_json
+from d42.validation.errors import ExtraKeyValidationError
+
+from ._cases import CASES
+
+JSON_CASES = []
+for _sch, _value in CASES:
+    try:
+        JSON_CASES.append((_sch, json.dumps(_value)))
+    except TypeError:
+        pass
+
+EventSchema = schema.dict({
+    "id": schema.int.min(1),
+    "tags": schema.list(schema.str).len(0, 2),
+    optional("name"): schema.str,
+    ...: ...,
+})
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize(("sch", "text"), JSON_CASES)
+def test_validate_json_same_errors_as_validator(sch: GenericSchema, text: str, lazy: bool):
+    with when:
+        result = validate_json(sch, text, lazy=lazy)
+
+    with then:
+        assert result.get_errors() == validate(sch, json.loads(text)).get_errors()
+
+
+@pytest.mark.parametrize("text", [
+    '{"id": 1, "tags": [], "extra": {"a": [1, -2.5e-3, true, null, "]}\\"\\u0041"]}}',
+    ' {"extra": [[], {}, [{}]], "tags": ["a", "b"], "name": "Bob", "id": 1} ',
+    b'{"id": 1, "tags": ["\\u00e9"], "extra": NaN}',
+    '{"id": 1, "tags": [], "extra": [{"a": 1, "b": "x"}, {"c": [1, {"d": {}}]}, [null]]}',
+])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_validate_json_skips_unknown_keys(text: Any, lazy: bool):
+    with when:
+        result = validate_json(EventSchema, text, lazy=lazy)
+
+    with then:
+        assert result.get_errors() == []
+
+
+@pytest.mark.parametrize("text", [
+    '{"id": 1, "tags": [], "extra": [1,]}',
+    '{"id": 1, "tags": [], "extra": {"a" 1}}',
+    '{"id": 1, "tags": [], "extra": [01]}',
+    '{"id": 1, "tags": [], "extra": "\\x"}',
+    '{"id": 1, "tags": []} {}',
+    '{"id": 1, "tags": [], "extra": [}',
+    '{"id": 1, "tags": [], "extra": {"a": 1,}}',
+    '{"id": 1, "tags": [], "extra": [[1], {"b": [1 2]}]}',
+])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_validate_json_invalid_json(text: str, lazy: bool):
+    with when, raises(Exception) as exception:
+        validate_json(EventSchema, text, lazy=lazy)
+
+    with then:
+        assert exception.type is json.JSONDecodeError
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_validate_json_duplicate_keys(lazy: bool):
+    with given:
+        text = '{"id": 0, "id": 1, "tags": []}'
+
+    with when:
+        result = validate_json(EventSchema, text, lazy=lazy)
+
+    with then:
+        assert result.get_errors() == []
+
+
+def test_validate_json_extra_key():
+    with given:
+        sch = schema.dict({"id": schema.int})
+
+    with when:
+        result = validate_json(sch, '{"id": 1, "name": "Bob"}')
+
+    with then:
+        assert result.get_errors() == [
+            ExtraKeyValidationError(PathHolder(), {"id": 1, "name": "Bob"}, "name"),
+        ]
+
+
+@pytest.mark.parametrize(("sch", "text"), [
+    (EventSchema, '{"id": 1, "tags": ["a"], "extra": {"deep": [1, {"a": null}]}}'),
+    (schema.list(EventSchema).len(1), '[{"id": 1, "tags": []}]'),
+    (schema.list, '[1, "2", [3]]'),
+    (schema.any, '{"a": [1]}'),
+    (schema.int | schema.str, '"banana"'),
+    (schema.dict({"id": schema.int, "ids": schema.list(schema.int).len(2)}),
+     '{"id": 1, "ids": [1, 2]}'),
+    (EventSchema, '{"id": 1, "id": 2, "tags": []}'),
+])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_load_json_or_fail(sch: GenericSchema, text: str, lazy: bool):
+    with when:
+        value = load_json_or_fail(sch, text, lazy=lazy)
+
+    with then:
+        assert value == json.loads(text)
+
+
+def test_load_json_or_fail_lazy_single_pass(monkeypatch: pytest.MonkeyPatch):
+    with given:
+        loads = Mock(wraps=json.loads)
+        monkeypatch.setattr(json, "loads", loads)
+        text = '{"id": 1, "tags": ["a"], "extra": {"deep": [1, {"a": null}]}}'
+
+    with when:
+        value = load_json_or_fail(EventSchema, text, lazy=True)
+
+    with then:
+        assert value == {"id": 1, "tags": ["a"], "extra": {"deep": [1, {"a": None}]}}
+        assert loads.call_count == 0
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_load_json_or_fail_error(lazy: bool):
+    with when, raises(Exception) as exception:
+        load_json_or_fail(EventSchema, '{"id": 0, "tags": []}', lazy=lazy)
+
+    with then:
+        assert exception.type is ValidationException
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_load_json_or_fail_invalid_json(lazy: bool):
+    with when, raises(Exception) as exception:
+        load_json_or_fail(EventSchema, '{"id": 1, "tags": [}', lazy=lazy)
+
+    with then:
+        assert exception.type is json.JSONDecodeError
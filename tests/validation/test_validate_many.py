@@ -0,0 +1,68 @@
+from typing import Any, Iterator
+
+import pytest
+from baby_steps import given, then, when
+from pytest import raises
+
+from d42 import schema, validate_many
+from d42.custom_type import CustomSchema, Props
+from d42.validation import Formatter, validate
+
+UserSchema = schema.dict({
+    "id": schema.int.min(1),
+    "name": schema.str.len(1, 8),
+})
+
+
+def format_errors(sch: Any, value: Any):
+    formatter = Formatter()
+    return [e.format(formatter) for e in validate(sch, value).get_errors()]
+
+
+def make_users(count: int) -> Iterator[Any]:
+    for index in range(count):
+        if index % 7 == 0:
+            yield {"id": 0, "name": "banana-banana"}
+        else:
+            yield {"id": index, "name": "Bob"}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many(workers: int):
+    with given:
+        values = list(make_users(50))
+
+    with when:
+        results = list(validate_many(UserSchema, iter(values), workers=workers, chunk_size=8))
+
+    with then:
+        assert results == [format_errors(UserSchema, value) for value in values]
+        assert [bool(r) for r in results] == [index % 7 == 0 for index in range(50)]
+
+
+def test_validate_many_empty():
+    with when:
+        results = list(validate_many(UserSchema, [], workers=2))
+
+    with then:
+        assert results == []
+
+
+def test_validate_many_invalid_chunk_size():
+    with when, raises(Exception) as exception:
+        validate_many(UserSchema, [], chunk_size=0)
+
+    with then:
+        assert exception.type is ValueError
+
+
+def test_validate_many_unpicklable_schema():
+    with given:
+        class LocalType(CustomSchema[Props]):
+            pass
+
+    with when, raises(Exception) as exception:
+        validate_many(schema.list(LocalType()), [], workers=2)
+
+    with then:
+        assert exception.type is TypeError
@@ -0,0 +1,175 @@
+from typing import Any
+
+from baby_steps import given, then, when
+from pytest import raises
+from th import PathHolder
+
+from d42 import schema, validate
+from d42.validation import ValidationCache, ValidationMemo, Validator, schema_fingerprint
+from d42.validation.errors import TypeValidationError
+
+
+class CountingValidator(Validator):
+    def __init__(self) -> None:
+        super().__init__()
+        self.visited = 0
+
+    def visit_dict(self, *args: Any, **kwargs: Any) -> Any:
+        self.visited += 1
+        return super().visit_dict(*args, **kwargs)
+
+
+def test_schema_fingerprint():
+    with when:
+        fingerprints = [
+            schema_fingerprint(schema.dict({"id": schema.int.min(1)})),
+            schema_fingerprint(schema.dict({"id": schema.int.min(1)})),
+            schema_fingerprint(schema.dict({"id": schema.int.min(2)})),
+        ]
+
+    with then:
+        assert fingerprints[0] == fingerprints[1]
+        assert fingerprints[0] != fingerprints[2]
+
+
+def test_cache_hit_by_identity():
+    with given:
+        cache = ValidationCache()
+        value = {"id": "1"}
+
+    with when:
+        first = cache.validate(schema.dict({"id": schema.int}), value)
+        second = cache.validate(schema.dict({"id": schema.int}), value)
+
+    with then:
+        expected = [TypeValidationError(PathHolder()["id"], "1", int)]
+        assert first.get_errors() == second.get_errors() == expected
+        assert second is not first
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_ratio == 0.5
+
+
+def test_cache_miss_for_equal_value():
+    with given:
+        cache = ValidationCache()
+        sch = schema.dict({"id": schema.int})
+
+    with when:
+        cache.validate(sch, {"id": 1})
+        cache.validate(sch, {"id": 1})
+
+    with then:
+        assert (cache.stats().hits, cache.stats().misses) == (0, 2)
+
+
+def test_cache_key():
+    with given:
+        cache = ValidationCache(key=lambda value: tuple(sorted(value.items())))
+        sch = schema.dict({"id": schema.int})
+
+    with when:
+        cache.validate(sch, {"id": 1})
+        result = cache.validate(sch, {"id": 1})
+
+    with then:
+        assert result.get_errors() == []
+        assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+
+def test_cache_lru_eviction():
+    with given:
+        cache = ValidationCache(maxsize=2)
+        sch = schema.int
+        values = [1000, 2000, 3000]
+
+    with when:
+        cache.validate(sch, values[0])
+        cache.validate(sch, values[1])
+        cache.validate(sch, values[0])  # makes values[1] the oldest
+        cache.validate(sch, values[2])
+        cache.validate(sch, values[0])
+        cache.validate(sch, values[1])
+
+    with then:
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 4, 2, 2)
+
+
+def test_cache_clear():
+    with given:
+        cache = ValidationCache()
+        cache.validate(schema.int, 1)
+
+    with when:
+        cache.clear()
+
+    with then:
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (0, 0, 0)
+
+
+def test_cache_invalid_maxsize():
+    with when, raises(Exception) as exception:
+        ValidationCache(maxsize=0)
+
+    with then:
+        assert exception.type is ValueError
+
+
+def test_memo_validates_shared_objects_once():
+    with given:
+        shared = {"id": 1}
+        sch = schema.list(schema.dict({"id": schema.int}))
+        validator = CountingValidator()
+        memo = ValidationMemo()
+
+    with when:
+        result = sch.__accept__(validator, value=[shared] * 100, validation_memo=memo)
+
+    with then:
+        assert result.get_errors() == []
+        assert validator.visited == 1
+        assert (memo.hits, memo.misses, len(memo)) == (99, 1, 1)
+
+
+def test_memo_keeps_paths_of_invalid_objects():
+    with given:
+        shared = {"id": "1"}
+        sch = schema.list(schema.dict({"id": schema.int}))
+        value = [shared, shared]
+
+    with when:
+        result = validate(sch, value, validation_memo=ValidationMemo())
+
+    with then:
+        assert result.get_errors() == validate(sch, value).get_errors() == [
+            TypeValidationError(PathHolder()[0]["id"], "1", int),
+            TypeValidationError(PathHolder()[1]["id"], "1", int),
+        ]
+
+
+def test_memo_per_schema():
+    with given:
+        shared = [1]
+        sch = schema.dict({"a": schema.list(schema.int), "b": schema.list(schema.str)})
+
+    with when:
+        result = validate(sch, {"a": shared, "b": shared}, validation_memo=ValidationMemo())
+
+    with then:
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()["b"][0], 1, str),
+        ]
+
+
+def test_cache_counts_memo_hits():
+    with given:
+        shared = {"id": 1}
+        cache = ValidationCache()
+
+    with when:
+        cache.validate(schema.list(schema.dict({"id": schema.int})), [shared] * 3)
+
+    with then:
+        assert cache.stats().memo_hits == 2
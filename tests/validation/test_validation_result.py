@@ -77,3 +77,16 @@ def test_validation_result_with_errors_repr():
 
     with then:
         assert res == f"ValidationResult({errors!r})"
+
+
+def test_validation_result_truncate():
+    with given:
+        errors = [make_error(), make_error(), make_error()]
+        result = ValidationResult(list(errors))
+
+    with when:
+        result = result.truncate(2)
+
+    with then:
+        assert result.get_errors() == errors[:2]
+        assert result.is_truncated()
@@ -4,8 +4,10 @@ from baby_steps import given, then, when
 from pytest import raises
 from th import PathHolder
 
+from d42 import schema
 from d42.declaration import Props, Schema
 from d42.validation import ValidationResult, Validator
+from d42.validation.errors import TypeValidationError
 
 
 def test_validator_path_holder_factory():
@@ -65,3 +67,44 @@ def test_validator_visit_error():
     with then:
         assert exception.type is NotImplementedError
         assert str(exception.value) == "CustomType has no method '__d42_validate__'"
+
+
+def test_validator_shares_one_result():
+    with given:
+        results = []
+
+        def make_result() -> ValidationResult:
+            results.append(ValidationResult())
+            return results[-1]
+
+        validator = Validator(validation_result_factory=make_result)
+        sch = schema.list(schema.dict({"id": schema.int, "tags": schema.list(schema.str)}))
+        value = [{"id": "1", "tags": ["a", 2]}, {"id": 2, "tags": []}]
+
+    with when:
+        result = sch.__accept__(validator, value=value)
+
+    with then:
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()[0]["id"], "1", int),
+            TypeValidationError(PathHolder()[0]["tags"][1], 2, str),
+        ]
+        assert results == [result]
+
+
+def test_validator_merges_custom_type_results():
+    with given:
+        error = TypeValidationError(PathHolder()[0], None, int)
+
+        class CustomType(Schema[Props]):
+            def __d42_validate__(self, validator, **kwargs) -> ValidationResult:
+                assert "error_sink" not in kwargs
+                return validator.make_validation_result().add_error(error)
+
+        sch = schema.list(CustomType())
+
+    with when:
+        result = sch.__accept__(Validator(), value=[None, None])
+
+    with then:
+        assert result.get_errors() == [error, error]
@@ -0,0 +1,214 @@
+import gc
+import weakref
+from collections import OrderedDict, deque
+from typing import Any, Callable, List
+
+import pytest
+from baby_steps import given, then, when
+from th import PathHolder
+
+from d42 import schema
+from d42.validation import (
+    Formatter,
+    ValidationResult,
+    Validator,
+    ValueSnapshot,
+    compile,
+    set_value_snapshots,
+    validate,
+)
+from d42.validation.errors import LengthValidationError, TypeValidationError
+
+
+class Payload(dict):  # plain dicts can't be weakly referenced
+    pass
+
+
+class Tags(set):
+    pass
+
+
+@pytest.mark.parametrize("value", [None, True, 42, 3.14, "short", b"short"])
+def test_capture_keeps_small_values(value: Any):
+    with when:
+        captured = ValueSnapshot.capture(value)
+
+    with then:
+        assert captured is value
+
+
+def test_capture_container():
+    with given:
+        value = list(range(1000))
+
+    with when:
+        captured = ValueSnapshot.capture(value)
+
+    with then:
+        assert isinstance(captured, ValueSnapshot)
+        assert captured.type is list
+        assert len(captured) == 1000
+        assert len(repr(captured)) == ValueSnapshot.MAX_REPR
+        assert repr(captured).startswith("[0, 1, 2") and repr(captured).endswith("...")
+
+
+def test_capture_snapshot():
+    with given:
+        snapshot = ValueSnapshot.capture(list(range(1000)))
+
+    with when:
+        captured = ValueSnapshot.capture(snapshot)
+
+    with then:
+        assert captured is snapshot
+
+
+def test_validator_snapshot_values():
+    with given:
+        sch = schema.dict({"items": schema.list(schema.int).len(2)})
+        value = {"items": [1, 2, 3]}
+
+    with when:
+        result = sch.__accept__(Validator(snapshot_values=True), value=value)
+
+    with then:
+        assert result.get_errors() == [
+            LengthValidationError(PathHolder()["items"], ValueSnapshot(list, 3, "[1, 2, 3]"), 2)
+        ]
+        assert [e.format(Formatter()) for e in result.get_errors()] == \
+               [e.format(Formatter()) for e in validate(sch, value).get_errors()]
+
+
+def test_validator_snapshot_values_drops_payload():
+    with given:
+        sch = schema.dict({"id": schema.int, "name": schema.str})
+        payload = Payload(id="1")
+        ref = weakref.ref(payload)
+
+    with when:
+        result = sch.__accept__(Validator(snapshot_values=True), value=payload)
+        del payload
+        gc.collect()
+
+    with then:
+        assert len(result.get_errors()) == 2
+        assert ref() is None
+
+
+def test_snapshot_values_schema_mismatch():
+    with given:
+        sch = schema.list(schema.int) | schema.none
+        value = ["1"]
+
+    with when:
+        result = sch.__accept__(Validator(snapshot_values=True), value=value)
+
+    with then:
+        error, = result.get_errors()
+        assert error.actual_value == ValueSnapshot(list, 1, "['1']")
+        assert error.subschema_errors == [
+            [TypeValidationError(PathHolder()[0], "1", int)],
+            [TypeValidationError(PathHolder(), ValueSnapshot(list, 1, "['1']"), type(None))],
+        ]
+
+
+def test_set_value_snapshots():
+    with given:
+        set_value_snapshots(True)
+
+    try:
+        with when:
+            result = validate(schema.list(schema.int).len(0), [1])
+            compiled = compile(schema.list(schema.int).len(0))([1])
+    finally:
+        set_value_snapshots(False)
+
+    with then:
+        assert result.get_errors()[0].actual_value == ValueSnapshot(list, 1, "[1]")
+        assert compiled.get_errors()[0].actual_value == ValueSnapshot(list, 1, "[1]")
+
+
+def test_validation_result_snapshot_values():
+    with given:
+        result = ValidationResult([TypeValidationError(PathHolder(), [1], int)])
+
+    with when:
+        result.snapshot_values()
+        result.add_error(TypeValidationError(PathHolder(), {}, int))
+
+    with then:
+        assert [e.actual_value for e in result.get_errors()] == [
+            ValueSnapshot(list, 1, "[1]"),
+            ValueSnapshot(dict, 0, "{}"),
+        ]
+
+
+def test_errors_have_slots():
+    with when:
+        error = TypeValidationError(PathHolder(), "1", int)
+
+    with then:
+        assert not hasattr(error, "__dict__")
+
+
+@pytest.mark.parametrize("value", [
+    list(range(1000)),
+    {f"key{i}": [i, (i,), {"s": "x" * 50}] for i in range(100)},
+    [("a" * 500, b"b" * 500)],
+    (1,),
+    {"nested": [[[]], ()]},
+    set(range(10_000)),
+    frozenset(["a" * 500]),
+    [set(), frozenset(), deque([1, 2])],
+    Payload({f"key{i}": i for i in range(10_000)}),
+    Tags(range(10_000)),
+])
+def test_capture_repr(value: Any):
+    with when:
+        captured = ValueSnapshot.capture(value)
+
+    with then:
+        expected = repr(value)
+        if len(expected) > ValueSnapshot.MAX_REPR:
+            expected = expected[:ValueSnapshot.MAX_REPR - 3] + "..."
+        assert repr(captured) == expected
+
+
+@pytest.mark.parametrize("make_value", [
+    lambda items: set(items),
+    lambda items: Payload({item: item for item in items}),
+    lambda items: OrderedDict((index, item) for index, item in enumerate(items)),
+    lambda items: deque(items),
+])
+def test_capture_repr_walks_only_the_start(make_value: Callable[[List[Any]], Any]):
+    with given:
+        reprs = 0
+
+        class Item:
+            def __repr__(self) -> str:
+                nonlocal reprs
+                reprs += 1
+                return "Item()"
+
+        value = make_value([Item() for _ in range(10_000)])
+
+    with when:
+        captured = ValueSnapshot.capture(value)
+
+    with then:
+        assert len(repr(captured)) == ValueSnapshot.MAX_REPR
+        assert reprs < 100
+
+
+def test_snapshot_values_many_errors_on_large_container():
+    with given:
+        value = {f"key{i}": i for i in range(5_000)}
+
+    with when:
+        result = schema.dict({}).__accept__(Validator(snapshot_values=True), value=value)
+
+    with then:
+        errors = result.get_errors()
+        assert len(errors) == 5_000
+        assert all(len(e.actual_value) == 5_000 for e in errors)
+        assert all(len(repr(e.actual_value)) == ValueSnapshot.MAX_REPR for e in errors)
@@ -5,8 +5,12 @@ from baby_steps import given, then, when
 from th import PathHolder
 
 from d42 import schema
-from d42.validation import validate
-from d42.validation.errors import MissingElementValidationError, ValueValidationError
+from d42.validation import compile, validate
+from d42.validation.errors import (
+    MissingElementValidationError,
+    TypeValidationError,
+    ValueValidationError,
+)
 
 
 @pytest.mark.parametrize("value", [
@@ -288,3 +292,34 @@ def test_list_contains_validation_no_elements_error():
         assert result.get_errors() == [
             MissingElementValidationError(PathHolder(), actual_value=value, index=0),
         ]
+
+
+def test_list_contains_validation_closest_match_error():
+    with given:
+        value = [1, 0, 0, 0, 2, 3]
+        sch = schema.list([..., schema.int(1), schema.int(2), schema.int(3), ...])
+
+    with when:
+        result = validate(sch, value)
+
+    with then:
+        assert result.get_errors() == [
+            ValueValidationError(PathHolder()[3], actual_value=0, expected_value=1),
+        ]
+
+
+def test_list_contains_validation_fewest_errors_match_error():
+    with given:
+        dict_schema = schema.dict({"a": schema.int, "b": schema.int, "c": schema.int})
+        value = [{"a": "x", "b": "x", "c": "x"}, {"a": 1, "b": 1, "c": "x"}, 2]
+        sch = schema.list([..., dict_schema, schema.int(1), ...])
+
+    with when:
+        result = validate(sch, value)
+
+    with then:
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()[1]["c"], actual_value="x", expected_type=int),
+            ValueValidationError(PathHolder()[2], actual_value=2, expected_value=1),
+        ]
+        assert compile(sch)(value).get_errors() == result.get_errors()
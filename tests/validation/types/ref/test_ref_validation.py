@@ -0,0 +1,97 @@
+import sys
+
+from baby_steps import given, then, when
+from pytest import raises
+from th import PathHolder
+
+from d42 import schema
+from d42.declaration import DeclarationError
+from d42.validation import compile, validate, validate_iterative
+from d42.validation.errors import MissingKeyValidationError, TypeValidationError
+
+Category = schema.alias("Category", schema.dict({
+    "name": schema.str,
+    "children": schema.list(schema.ref("Category")),
+}))
+
+
+def make_tree(depth: int):
+    tree = {"name": "leaf", "children": []}
+    for _ in range(depth):
+        tree = {"name": "node", "children": [tree]}
+    return tree
+
+
+def test_ref_validation():
+    with given:
+        value = make_tree(10)
+
+    with when:
+        result = validate(Category, value)
+
+    with then:
+        assert result.get_errors() == []
+
+
+def test_ref_validation_error():
+    with given:
+        value = {"name": "root", "children": [{"name": "a", "children": [{"name": 1}]}]}
+
+    with when:
+        result = validate(Category, value)
+
+    with then:
+        child = value["children"][0]["children"][0]
+        assert result.get_errors() == [
+            TypeValidationError(PathHolder()["children"][0]["children"][0]["name"], 1, str),
+            MissingKeyValidationError(PathHolder()["children"][0]["children"][0], child,
+                                      "children"),
+        ]
+
+
+def test_ref_mutual_validation():
+    with given:
+        tag = schema.alias("Tag", schema.dict({"posts": schema.list(schema.ref("Post"))}))
+        post = schema.alias("Post", schema.dict({"tags": schema.list(tag)}))
+
+    with when:
+        result = validate(post, {"tags": [{"posts": [{"tags": [{"posts": 1}]}]}]})
+
+    with then:
+        path = PathHolder()["tags"][0]["posts"][0]["tags"][0]["posts"]
+        assert result.get_errors() == [TypeValidationError(path, 1, list)]
+
+
+def test_ref_compiled_validation():
+    with given:
+        value = make_tree(3)
+        value["children"][0]["children"] = None
+        compiled = compile(Category)
+
+    with when:
+        result = compiled(value)
+
+    with then:
+        assert result.get_errors() == validate(Category, value).get_errors()
+
+
+def test_ref_iterative_validation_deeper_than_recursion_limit():
+    with given:
+        value = make_tree(sys.getrecursionlimit() * 2)
+
+    with when:
+        result = validate_iterative(Category, value)
+
+    with then:
+        assert result.get_errors() == []
+
+
+def test_ref_unresolved_validation_error():
+    with given:
+        sch = schema.dict({"parent": schema.ref("Category")})
+
+    with when, raises(Exception) as exception:
+        validate(sch, {"parent": {}})
+
+    with then:
+        assert exception.type is DeclarationError
@@ -199,6 +199,36 @@ def test_str_alphabet_validation_error():
         ]
 
 
+@pytest.mark.parametrize(("alphabet", "value"), [
+    ("^]-\\", "]^\\--"),
+    ("a-z", "a-z-"),
+    ("\n.", ".\n."),
+    ("абв", "вба"),
+])
+def test_str_alphabet_special_letters_validation(alphabet: str, value: str):
+    with when:
+        result = validate(schema.str.alphabet(alphabet), value)
+
+    with then:
+        assert result.get_errors() == []
+
+
+@pytest.mark.parametrize(("alphabet", "value"), [
+    ("^]-\\", "]^\\-a"),
+    ("a-z", "b"),
+    (".", "\n"),
+    ("абв", "абг"),
+])
+def test_str_alphabet_special_letters_validation_error(alphabet: str, value: str):
+    with when:
+        result = validate(schema.str.alphabet(alphabet), value)
+
+    with then:
+        assert result.get_errors() == [
+            AlphabetValidationError(PathHolder(), value, alphabet)
+        ]
+
+
 def test_str_len_alphabet_validation_error():
     with given:
         value = "banana"